@@ -16,6 +16,7 @@ class Curve:
             TypeError("The points needs to be defined using the class app.point.Point")
 
         self.points = points
+        self._bounding_box = None
 
     def get_pos(self, t_param):
         """
@@ -41,6 +42,46 @@ class Curve:
     def length(self):
         """Returns the toatal arc-lengt of the curve"""
 
+    def set_lut_tolerance(self, tolerance):
+        """
+        Sets the max error (in the units of the curve) of the look-up table used by
+        get_t. Curves without a look-up table ignore it.
+        """
+
+    def reversed(self):
+        """
+        Returns a new curve with the same shape that goes from the end position
+        to the start position
+        """
+        return type(self)(self.points[::-1])
+
+    @property
+    def bounding_box(self):
+        """
+        Returns the smallest axis aligned box containing the curve as a tuple
+        (min_position, max_position). It is calculated the first time it is used.
+        """
+        if self._bounding_box is None:
+            positions = [self.get_start_pos(), self.get_end_pos()]
+            for t_param in self.get_extrema_t_params():
+                if 0 < t_param < 1:
+                    positions.append(self.get_pos(t_param))
+
+            self._bounding_box = (
+                Point(min(p.x for p in positions), min(p.y for p in positions)),
+                Point(max(p.x for p in positions), max(p.y for p in positions)),
+            )
+
+        return self._bounding_box
+
+    def get_extrema_t_params(self):
+        """
+        Returns the t values where the x or y value of the position has a local
+        extremum (where the x or y value of the velocity is zero).
+        Values outside of (0, 1) are ignored by bounding_box.
+        """
+        return []
+
     def get_curvature(self, t_param):
         """
         Returns the curvature of the curve at a given t value [0, 1]
@@ -53,6 +94,55 @@ class Curve:
 
         return (vel.x * acc.y - vel.y * acc.x) / ((vel.x ** 2 + vel.y ** 2) ** (3 / 2))
 
+    # Batch evaluation (numpy). The numpy imports are kept inside the methods,
+    # as numpy is not available on the robot.
+
+    def get_pos_many(self, t_params):
+        """
+        Returns the positions at an array of t values [0, 1] as an (N, 2) numpy array.
+        Subclasses override this with a vectorized version.
+        """
+        return self._evaluate_many(self.get_pos, t_params)
+
+    def get_vel_many(self, t_params):
+        """
+        Returns the velocities at an array of t values [0, 1] as an (N, 2) numpy array.
+        Subclasses override this with a vectorized version.
+        """
+        return self._evaluate_many(self.get_vel, t_params)
+
+    def get_acc_many(self, t_params):
+        """
+        Returns the accelerations at an array of t values [0, 1] as an (N, 2) numpy array.
+        Subclasses override this with a vectorized version.
+        """
+        return self._evaluate_many(self.get_acc, t_params)
+
+    def get_curvature_many(self, t_params):
+        """
+        Returns the curvatures at an array of t values [0, 1] as an (N,) numpy array.
+        The curvature is nan where the velocity is zero.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        vel = self.get_vel_many(t_params)
+        acc = self.get_acc_many(t_params)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (vel[:, 0] * acc[:, 1] - vel[:, 1] * acc[:, 0]) / (
+                (vel[:, 0] ** 2 + vel[:, 1] ** 2) ** 1.5
+            )
+
+    @staticmethod
+    def _evaluate_many(function, t_params):
+        """Calls a function returning a Point for every t value and returns an (N, 2) array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        points = [function(t_param) for t_param in np.asarray(t_params, dtype=float)]
+        return np.array([(point.x, point.y) for point in points], dtype=float).reshape(
+            -1, 2
+        )
+
     def get_start_pos(self):
         """Returns the start position of the curve"""
         return self.points[0]
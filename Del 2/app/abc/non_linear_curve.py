@@ -1,6 +1,8 @@
 """Contains the abstract class NonLinearCurve"""
 import math
 from app.abc import Curve
+from app.lut import LookUpTable
+from app.utils.quadrature import adaptive_gauss_legendre
 
 
 class NonLinearCurve(Curve):
@@ -9,27 +11,76 @@ class NonLinearCurve(Curve):
     from traversed distance to the t value of a given point on the curve.
     """
 
-    def __init__(self, points, number_of_entries=100, generate_lut=True):
+    # Number of panels used when integrating the speed of the curve to find its length,
+    # and the max error of the length relative to the length. Panels are split where
+    # needed (ex: near a cusp), so the look-up tables can be scaled to the length
+    QUADRATURE_PANELS = 4
+    LENGTH_TOLERANCE = 1e-7
+
+    def __init__(
+        self, points, number_of_entries=100, generate_lut=False, lut_tolerance=None
+    ):
         """
-        Creates a Curve and generates a look-up table (LUT) for the curve based
-        on an arbitrary list of points.
+        Creates a Curve based on an arbitrary list of points.
+
+        The look-up table (LUT) of the curve is generated the first time it is used
+        (by get_t or length), unless generate_lut is set to True.
+
+        If lut_tolerance is given, the look-up table is adaptive (see
+        generate_adaptive_lut). Otherwise it has number_of_entries evenly spaced t values.
         """
         super().__init__(points)
+        self.number_of_entries = number_of_entries
+        self.lut_tolerance = lut_tolerance
+
+        self._length = None
+        self._look_up_table = None
         if generate_lut:
-            self.look_up_table = self.generate_lut(number_of_entries)
+            self._look_up_table = self._generate_lut()
+
+    @property
+    def look_up_table(self):
+        """The look-up table of the curve. Generated and cached on first access"""
+        if self._look_up_table is None:
+            self._look_up_table = self._generate_lut()
+
+        return self._look_up_table
+
+    def set_lut_tolerance(self, tolerance):
+        """
+        Sets the max error (in the units of the curve) of the adaptive look-up table.
+        The look-up table is generated again if the tolerance changed.
+        """
+        if tolerance != self.lut_tolerance:
+            self.lut_tolerance = tolerance
+            self._look_up_table = None
+
+    def _generate_lut(self):
+        """
+        Generates the look-up table of the curve based on its settings.
+        The lengths in the table are scaled to end at the exact length of the curve.
+        """
+        if self.lut_tolerance is None:
+            look_up_table = self.generate_lut(self.number_of_entries)
+        else:
+            look_up_table = self.generate_adaptive_lut(self.lut_tolerance)
+
+        if look_up_table.total_length > 0:
+            look_up_table.scale_to(self.length())
+
+        return look_up_table
 
     def generate_lut(self, number_of_entries):
         """Generates a look-up table to convert from distance to t values [0, 1]"""
 
-        # Initiates a new dict as an empty look-up table
-        look_up_table = {}
+        look_up_table = LookUpTable()
 
         # Samples of t in the interval <0, 1]
         delta = 1 / number_of_entries
         t_params = (i * delta for i in range(1, number_of_entries + 1))
 
         traversed_length = 0
-        look_up_table[traversed_length] = 0
+        look_up_table.append(traversed_length, 0)
 
         last = self.get_pos(0)  # pylint: disable=assignment-from-no-return
         for t_param in t_params:
@@ -41,51 +92,105 @@ class NonLinearCurve(Curve):
 
             last = current
             traversed_length += step_length
-            look_up_table[traversed_length] = t_param
+            look_up_table.append(traversed_length, t_param)
+
+        return look_up_table
+
+    def generate_adaptive_lut(  # pylint: disable=too-many-locals
+        self, tolerance, min_depth=2, max_depth=16
+    ):
+        """
+        Generates a look-up table to convert from distance to t values [0, 1]
+        with entries only where they are needed.
+
+        An interval of t values is split in two as long as the position in the middle
+        of it is further than tolerance from the middle of the chord between its ends,
+        or the positions at a quarter, half and three quarters of it are not near that
+        part of its length (the table assumes the speed is constant in an interval).
+        Straight and evenly parameterized parts of a curve therefore get few entries,
+        while tight bends and changes of speed get many. Every interval is split at
+        least min_depth times and at most max_depth times.
+        """
+        traversed_length = 0
+        look_up_table = LookUpTable()
+        look_up_table.append(traversed_length, 0)
+
+        # Intervals (t_start, start, t_end, end, mid, depth) that are not handled yet,
+        # mid is None if it is not known yet. The next interval along the curve is
+        # always the last one.
+        intervals = [(0, self.get_pos(0), 1, self.get_pos(1), None, 0)]
+        while intervals:
+            t_start, start, t_end, end, mid, depth = intervals.pop()
+
+            t_mid = (t_start + t_end) / 2
+            if mid is None:
+                mid = self.get_pos(t_mid)  # pylint: disable=assignment-from-no-return
+
+            # Estimates of the error are the distance from the middle of the chord to
+            # the curve, and how far the quarters of the t values are from the quarters
+            # of the length. They are only sampled at a few points, so they are kept
+            # below half of the tolerance to leave room for larger errors elsewhere.
+            # The quarters are only needed when the interval is flat enough.
+            if depth < max_depth and (
+                depth < min_depth or abs(mid - (start + end) * 0.5) > tolerance / 2
+            ):
+                intervals.append((t_mid, mid, t_end, end, None, depth + 1))
+                intervals.append((t_start, start, t_mid, mid, None, depth + 1))
+                continue
+
+            # pylint: disable=assignment-from-no-return
+            first_quarter = self.get_pos((t_start + t_mid) / 2)
+            last_quarter = self.get_pos((t_mid + t_end) / 2)
+            # pylint: enable=assignment-from-no-return
+            quarters = (
+                abs(first_quarter - start),
+                abs(mid - first_quarter),
+                abs(last_quarter - mid),
+                abs(end - last_quarter),
+            )
+            quarter_chords = sum(quarters)
+            uneven = max(
+                abs(quarters[0] - quarter_chords / 4),
+                abs(quarters[0] + quarters[1] - quarter_chords / 2),
+                abs(quarters[3] - quarter_chords / 4),
+            )
+            if depth < max_depth and uneven > tolerance / 2:
+                intervals.append((t_mid, mid, t_end, end, last_quarter, depth + 1))
+                intervals.append((t_start, start, t_mid, mid, first_quarter, depth + 1))
+                continue
+
+            # The length of the interval is extrapolated from the half chords and the
+            # quarter chords (Richardson extrapolation), as chords alone undershoot
+            half_chords = abs(mid - start) + abs(end - mid)
+            traversed_length += quarter_chords + (quarter_chords - half_chords) / 3
+            look_up_table.append(traversed_length, t_end)
 
         return look_up_table
 
     def get_t(self, traversed_length):
         """Finds a t given a an arc-length L"""
-        if traversed_length < 0 or self.length() <= traversed_length:
+        look_up_table = self.look_up_table
+        if traversed_length < 0 or look_up_table.total_length <= traversed_length:
             raise ValueError("L needs to greater than 0 and under the total arc-length")
 
-        # Max and min traversed length
-        min_length, max_length = self.bin_search_lut(traversed_length)
+        return look_up_table.get_t(traversed_length)
 
-        # Max and min t_param
-        min_t, max_t = self.look_up_table[min_length], self.look_up_table[max_length]
+    def length(self):
+        """Returns the toatal arc-lengt of the curve. Calculated once and cached"""
+        if self._length is None:
+            self._length = self.arc_length()
 
-        ratio = (traversed_length - min_length) / (min_length - max_length)
-        return (max_t - min_t) * ratio + min_t
+        return self._length
 
-    def bin_search_lut(self, traversed_length):
+    def arc_length(self):
         """
-        Returns an two values. The first one is the lower bound of the value from
-        the look-up table (inclusive), and the other one is the upper bound (exclusive)
+        Calculates the arc-length of the curve by integrating its speed (the length of
+        the velocity) with adaptive Gauss-Legendre quadrature.
         """
-        keys = list(self.look_up_table.keys())
-
-        # Min and max index
-        min_i, max_i = 0, len(keys) - 1
-
-        # Min and max value
-        min_v, max_v = 0, keys[max_i]
-
-        while True:
-            mid_i = (min_i + max_i) // 2
-            mid_v = keys[mid_i]
-
-            if traversed_length < mid_v:
-                max_i = mid_i
-                max_v = mid_v
-            else:
-                min_i = mid_i
-                min_v = mid_v
-
-            if min_i + 1 == max_i:
-                return min_v, max_v
-
-    def length(self):
-        """Returns the toatal arc-lengt of the curve"""
-        return list(self.look_up_table.keys())[-1]
+        return adaptive_gauss_legendre(
+            lambda t_param: abs(self.get_vel(t_param)),
+            0,
+            1,
+            self.LENGTH_TOLERANCE,
+            panels=self.QUADRATURE_PANELS,
+        )
@@ -13,7 +13,7 @@ class Arc(NonLinearCurve):
         large_arc,
         sweep,
         rotation=0,
-        generate_lut=True,
+        generate_lut=False,
     ):
         """Defines an arc based on the parameters passed
 
@@ -24,8 +24,9 @@ class Arc(NonLinearCurve):
         :param large_arc: Specifies if the desired arc is the large one
         :param sweep: Specified the desired sweep direcion (read the svg docs for more info)
         :param rotation: rotation of the elipse i relation to a unrotated coordinate system
-        :param generae_lup: Speciies if generating a look-up table is desired. This is
-                            necesery to derive a t value from distance traveled.
+        :param generate_lut: Generates the look-up table right away. Otherwise it is
+                             generated the first time a t value is derived from
+                             distance traveled.
         """
         self.large_arc = large_arc
         self.sweep = sweep
@@ -102,6 +103,95 @@ class Arc(NonLinearCurve):
 
         return point
 
+    def reversed(self):
+        """
+        Returns a new arc with the same shape that goes from the end position
+        to the start position (the sweep direction is flipped)
+        """
+        return Arc(
+            self.points[::-1],
+            self.large_arc,
+            not self.sweep,
+            -math.degrees(self.rotation),
+        )
+
+    def get_extrema_t_params(self):
+        """
+        Returns the t values where the x or y value of the velocity is zero.
+        These are the angles where the (rotated) elipse is furthest to the left,
+        right, top or bottom, repeated every half turn.
+        """
+        if self._angle_delta == 0:
+            return []
+
+        cos, sin = math.cos(self.rotation), math.sin(self.rotation)
+        angles = (
+            math.atan2(-self.radii.y * sin, self.radii.x * cos),
+            math.atan2(self.radii.y * cos, self.radii.x * sin),
+        )
+
+        low = min(self._start_angle, self._start_angle + self._angle_delta)
+        high = max(self._start_angle, self._start_angle + self._angle_delta)
+
+        t_params = []
+        for angle in angles:
+            turn = math.ceil((low - angle) / math.pi)
+            while angle + turn * math.pi <= high:
+                t_params.append(
+                    (angle + turn * math.pi - self._start_angle) / self._angle_delta
+                )
+                turn += 1
+
+        return t_params
+
+    def get_pos_many(self, t_params):
+        """Returns the positions at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        angles = self._start_angle + np.asarray(t_params, dtype=float) * self._angle_delta
+        points = np.column_stack(
+            (self.radii.x * np.cos(angles), self.radii.y * np.sin(angles))
+        )
+        return self._rotated_many(points) + (self.center.x, self.center.y)
+
+    def get_vel_many(self, t_params):
+        """Returns the velocities at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        angles = self._start_angle + np.asarray(t_params, dtype=float) * self._angle_delta
+        points = self._angle_delta * np.column_stack(
+            (-self.radii.x * np.sin(angles), self.radii.y * np.cos(angles))
+        )
+        return self._rotated_many(points)
+
+    def get_acc_many(self, t_params):
+        """Returns the accelerations at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        angles = self._start_angle + np.asarray(t_params, dtype=float) * self._angle_delta
+        points = -self._angle_delta ** 2 * np.column_stack(
+            (self.radii.x * np.cos(angles), self.radii.y * np.sin(angles))
+        )
+        return self._rotated_many(points)
+
+    def _rotated_many(self, points):
+        """Rotates an (N, 2) array of points by the rotation of the arc (see Point.rotated)"""
+        if not self.rotation:
+            return points
+
+        cos, sin = math.cos(self.rotation), math.sin(self.rotation)
+        return points @ ((cos, sin), (-sin, cos))
+
+    def arc_length(self):
+        """
+        Returns the arc-length of the arc. Circular arcs use the closed form,
+        while elliptical arcs are integrated numerically.
+        """
+        if abs(self.radii.x - self.radii.y) <= 1e-9 * max(self.radii.x, self.radii.y):
+            return abs(self.radii.x * self._angle_delta)
+
+        return super().arc_length()
+
     @staticmethod
     def calc_helper(start_pos, end_pos, rotation):
         """
@@ -1,11 +1,13 @@
 """Contains the CubicCurve class"""
+import math
+
 from app.abc import NonLinearCurve
 
 
 class CubicCurve(NonLinearCurve):
     """A curve used to represent a cubic Bézier Curve"""
 
-    def __init__(self, points, generate_lut=True):
+    def __init__(self, points, generate_lut=False):
         """
         Creates a cubic Bézier Curve based on four absolute points.
         """
@@ -48,3 +50,72 @@ class CubicCurve(NonLinearCurve):
         where 0 is the start of the curve and 1 is the end of the curve.
         """
         return 6 * t_param * self.compound_point_a + 6 * self.compound_point_b
+
+    def get_extrema_t_params(self):
+        """
+        Returns the t values where the x or y value of the velocity is zero.
+        The velocity is a quadratic polynomial in t, so there are at most two per axis.
+        """
+        t_params = []
+        for point_a, point_b, point_c in (
+            (self.compound_point_a.x, self.compound_point_b.x, self.compound_point_c.x),
+            (self.compound_point_a.y, self.compound_point_b.y, self.compound_point_c.y),
+        ):
+            # Roots of a*t^2 + 2*b*t + c
+            if abs(point_a) <= 1e-12 * (abs(point_b) + abs(point_c)):
+                if point_b != 0:
+                    t_params.append(-point_c / (2 * point_b))
+                continue
+
+            discriminant = point_b ** 2 - point_a * point_c
+            if discriminant < 0:
+                continue
+
+            root = math.sqrt(discriminant)
+            t_params.append((-point_b + root) / point_a)
+            t_params.append((-point_b - root) / point_a)
+
+        return t_params
+
+    def _compound_arrays(self):
+        """Returns the compound points as numpy arrays of shape (1, 2)"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return [
+            np.array([[point.x, point.y]], dtype=float)
+            for point in (
+                self.compound_point_a,
+                self.compound_point_b,
+                self.compound_point_c,
+                self.compound_point_d,
+            )
+        ]
+
+    def get_pos_many(self, t_params):
+        """Returns the positions at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        point_a, point_b, point_c, point_d = self._compound_arrays()
+        return (
+            t_params ** 3 * point_a
+            + 3 * t_params ** 2 * point_b
+            + 3 * t_params * point_c
+            + point_d
+        )
+
+    def get_vel_many(self, t_params):
+        """Returns the velocities at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        point_a, point_b, point_c, _ = self._compound_arrays()
+        return 3 * t_params ** 2 * point_a + 6 * t_params * point_b + 3 * point_c
+
+    def get_acc_many(self, t_params):
+        """Returns the accelerations at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        point_a, point_b, _, _ = self._compound_arrays()
+        return 6 * t_params * point_a + 6 * point_b
@@ -53,3 +53,30 @@ class Line(LinearCurve):
         Since this is a straight line, the curvature is always 0
         """
         return 0
+
+    def get_pos_many(self, t_params):
+        """Returns the positions at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        start, end = self.points
+        return (1 - t_params) * (start.x, start.y) + t_params * (end.x, end.y)
+
+    def get_vel_many(self, t_params):
+        """Returns the velocities at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        vel = self.get_vel()
+        return np.tile((vel.x, vel.y), (len(t_params), 1)).astype(float)
+
+    def get_acc_many(self, t_params):
+        """Returns the accelerations at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.zeros((len(t_params), 2))
+
+    def get_curvature_many(self, t_params):
+        """Returns the curvatures at an array of t values [0, 1] (always 0 for a line)"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.zeros(len(t_params))
@@ -1,4 +1,6 @@
 """Contais the QuadraticCurve class"""
+import math
+
 from app.abc import NonLinearCurve
 from app.point.point import Point
 
@@ -6,7 +8,7 @@ from app.point.point import Point
 class QuadraticCurve(NonLinearCurve):
     """Used to represent a quadratic Bézier Curve"""
 
-    def __init__(self, points, generate_lut=True):
+    def __init__(self, points, generate_lut=False):
         """
         Creates a quadratic Bézier Curve based on three absolute points.
         """
@@ -39,14 +41,97 @@ class QuadraticCurve(NonLinearCurve):
         """
         return Point(
             self.compund_point_a.x * (2 * t_param)
-            - self.compund_point_b.x * (-2 * (1 - t_param)),
+            - self.compund_point_b.x * (2 * (1 - t_param)),
             self.compund_point_a.y * (2 * t_param)
-            - self.compund_point_b.y * (-2 * (1 - t_param)),
+            - self.compund_point_b.y * (2 * (1 - t_param)),
         )
 
+    def get_extrema_t_params(self):
+        """
+        Returns the t values where the x or y value of the velocity is zero.
+        The velocity is linear in t, so there is at most one per axis.
+        """
+        t_params = []
+        for point_a, point_b in (
+            (self.compund_point_a.x, self.compund_point_b.x),
+            (self.compund_point_a.y, self.compund_point_b.y),
+        ):
+            if point_a + point_b != 0:
+                t_params.append(point_b / (point_a + point_b))
+
+        return t_params
+
     def get_acc(self, t_param=None):  # pylint: disable=unused-argument
         """
         Returns the acceleration at a given t value [0, 1] (the second order derivative)
         where 0 is the start of the curve and 1 is the end of the curve.
         """
         return (self.compund_point_a + self.compund_point_b) * 2
+
+    def get_pos_many(self, t_params):
+        """Returns the positions at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        point_a, point_b = self.compund_point_a, self.compund_point_b
+        return (
+            (self.points[1].x, self.points[1].y)
+            + (point_a.x, point_a.y) * t_params ** 2
+            + (point_b.x, point_b.y) * (1 - t_params) ** 2
+        )
+
+    def get_vel_many(self, t_params):
+        """Returns the velocities at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        t_params = np.asarray(t_params, dtype=float)[:, None]
+        point_a, point_b = self.compund_point_a, self.compund_point_b
+        return (point_a.x, point_a.y) * (2 * t_params) - (point_b.x, point_b.y) * (
+            2 * (1 - t_params)
+        )
+
+    def get_acc_many(self, t_params):
+        """Returns the accelerations at an array of t values [0, 1] as an (N, 2) numpy array"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        acc = self.get_acc()
+        return np.tile((acc.x, acc.y), (len(t_params), 1)).astype(float)
+
+    def arc_length(self):
+        """Returns the arc-length of the curve, calculated with the closed form integral"""
+        # The velocity is 2 * (vel_a + t * vel_b)
+        vel_a = -self.compund_point_b
+        vel_b = self.compund_point_a + self.compund_point_b
+
+        # The squared speed / 4 is coef_a * t^2 + 2 * coef_b * t + coef_c
+        coef_a = vel_b.x ** 2 + vel_b.y ** 2
+        coef_b = vel_a.x * vel_b.x + vel_a.y * vel_b.y
+        coef_c = vel_a.x ** 2 + vel_a.y ** 2
+
+        # Constant velocity (a straight line)
+        if coef_a <= 1e-12 * coef_c:
+            return 2 * math.sqrt(coef_c)
+
+        # The integral of sqrt(s^2 + h) ds, where s = t + coef_b / coef_a
+        h_param = max(coef_a * coef_c - coef_b ** 2, 0) / coef_a ** 2
+        start = coef_b / coef_a
+
+        return math.sqrt(coef_a) * (
+            self._antiderivative(start + 1, h_param)
+            - self._antiderivative(start, h_param)
+        )
+
+    @staticmethod
+    def _antiderivative(s_param, h_param):
+        """Returns s * sqrt(s^2 + h) + h * ln(s + sqrt(s^2 + h)) (twice the integral)"""
+        root = math.sqrt(s_param ** 2 + h_param)
+        if h_param == 0:
+            return s_param * root
+
+        # Avoids cancellation when s is negative
+        if s_param < 0:
+            log = math.log(h_param / (root - s_param))
+        else:
+            log = math.log(s_param + root)
+
+        return s_param * root + h_param * log
@@ -0,0 +1,2 @@
+"""Look-up tables used to convert from traversed distance to t values"""
+from app.lut.look_up_table import LookUpTable
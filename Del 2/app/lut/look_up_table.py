@@ -0,0 +1,91 @@
+"""Contains the LookUpTable class"""
+from array import array
+
+
+def _bisect_right(values, value):
+    """Returns the index of the first of the sorted values greater than value"""
+    low, high = 0, len(values)
+    while low < high:
+        mid = (low + high) // 2
+        if value < values[mid]:
+            high = mid
+        else:
+            low = mid + 1
+
+    return low
+
+
+try:
+    from bisect import bisect_right
+except ImportError:  # micropython does not have bisect
+    bisect_right = _bisect_right
+
+
+try:
+    array("d")
+    TYPECODE = "d"
+except ValueError:  # micropython built without double precision floats
+    TYPECODE = "f"
+
+
+class LookUpTable:
+    """
+    A look-up table (LUT) used to convert from the traversed length of a curve
+    to a t value [0, 1].
+
+    The entries are kept in two parallel arrays (lengths and t values) sorted by length,
+    so the table is compact and looking up a t value does not allocate anything.
+    """
+
+    __slots__ = ("lengths", "t_params", "total_length")
+
+    def __init__(self):
+        """Creates an empty look-up table"""
+        self.lengths = array(TYPECODE)
+        self.t_params = array(TYPECODE)
+        self.total_length = 0
+
+    def append(self, traversed_length, t_param):
+        """
+        Adds an entry at the end of the table.
+        The traversed length can not be shorter than the one of the last entry.
+        """
+        self.lengths.append(traversed_length)
+        self.t_params.append(t_param)
+        self.total_length = traversed_length
+
+    def scale_to(self, total_length):
+        """Scales the lengths of all the entries so that the table ends at total_length"""
+        factor = total_length / self.total_length
+        lengths = self.lengths
+        for i in range(len(lengths)):  # pylint: disable=consider-using-enumerate
+            lengths[i] *= factor
+
+        self.total_length = total_length
+
+    def search(self, traversed_length):
+        """
+        Returns the index of the last entry with a length shorter than or equal to
+        traversed_length (0 if there are none), using a binary search.
+        """
+        return max(bisect_right(self.lengths, traversed_length) - 1, 0)
+
+    def get_t(self, traversed_length):
+        """
+        Returns the t value at a traversed length by interpolating between the entries.
+        Lengths outside of the table give the t value of the first or last entry.
+        """
+        lengths, t_params = self.lengths, self.t_params
+
+        high = bisect_right(lengths, traversed_length)
+        if high == len(lengths):
+            return t_params[high - 1]
+        if high == 0:
+            return t_params[0]
+
+        low = high - 1
+        ratio = (traversed_length - lengths[low]) / (lengths[high] - lengths[low])
+        return (t_params[high] - t_params[low]) * ratio + t_params[low]
+
+    def __len__(self):
+        return len(self.lengths)
@@ -0,0 +1,2 @@
+"""Planning of how the robot drives through a drawing"""
+from app.planning.travel import optimize_travel, travel_distance
@@ -0,0 +1,152 @@
+"""
+Functions used to plan how the robot drives through curves.
+
+A curve is turned into a schedule of speeds and turn rates ahead of time, so the
+drive loop only has to compare the driven distance with the next threshold, instead
+of searching the look-up table and calculating the curvature on every iteration.
+"""
+import math
+from array import array
+
+from app.lut.look_up_table import TYPECODE
+
+# Distance (in mm on the paper) between the points the turn rate is calculated at
+STEP = 2
+
+# Consecutive parts of a schedule with turn rates (in deg/s) closer than this
+# are merged into one part
+RATE_TOLERANCE = 0.5
+
+
+class TurnRateSchedule:
+    """
+    A piecewise constant speed (in mm/s) and turn rate (in deg/s) along a curve.
+
+    speeds[i] and turn_rates[i] are used from the driven distance distances[i]
+    (in mm) until the next distance. length is the total distance to drive.
+    """
+
+    __slots__ = ("distances", "speeds", "turn_rates", "length")
+
+    def __init__(self, length):
+        self.distances = array(TYPECODE)
+        self.speeds = array(TYPECODE)
+        self.turn_rates = array(TYPECODE)
+        self.length = length
+
+    def append(self, distance, speed, turn_rate):
+        """Adds a part of the schedule starting at distance"""
+        self.distances.append(distance)
+        self.speeds.append(speed)
+        self.turn_rates.append(turn_rate)
+
+    def __len__(self):
+        return len(self.distances)
+
+    def parts(self):
+        """Yields the start and end distance, speed and turn rate of every part"""
+        last = len(self.distances) - 1
+        for i in range(last + 1):
+            end = self.length if i == last else self.distances[i + 1]
+            yield self.distances[i], end, self.speeds[i], self.turn_rates[i]
+
+    def get_index(self, distance):
+        """Returns the index of the part used at a driven distance"""
+        index = 0
+        while index + 1 < len(self.distances) and self.distances[index + 1] <= distance:
+            index += 1
+
+        return index
+
+    def get_speed(self, distance):
+        """Returns the speed used at a driven distance"""
+        return self.speeds[self.get_index(distance)]
+
+    def get_turn_rate(self, distance):
+        """Returns the turn rate used at a driven distance"""
+        return self.turn_rates[self.get_index(distance)]
+
+
+def plan_curve(curve, scale, speed, step=STEP, rate_tolerance=RATE_TOLERANCE):
+    """
+    Returns the TurnRateSchedule used to drive through a curve at a speed (in mm/s),
+    where scale converts from the coordinates of the curve to mm.
+
+    The curve is split into parts of step mm. The turn rate of a part is the change
+    in angle over the part divided by the time it takes to drive it, so the robot
+    points in the direction of the curve at the end of every part.
+    """
+    length = curve.length() * scale
+    schedule = TurnRateSchedule(length)
+    if length == 0:
+        return schedule
+
+    steps = max(int(math.ceil(length / step)), 1)
+
+    start_distance = 0
+    start_angle = curve.get_start_angle()
+    for i in range(1, steps + 1):
+        distance = min(i * step, length)
+        if distance < length:
+            angle = curve.get_angle(curve.get_t(distance / scale))
+        else:
+            angle = curve.get_end_angle()
+
+        delta_angle = (angle - start_angle + math.pi) % (2 * math.pi) - math.pi
+        turn_rate = math.degrees(delta_angle) * speed / (distance - start_distance)
+
+        _add_part(schedule, start_distance, distance, speed, turn_rate, rate_tolerance)
+        start_distance = distance
+        start_angle = angle
+
+    return schedule
+
+
+def _add_part(  # pylint: disable=too-many-arguments
+    schedule, start, end, speed, turn_rate, rate_tolerance
+):
+    """
+    Adds a part to the schedule, or merges it with the previous part if the speeds
+    are the same and the turn rates are close enough. The merged part turns the same
+    total angle.
+    """
+    if (
+        len(schedule) != 0
+        and schedule.speeds[-1] == speed
+        and abs(schedule.turn_rates[-1] - turn_rate) < rate_tolerance
+    ):
+        previous_start = schedule.distances[-1]
+        schedule.turn_rates[-1] = (
+            schedule.turn_rates[-1] * (start - previous_start)
+            + turn_rate * (end - start)
+        ) / (end - previous_start)
+        return
+
+    schedule.append(start, speed, turn_rate)
+
+
+def plan_path(path, scale, speed, step=STEP, rate_tolerance=RATE_TOLERANCE):
+    """Returns a list of TurnRateSchedules, one for every curve in the path"""
+    return [plan_curve(curve, scale, speed, step, rate_tolerance) for curve in path]
+
+
+def join_schedules(schedules, rate_tolerance=RATE_TOLERANCE):
+    """
+    Returns a TurnRateSchedule that follows the schedules one after another,
+    used to drive through several curves without stopping.
+    """
+    result = TurnRateSchedule(0)
+    for schedule in schedules:
+        for start, end, speed, turn_rate in schedule.parts():
+            _add_part(
+                result,
+                result.length + start,
+                result.length + end,
+                speed,
+                turn_rate,
+                rate_tolerance,
+            )
+
+        result.length += schedule.length
+
+    return result
@@ -0,0 +1,321 @@
+"""
+Functions used to plan the order the paths of a drawing are drawn in.
+
+Between two paths the robot lifts the pen and drives straight to the start of the
+next path. The paths are reordered (and reversed, if allowed) to make these pen-up
+moves as short as possible:
+
+1. A nearest neighbour tour is built, using a grid to find the closest path end.
+2. The tour is improved with 2-opt moves (reversing a part of the tour) and
+   Or-opt moves (moving 1-3 consecutive paths to another place in the tour).
+
+The improvements only move paths within WINDOW positions of each other, so the time
+it takes grows linearly with the number of paths.
+"""
+import math
+
+from app.point import Point
+
+# Number of positions in the tour that the improvements move paths within
+WINDOW = 25
+
+# Max number of times the improvements run through the tour
+MAX_PASSES = 4
+
+# Improvements smaller than this (in the units of the paths) are ignored
+MIN_GAIN = 1e-9
+
+
+def travel_distance(paths, start_position=Point(0, 0)):
+    """
+    Returns the distance driven with the pen lifted when the paths are drawn in order,
+    starting at start_position.
+    """
+    distance = 0
+    position = start_position
+    for path in paths:
+        distance += abs(path.start_position - position)
+        position = path.end_position
+
+    return distance
+
+
+def optimize_travel(paths, start_position=Point(0, 0), allow_reverse=True):
+    """
+    Returns a list of the paths in the order that minimizes the pen-up travel
+    starting at start_position.
+
+    If allow_reverse is True, paths can be reversed (see Path.reversed) to start
+    at the end that is closest.
+    """
+    paths = list(paths)
+    if len(paths) < 2:
+        return paths
+
+    tour = _Tour(paths, start_position)
+    tour.nearest_neighbour(allow_reverse)
+
+    for _ in range(MAX_PASSES):
+        improved = False
+        if allow_reverse:
+            improved = tour.two_opt() or improved
+
+        improved = tour.or_opt(allow_reverse) or improved
+        if not improved:
+            break
+
+    return [
+        paths[index].reversed() if flipped else paths[index]
+        for index, flipped in zip(tour.order, tour.flipped)
+    ]
+
+
+class _Tour:
+    """
+    The order the paths are drawn in. order[k] is the index of the k-th path and
+    flipped[k] is True if it is drawn in reverse.
+    """
+
+    def __init__(self, paths, start_position):
+        self.start = (start_position.x, start_position.y)
+        self.starts = [(path.start_position.x, path.start_position.y) for path in paths]
+        self.ends = [(path.end_position.x, path.end_position.y) for path in paths]
+        self.order = list(range(len(paths)))
+        self.flipped = [False] * len(paths)
+
+    def head(self, k):
+        """Returns the position where the k-th path starts (None after the last path)"""
+        if k >= len(self.order):
+            return None
+
+        index = self.order[k]
+        return self.ends[index] if self.flipped[k] else self.starts[index]
+
+    def tail(self, k):
+        """Returns the position where the k-th path ends (the start before the first)"""
+        if k < 0:
+            return self.start
+
+        index = self.order[k]
+        return self.starts[index] if self.flipped[k] else self.ends[index]
+
+    def nearest_neighbour(self, allow_reverse):
+        """Builds the tour by always going to the closest path that is not drawn yet"""
+        grid = _Grid(self.starts + self.ends if allow_reverse else self.starts)
+        count = len(self.starts)
+
+        order = []
+        flipped = []
+        position = self.start
+        for _ in range(count):
+            point = grid.pop_nearest(position)
+            index = point % count
+
+            # Removes the other end of the path
+            if allow_reverse:
+                grid.remove(index + count if point < count else index)
+
+            order.append(index)
+            flipped.append(point >= count)
+            position = self.ends[index] if point < count else self.starts[index]
+
+        self.order = order
+        self.flipped = flipped
+
+    def two_opt(self):
+        """
+        Reverses parts of the tour (and flips the paths in them) where it makes the
+        tour shorter. Returns True if the tour was improved.
+        """
+        improved = False
+        count = len(self.order)
+        for i in range(count):
+            before = self.tail(i - 1)
+            first = self.head(i)
+            for j in range(i, min(i + WINDOW, count)):
+                after = self.head(j + 1)
+                last = self.tail(j)
+                gain = (
+                    _distance(before, first)
+                    + _distance(last, after)
+                    - _distance(before, last)
+                    - _distance(first, after)
+                )
+
+                if gain > MIN_GAIN:
+                    self.reverse(i, j)
+                    first = self.head(i)
+                    improved = True
+
+        return improved
+
+    def or_opt(self, allow_reverse):
+        """
+        Moves parts of 1-3 paths to other places in the tour where it makes the tour
+        shorter. Returns True if the tour was improved.
+        """
+        improved = False
+        for length in (1, 2, 3):
+            i = 0
+            while i + length <= len(self.order):
+                if self._move_segment(i, length, allow_reverse):
+                    improved = True
+                i += 1
+
+        return improved
+
+    def _move_segment(  # pylint: disable=too-many-locals
+        self, i, length, allow_reverse
+    ):
+        """Moves the paths i to i + length - 1 to the best place within the window"""
+        j = i + length - 1
+        before, first, last, after = (
+            self.tail(i - 1),
+            self.head(i),
+            self.tail(j),
+            self.head(j + 1),
+        )
+        removal_gain = (
+            _distance(before, first) + _distance(last, after) - _distance(before, after)
+        )
+        if removal_gain <= MIN_GAIN:
+            return False
+
+        best = None
+        best_gain = MIN_GAIN
+        count = len(self.order)
+        # The segment is placed between the paths k - 1 and k
+        for k in range(max(i - WINDOW, 0), min(j + WINDOW, count) + 1):
+            if i <= k <= j + 1:
+                continue
+
+            previous, following = self.tail(k - 1), self.head(k)
+            removed = _distance(previous, following)
+            gain = removal_gain - (
+                _distance(previous, first) + _distance(last, following) - removed
+            )
+            if gain > best_gain:
+                best, best_gain = (k, False), gain
+
+            if allow_reverse:
+                gain = removal_gain - (
+                    _distance(previous, last) + _distance(first, following) - removed
+                )
+                if gain > best_gain:
+                    best, best_gain = (k, True), gain
+
+        if best is None:
+            return False
+
+        k, reverse = best
+        order = self.order[i : j + 1]
+        flipped = self.flipped[i : j + 1]
+        if reverse:
+            order.reverse()
+            flipped = [not flip for flip in flipped[::-1]]
+
+        del self.order[i : j + 1]
+        del self.flipped[i : j + 1]
+        if k > j:
+            k -= length
+
+        self.order[k:k] = order
+        self.flipped[k:k] = flipped
+        return True
+
+    def reverse(self, i, j):
+        """Reverses the paths i to j (inclusive) of the tour and flips them"""
+        self.order[i : j + 1] = self.order[i : j + 1][::-1]
+        self.flipped[i : j + 1] = [not flip for flip in self.flipped[i : j + 1][::-1]]
+
+
+class _Grid:
+    """
+    A uniform grid used to find the closest of a set of points.
+    Points are identified by their index in the list they were created from.
+    """
+
+    def __init__(self, points):
+        self.points = points
+        self.removed = [False] * len(points)
+
+        min_x = min(x for x, _ in points)
+        min_y = min(y for _, y in points)
+        max_x = max(x for x, _ in points)
+        max_y = max(y for _, y in points)
+
+        # About one point per cell
+        self.cell_size = max(max_x - min_x, max_y - min_y) / math.sqrt(len(points))
+        if self.cell_size == 0:
+            self.cell_size = 1
+
+        self.origin = (min_x, min_y)
+        self.columns = int((max_x - min_x) / self.cell_size) + 1
+        self.rows = int((max_y - min_y) / self.cell_size) + 1
+
+        self.cells = {}
+        for index, point in enumerate(points):
+            self.cells.setdefault(self._cell(point), []).append(index)
+
+    def _cell(self, point):
+        return (
+            int((point[0] - self.origin[0]) / self.cell_size),
+            int((point[1] - self.origin[1]) / self.cell_size),
+        )
+
+    def remove(self, index):
+        """Removes a point from the grid"""
+        self.removed[index] = True
+
+    def pop_nearest(self, position):
+        """Removes and returns the index of the point closest to position"""
+        column, row = self._cell(position)
+        max_ring = max(
+            abs(column) + self.columns,
+            abs(row) + self.rows,
+        )
+
+        best = None
+        best_distance = math.inf
+        for ring in range(max_ring + 1):
+            # Every point further out is at least this far away
+            if best_distance <= (ring - 1) * self.cell_size:
+                break
+
+            for cell in _ring_cells(column, row, ring):
+                indices = self.cells.get(cell)
+                if not indices:
+                    continue
+
+                # Drops removed points while going through the cell
+                indices[:] = [index for index in indices if not self.removed[index]]
+                for index in indices:
+                    distance = _distance(position, self.points[index])
+                    if distance < best_distance:
+                        best, best_distance = index, distance
+
+        self.removed[best] = True
+        return best
+
+
+def _ring_cells(column, row, ring):
+    """Yields the cells at a Chebyshev distance of ring cells from a cell"""
+    if ring == 0:
+        yield column, row
+        return
+
+    for i in range(-ring, ring + 1):
+        yield column + i, row - ring
+        yield column + i, row + ring
+
+    for i in range(-ring + 1, ring):
+        yield column - ring, row + i
+        yield column + ring, row + i
+
+
+def _distance(point1, point2):
+    """Returns the distance between two positions, or 0 if one of them is None"""
+    if point1 is None or point2 is None:
+        return 0
+
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
@@ -0,0 +1,99 @@
+"""
+Functions used to plan the speed of the robot along a schedule
+(see app.planning.motion).
+
+The speed is limited by the curvature (the lateral acceleration in curves), and by
+the acceleration and jerk when speeding up and slowing down. The speed profile is
+found with a forward pass (speeding up from the start) and a backward pass (slowing
+down before tight curves and the end).
+"""
+import math
+
+from app.planning.motion import TurnRateSchedule
+
+# Max length (in mm on the paper) of the parts the speed is planned for
+PROFILE_STEP = 5
+
+
+def plan_velocity(  # pylint: disable=too-many-arguments, too-many-locals
+    schedule,
+    max_speed,
+    min_speed,
+    acceleration,
+    lateral_acceleration,
+    jerk,
+    step=PROFILE_STEP,
+):
+    """
+    Returns a new schedule that drives through the same curves as schedule with
+    a speed profile. The turn rates are scaled with the speeds, so the robot turns
+    the same angle over every part.
+
+    --Params--
+    :param max_speed: The max speed (mm/s), used where the path is straight.
+    :param min_speed: The speed (mm/s) at the start and end of the schedule, and
+                      the lowest speed used anywhere.
+    :param acceleration: The max acceleration and deceleration (mm/s^2).
+    :param lateral_acceleration: The max acceleration (mm/s^2) towards the center of
+                                 a curve, which limits the speed to
+                                 sqrt(lateral_acceleration * radius).
+    :param jerk: The max rate of change of the acceleration (mm/s^3). Speeding up
+                 from a low speed v, the acceleration is at most sqrt(2 * jerk * v),
+                 like when the acceleration ramps up from zero.
+    """
+    if schedule.length == 0:
+        return schedule
+
+    # Splits the schedule into parts of at most step mm with the curvature (deg/mm)
+    starts = []
+    lengths = []
+    curvatures = []
+    for start, end, speed, turn_rate in schedule.parts():
+        count = max(int(math.ceil((end - start) / step)), 1)
+        for i in range(count):
+            starts.append(start + (end - start) * i / count)
+            lengths.append((end - start) / count)
+            curvatures.append(turn_rate / speed)
+
+    # Speed limit of the curvature (lateral acceleration = speed^2 * curvature)
+    speeds = []
+    for curvature in curvatures:
+        curvature = abs(math.radians(curvature))
+        limit = max_speed
+        if curvature != 0:
+            limit = min(limit, math.sqrt(lateral_acceleration / curvature))
+        speeds.append(max(limit, min_speed))
+
+    def reachable(speed, length):
+        """The highest speed that can be reached from speed over length mm"""
+        max_acceleration = min(acceleration, math.sqrt(2 * jerk * speed))
+        return math.sqrt(speed ** 2 + 2 * max_acceleration * length)
+
+    # Forward pass: speeds up from min_speed at the start
+    speeds[0] = min(speeds[0], min_speed)
+    for i in range(1, len(speeds)):
+        speeds[i] = min(speeds[i], reachable(speeds[i - 1], lengths[i - 1]))
+
+    # Backward pass: slows down to min_speed at the end
+    following = min_speed
+    for i in range(len(speeds) - 1, -1, -1):
+        speeds[i] = max(min(speeds[i], reachable(following, lengths[i])), min_speed)
+        following = speeds[i]
+
+    result = TurnRateSchedule(schedule.length)
+    for i, start in enumerate(starts):
+        if (
+            i != 0
+            and speeds[i] == speeds[i - 1]
+            and curvatures[i] == curvatures[i - 1]
+        ):
+            continue
+
+        result.append(start, speeds[i], curvatures[i] * speeds[i])
+
+    return result
+
+
+def driving_time(schedule):
+    """Returns the time (in seconds) it takes to drive through a schedule"""
+    return sum((end - start) / speed for start, end, speed, _ in schedule.parts())
@@ -59,7 +59,10 @@ class Point:
     def angle_between(point1, point2):
         """Returns the angle between two vectors from origo to the given points"""
         dot_prod = point1.x * point2.x + point1.y * point2.y
-        angle = math.acos(dot_prod / (point1.length() * point2.length()))
+        cos = dot_prod / (point1.length() * point2.length())
+
+        # Rounding errors can put opposite vectors slightly outside of [-1, 1]
+        angle = math.acos(max(-1, min(1, cos)))
 
         # Account for the positions of the point
         if point1.y * point2.x > point1.x * point2.y:
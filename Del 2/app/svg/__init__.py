@@ -1,2 +1,4 @@
 """All classes related to svg parsing and interpertation"""
 from app.svg.path import Path
+from app.svg.packed_path import PackedPath
+from app.svg.drawing import Drawing
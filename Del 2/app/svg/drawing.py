@@ -0,0 +1,96 @@
+"""Contains the Drawing class"""
+from app.point import Point
+from app.svg.path import merge_bounding_boxes
+
+
+class Drawing:
+    """
+    Represents a parsed svg file (a list of paths) together with aggregates over
+    the paths. The aggregates are updated when a path is appended, so they only
+    have to be computed once.
+
+    A drawing can be used like the list of paths returned by parse_svg.
+    """
+
+    def __init__(self, paths=(), name=None):
+        """
+        Creates a new drawing from an iterable of paths.
+        name is the name of the file the drawing was parsed from.
+        """
+        self.name = name
+        self.paths = []
+        self.segment_count = 0
+        self._bounding_box = None
+        self._length = None
+
+        for path in paths:
+            self.append(path)
+
+    def append(self, path):
+        """Appends a path to the drawing and updates the aggregates"""
+        self.paths.append(path)
+        self.segment_count += len(path)
+        self._length = None
+
+        if len(path) != 0:
+            self._bounding_box = merge_bounding_boxes(
+                self._bounding_box, path.bounding_box
+            )
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        return self.paths[index]
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    @property
+    def path_count(self):
+        """Returns the number of paths in the drawing"""
+        return len(self.paths)
+
+    @property
+    def bounding_box(self):
+        """
+        Returns the smallest axis aligned box containing every path as a tuple
+        (min_position, max_position)
+        """
+        if self._bounding_box is None:
+            return Point(0, 0), Point(0, 0)
+
+        return self._bounding_box
+
+    @property
+    def min_position(self):
+        """Retuns a point with the min x and y value"""
+        return self.bounding_box[0]
+
+    @property
+    def max_position(self):
+        """Returns a point with the max x and y value"""
+        return self.bounding_box[1]
+
+    @property
+    def size(self):
+        """Returns the width and height of the drawing as a point"""
+        return self.max_position - self.min_position
+
+    def length(self):
+        """Returns the total length of every path (calculated once)"""
+        if self._length is None:
+            self._length = sum(path.length() for path in self.paths)
+
+        return self._length
+
+    def scale_for(self, target_size):
+        """
+        Returns the scale needed for the largest side of the drawing
+        to be target_size long.
+        """
+        size = self.size
+        if max(size.x, size.y) == 0:
+            raise ValueError("The drawing has no size and can not be scaled")
+
+        return target_size / max(size.x, size.y)
@@ -0,0 +1,268 @@
+"""Contains the PackedPath class"""
+import math
+from array import array
+
+from app.abc import Curve
+from app.arc import Arc
+from app.curves import Line, QuadraticCurve, CubicCurve
+from app.lut.look_up_table import TYPECODE
+from app.point import Point
+from app.svg.path import Path
+from app.utils.curves import bezier_range
+
+# Kinds of curves stored in a packed path
+LINE = 0
+QUADRATIC = 1
+CUBIC = 2
+ARC = 3
+
+_BEZIER_CLASSES = (Line, QuadraticCurve, CubicCurve)
+
+
+class PackedPath:
+    """
+    Represents a path (see app.svg.path.Path) stored in contiguous typed arrays.
+
+    A Path keeps a python object for every curve and point in it, which adds up for
+    drawings with a lot of curves. A packed path only stores the kind of every curve,
+    the offset to its numbers and the numbers themselves. Curves share their start
+    position with the end position of the previous curve, so the numbers of a curve
+    are its points after the start position, or
+    [rx, ry, rotation, large_arc, sweep, end_x, end_y] for an arc. The end position
+    of every curve is therefore the last two numbers of the curve.
+
+    Curve objects are only created when the path is indexed or iterated. The bounding
+    box of the path is kept as [min_x, min_y, max_x, max_y] in bounds.
+    """
+
+    __slots__ = ("kinds", "offsets", "coords", "bounds")
+
+    def __init__(self, start_position=Point(0, 0)):
+        """Creates a new empty packed path starting at start_position"""
+        if not isinstance(start_position, Point):
+            raise TypeError("Start position must be a Point")
+
+        self.kinds = array("B")
+        self.offsets = array("I")
+        self.coords = array(TYPECODE, (start_position.x, start_position.y))
+        self.bounds = array(TYPECODE)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        """Returns a new curve object for the curve at the index"""
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("Path index out of range")
+
+        return self._make_curve(index)
+
+    def __iter__(self):
+        for i in range(len(self.kinds)):
+            yield self._make_curve(i)
+
+    def _point(self, offset):
+        return Point(self.coords[offset], self.coords[offset + 1])
+
+    def _make_curve(self, index):
+        kind = self.kinds[index]
+        offset = self.offsets[index]
+        start = self._point(offset - 2)
+
+        if kind == ARC:
+            coords = self.coords
+            return Arc(
+                [
+                    start,
+                    Point(coords[offset], coords[offset + 1]),
+                    self._point(offset + 5),
+                ],
+                large_arc=coords[offset + 3],
+                sweep=coords[offset + 4],
+                rotation=coords[offset + 2],
+            )
+
+        points = [start] + [self._point(offset + 2 * i) for i in range(kind + 1)]
+        return _BEZIER_CLASSES[kind](points)
+
+    def _append(self, kind, numbers):
+        coords = self.coords
+        offset = len(coords)
+        self.kinds.append(kind)
+        self.offsets.append(offset)
+        coords.extend(numbers)
+
+        if kind == ARC:
+            # The extrema of an arc depend on its center, which the Arc calculates
+            min_pos, max_pos = self._make_curve(len(self.kinds) - 1).bounding_box
+            min_x, min_y, max_x, max_y = min_pos.x, min_pos.y, max_pos.x, max_pos.y
+        else:
+            end = offset + 2 * kind + 2
+            min_x, max_x = bezier_range(coords[offset - 2 : end : 2])
+            min_y, max_y = bezier_range(coords[offset - 1 : end : 2])
+
+        bounds = self.bounds
+        if len(bounds) == 0:
+            bounds.extend((min_x, min_y, max_x, max_y))
+            return
+
+        bounds[0] = min(bounds[0], min_x)
+        bounds[1] = min(bounds[1], min_y)
+        bounds[2] = max(bounds[2], max_x)
+        bounds[3] = max(bounds[3], max_y)
+
+    def append(self, curve):
+        """
+        Appends curve at the end of path.
+
+        The curve needs to start at the end position of the path, since the start
+        position of a curve is not stored.
+        """
+        if not isinstance(curve, Curve):
+            raise TypeError("Appended item must be a curve")
+
+        if curve.get_start_pos() != self.end_position:
+            raise ValueError("The curve needs to start at the end of the path")
+
+        if isinstance(curve, Arc):
+            self.append_arc(
+                curve.points,
+                curve.large_arc,
+                curve.sweep,
+                -math.degrees(curve.rotation),
+            )
+            return
+
+        self.append_curve(curve.points[1:])
+
+    def append_curve(self, points, relative=False):
+        """
+        Appends a new bezier curve based on the current endpoint
+        and a list of control points.
+
+        If relative is set to True, the points are interpreted relative to the
+        current endpoint.
+        """
+        if not 1 <= len(points) <= 3:
+            raise ValueError(
+                "The number of points needs to be higher than one and less than 5"
+            )
+
+        if relative:
+            points = Curve.convert_rel_points_to_abs_points(self.end_position, points)[
+                1:
+            ]
+
+        numbers = []
+        for point in points:
+            numbers.append(point.x)
+            numbers.append(point.y)
+
+        self._append(len(points) - 1, numbers)
+
+    def append_arc(self, points, large_arc, sweep, rotation=0):
+        """
+        Appends an eliptic arc. The parameters are the same as for app.arc.Arc, but
+        the start point (points[0]) is always the current endpoint.
+        """
+        if len(points) != 3:
+            raise ValueError(
+                "The number of points given must equal 3 [start_pos, radii, end_pos]"
+            )
+
+        radii, end_pos = points[1], points[2]
+        self._append(
+            ARC,
+            (radii.x, radii.y, rotation, large_arc, sweep, end_pos.x, end_pos.y),
+        )
+
+    def last_curve_points(self):
+        """
+        Returns the points of the last curve if it is a bezier curve,
+        otherwise None
+        """
+        if len(self.kinds) == 0 or self.kinds[-1] == ARC:
+            return None
+
+        offset = self.offsets[-1]
+        return [self._point(offset + 2 * i) for i in range(-1, self.kinds[-1] + 1)]
+
+    def reversed(self):
+        """Returns a new path that goes through the reversed curves in reverse order"""
+        return self.from_curves_list(
+            [curve.reversed() for curve in list(self)[::-1]], self.end_position
+        )
+
+    def length(self):
+        """Returns the total length of the path"""
+        return sum(map(lambda s: s.length(), self))
+
+    @property
+    def start_position(self):
+        """Returns the start postition of the path"""
+        return self._point(0)
+
+    @property
+    def start_angle(self):
+        """Returns the start angle of the path"""
+        return self[0].get_start_angle()
+
+    @property
+    def end_position(self):
+        """Returns the end position of the path"""
+        return self._point(len(self.coords) - 2)
+
+    @property
+    def end_angle(self):
+        """Returns the end angle of the path"""
+        return self[-1].get_end_angle()
+
+    @property
+    def bounding_box(self):
+        """
+        Returns the smallest axis aligned box containing every curve of the path as
+        a tuple (min_position, max_position). It is updated when curves are appended.
+        """
+        if len(self.bounds) == 0:
+            return self.start_position, self.start_position
+
+        return Point(self.bounds[0], self.bounds[1]), Point(
+            self.bounds[2], self.bounds[3]
+        )
+
+    @property
+    def min_position(self):
+        """Retuns a point with the min x and y value"""
+        return self.bounding_box[0]
+
+    @property
+    def max_position(self):
+        """Returns a point with the max x and y value"""
+        return self.bounding_box[1]
+
+    def to_path(self):
+        """Returns the path as a Path of curve objects"""
+        path = Path(self.start_position)
+        for curve in self:
+            path.append(curve)
+
+        return path
+
+    @classmethod
+    def from_path(cls, path):
+        """Returns a packed path with the same curves as path"""
+        return cls.from_curves_list(path, path.start_position)
+
+    @classmethod
+    def from_curves_list(cls, curves, start_position=None):
+        """Returns a packed path based on a list of connected curves"""
+        if start_position is None:
+            start_position = curves[0].get_start_pos() if curves else Point(0, 0)
+
+        result = cls(start_position)
+        for curve in curves:
+            result.append(curve)
+
+        return result
@@ -1,65 +1,283 @@
 """functions related to parsing a .svg file"""
 import re
+from array import array
 
-from app.abc import Curve
-from app.arc.arc import Arc
 from app.point import Point
-from app.svg import Path
+from app.svg import Drawing, Path
 
+# Number of characters read from an svg file at a time
+CHUNK_SIZE = 1 << 12
 
-def parse_svg(svg_file_name):
-    """Parses an svg file and returns a list of paths in the svg"""
-    instructions, inputs = _commands_from_svg(svg_file_name)
-    if len(instructions) == 0:
-        return [Path()]
+_DATA_ATTRIBUTE = 'd="'
 
-    return _commands_to_paths(instructions, inputs)
+# A token in path data is either a number or a single (non separator) character
+_TOKEN_PATTERN = r"[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?|[^\s,]"
+_SEPARATORS = " ,\t\n\r\f"
+_DIGITS = "0123456789"
+_COMMAND_LETTERS = "MmZzLlHhVvCcSsQqTtAa"
+_NUMBER_START = "+-." + _DIGITS
 
 
-def _commands_from_svg(svg_file_name):
+def parse_svg(svg_file_name, path_class=Path):
     """
-    Returns a list of instructions and a list of inputs form an svg file.
+    Parses an svg file and returns a list of paths in the svg.
 
-    Ex: ['M', '16-0.034', 'C', '7.1-0-0.03,7.1-0.03,16',
-    'S', '7.1,32.03,16,32.03']
+    path_class can be set to app.svg.PackedPath to store large drawings compactly.
+    """
+    paths = list(iter_svg_paths(svg_file_name, path_class))
+    if len(paths) == 0:
+        return [path_class()]
+
+    return paths
+
+
+def parse_drawing(svg_file_name, path_class=Path):
+    """
+    Parses an svg file and returns it as a Drawing.
+
+    The aggregates of the drawing (bounding box, number of segments, ...) are
+    computed while the paths are parsed.
+    """
+    drawing = Drawing(name=svg_file_name)
+    for path in iter_svg_paths(svg_file_name, path_class):
+        drawing.append(path)
+
+    if len(drawing) == 0:
+        drawing.append(path_class())
+
+    return drawing
+
+
+def iter_svg_paths(svg_file_name, path_class=Path):
+    """
+    Parses an svg file and yields the paths (instances of path_class)
+    in the svg one at a time.
+
+    The file is read incrementally, so the memory used while reading does not
+    grow with the size of the file.
+    """
+    for path_data in _iter_path_data(svg_file_name):
+        commands, offsets, numbers = _lex_path_data(path_data)
+        if len(commands) == 0:
+            continue
+
+        yield from _commands_to_paths(commands, offsets, numbers, path_class)
+
+
+def _iter_path_data(svg_file_name, chunk_size=CHUNK_SIZE):
+    """
+    Yields the data (the d attribute) of every path element in an svg file.
+
+    The file is read in chunks of chunk_size characters, and only the part of the
+    file that has not been handled yet is kept in memory.
     """
     with open(svg_file_name, "r", encoding="utf-8") as file:
-        text = file.read().replace("\n", "")
+        buffer = ""
+        start = 0
 
-    # match paths
-    regex = r"(?<=\bd=\").*?(?=\")"
-    matches = re.findall(regex, text)
+        # The parts of the d attribute currently being read (None if outside of one)
+        parts = None
 
-    # Slits at every command-letter (command-letter is retained)
-    paths = []
+        chunk = file.read(chunk_size)
+        while chunk:
+            buffer += chunk
+
+            while True:
+                if parts is None:
+                    index = _find_data_attribute(buffer, start)
+                    if index == -1:
+                        # The attribute (and the character in front of it) might be
+                        # split between two chunks. The first character that is kept
+                        # has already been searched, so the next search skips it.
+                        keep = max(start - 1, len(buffer) - len(_DATA_ATTRIBUTE), 0)
+                        buffer = buffer[keep:]
+                        start = min(len(buffer), 1)
+                        break
+
+                    parts = []
+                    start = index + len(_DATA_ATTRIBUTE)
 
-    # Separates the data based on instructions.
-    # Lower case means relative instructions, while uppercase means absolute
-    # [M, m, Z, z]: Move to and close path
-    # [C, c, S, s]: Cubic bezier curves
-    # [Q, q, T, t]: Quadratic bezier curves
-    # [L, l, H, h, V, v]: Lines
-    # [A, a]: Eliptical arcs
-    # https://www.w3.org/TR/SVG/paths.html#PathData
-    for match in matches:
-        paths.append(re.split("([cCsSqQtTlLaAvVhHmMzZ])", match))
+                end = buffer.find('"', start)
+                if end == -1:
+                    parts.append(buffer[start:])
+                    buffer = ""
+                    start = 0
+                    break
 
-    # Removes first element of every list of command chain (path) (it's empty)
-    # Removes whitespace from command
-    # Flattens the list
-    flat = [cmd.strip() for path in paths for cmd in path[1:]]
+                parts.append(buffer[start:end])
+                yield "".join(parts).replace("\n", " ")
 
-    # Splits into instructions and inputs
-    instructions = list(flat[::2])
-    inputs = list(flat[1::2])
-    return instructions, inputs
+                parts = None
+                start = end + 1
+
+            chunk = file.read(chunk_size)
+
+
+def _find_data_attribute(text, start):
+    """
+    Returns the index of the first d attribute (d=") in text from start,
+    or -1 if there are none. Attributes ending with d (ex: id=") are ignored.
+    """
+    index = text.find(_DATA_ATTRIBUTE, start)
+    while index > 0:
+        previous = text[index - 1]
+        if not (previous.isalpha() or previous.isdigit() or previous == "_"):
+            break
+
+        index = text.find(_DATA_ATTRIBUTE, index + 1)
+
+    return index
+
+
+def _lex_path_data(path_data):
+    """
+    Turns the data of a path into a stream of command letters and a flat buffer
+    with the inputs of all the commands in a single pass.
+
+    Returns the command letters (str), the index in the buffer of the first input of
+    every command (with the length of the buffer appended at the end) and the buffer
+    (array of floats). The inputs of command i are numbers[offsets[i]:offsets[i + 1]].
+
+    Ex: 'M16-0.034C7.1.5' -> 'MC', [0, 2, 4], array('d', [16, -0.034, 7.1, 0.5])
+    """
+    # Most files separate every number and command letter with whitespace or commas,
+    # which makes str.split enough to find the tokens.
+    # Compact data (ex: 16-0.034 or 7.1.5) fails and is tokenized properly instead.
+    if _splittable(path_data):
+        try:
+            return _lex_tokens(path_data.replace(",", " ").split())
+        except ValueError:
+            pass
+
+    return _lex_tokens(_tokenize(path_data))
+
+
+def _splittable(path_data):
+    """
+    Returns False if path data might contain numbers that float() accepts, but the
+    svg number grammar does not. They all have an underscore (1_000), an n (inf,
+    nan and infinity in any case) or digits that are not ascii.
+    """
+    if "_" in path_data or "n" in path_data or "N" in path_data:
+        return False
+
+    try:
+        return path_data.isascii()
+    except AttributeError:  # micropython's float() only accepts ascii digits
+        return True
+
+
+def _lex_tokens(tokens):
+    """
+    Turns tokens (command letters and numbers) into command letters, offsets and
+    a buffer of inputs (see _lex_path_data). Raises ValueError for invalid tokens.
+    """
+    commands = []
+    offsets = []
+    numbers = array("d")
+
+    # Arc flags (the 4th and 5th input) are a single digit and
+    # might not be separated from the next input (ex: a1,1 0 00.5,.5)
+    arc = False
+
+    for token in tokens:
+        char = token[0]
+
+        # Command letter
+        if char.isalpha():
+            if len(token) > 1 or char not in _COMMAND_LETTERS:
+                raise ValueError("Unexpected path data ['{}']".format(token))
+
+            commands.append(char)
+            offsets.append(len(numbers))
+            arc = char in "aA"
+            continue
+
+        if len(offsets) == 0:
+            raise ValueError("Path data needs to start with a command")
+
+        if char not in _NUMBER_START:
+            raise ValueError("Unexpected path data ['{}']".format(token))
+
+        if arc:
+            while len(token) > 1 and (len(numbers) - offsets[-1]) % 7 in (3, 4):
+                numbers.append(float(token[0]))
+                token = token[1:]
+
+        numbers.append(float(token))
+
+    offsets.append(len(numbers))
+    return "".join(commands), offsets, numbers
+
+
+def _scan_tokens(path_data):
+    """
+    Splits path data into the same tokens as _TOKEN_PATTERN (numbers and single
+    characters) using a state machine. Used where re has no findall (micropython).
+    """
+    tokens = []
+    i, end = 0, len(path_data)
+
+    while i < end:
+        char = path_data[i]
+        if char in _SEPARATORS:
+            i += 1
+            continue
+
+        start = i
+        if char in "+-":
+            i += 1
+
+        # Integer part
+        digits = i
+        while i < end and path_data[i] in _DIGITS:
+            i += 1
+        integer = i > digits
+
+        # Fraction part
+        if i < end and path_data[i] == ".":
+            fraction = i + 1
+            while fraction < end and path_data[fraction] in _DIGITS:
+                fraction += 1
+
+            if integer or fraction > i + 1:
+                i = fraction
+
+        # Not a number, the character is a token by itself
+        if i == digits:
+            tokens.append(char)
+            i = start + 1
+            continue
+
+        # Exponent
+        if i < end and path_data[i] in "eE":
+            exponent = i + 1
+            if exponent < end and path_data[exponent] in "+-":
+                exponent += 1
+
+            if exponent < end and path_data[exponent] in _DIGITS:
+                i = exponent
+                while i < end and path_data[i] in _DIGITS:
+                    i += 1
+
+        tokens.append(path_data[start:i])
+
+    return tokens
+
+
+# micropython's re does not have findall (AttributeError) and raises ValueError
+# for the syntax it does not support, ex: (?:...)
+try:
+    _tokenize = re.compile(_TOKEN_PATTERN).findall
+except (AttributeError, ValueError):
+    _tokenize = _scan_tokens
 
 
 def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
-    instuctions, inputs
+    commands, offsets, numbers, path_class=Path
 ):
     # assert that the first instruction is a moveto
-    if instuctions[0].lower() != "m":
+    if commands[0].lower() != "m":
         raise ValueError("The first instruction needs to be a moveto")
 
     movement = {
@@ -73,20 +291,17 @@ def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
         "l": extract_points(1),
         "s": extract_smooth_points(2),
         "t": extract_smooth_points(1),
+        "h": extract_line_points(0),
+        "v": extract_line_points(1),
         "a": extract_arc_data,
     }
 
-    not_implemented = {
-        "h",
-        "v",
-    }
-
-    path = Path()
+    path = path_class()
     paths = []
-    for command, raw_input in zip(instuctions, inputs):
+    for i, command in enumerate(commands):
         cmd_letter = command.lower()
         relative = cmd_letter == command
-        inp = _parse_command_input(raw_input)
+        inp = numbers[offsets[i] : offsets[i + 1]]
 
         if cmd_letter in movement:
             # Close path
@@ -98,6 +313,8 @@ def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
             # Move to
             elif cmd_letter == "m":
                 start_point = Point(inp[0], -inp[1])
+                if relative:
+                    start_point += path.end_position
                 # implicit lineto
                 if len(inp) > 2:
                     cmd_letter = "l"
@@ -107,7 +324,7 @@ def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
                 paths.append(path)
 
             # Starts new subpath
-            path = Path(start_point)
+            path = path_class(start_point)
 
             # No implicit lineto
             if cmd_letter in movement:
@@ -120,7 +337,7 @@ def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
             # Eliptic arc
             if cmd_letter == "a":
                 for data in points_gen(inp, path, relative):
-                    path.append(Arc(*data))
+                    path.append_arc(*data)
                 continue
 
             # Bezier
@@ -129,12 +346,6 @@ def _commands_to_paths(  # pylint: disable=too-many-locals, too-many-branches
 
             continue
 
-        # Not implemented
-        if cmd_letter in not_implemented:
-            raise NotImplementedError(
-                "Instruction not implemented ['{}']".format(command)
-            )
-
         # Not recognized
         raise ValueError("Instruction not recognized ['{}']".format(command))
 
@@ -188,6 +399,35 @@ def extract_points(number_of_points):
     return generator
 
 
+def extract_line_points(axis):
+    """
+    Returns a generator for the end points of horizontal (axis 0) or vertical
+    (axis 1) lines, where every input is one coordinate of an end point and the
+    other coordinate is the same as the start of the line.
+    """
+
+    def generator(inp, path, relative):
+        """
+        Returns the end point of every line (as a list with one point).
+
+        --Params--
+        :param inp: A list of input numbers, one for every line.
+        :param path: The current path that the lines edventually get appended to
+        :param relative: Bool variable to signify that the inputs are meant to be
+                         interpereted relatively.
+        """
+        position = path.end_position
+        for value in inp:
+            if axis == 0:
+                position = Point(value + position.x if relative else value, position.y)
+            else:
+                position = Point(position.x, -value + (position.y if relative else 0))
+
+            yield [position]
+
+    return generator
+
+
 def extract_smooth_points(number_of_points):
     """
     Returns a generator for the points needed to construct a bezier curve.
@@ -219,18 +459,18 @@ def extract_smooth_points(number_of_points):
         start = path.end_position
 
         # Last curve was not a bezier curve of the same order as this one
-        if number_of_points != len(path[-1].points) - 2 or not isinstance(
-            path[-1], Curve
-        ):
+        last_points = path.last_curve_points()
+        if last_points is None or number_of_points != len(last_points) - 2:
             ctr_point = start
         else:
-            ctr_point = 2 * start - path[-1].points[2]
+            ctr_point = 2 * start - last_points[-2]
 
         for exp_points in explicit_points_generator:
-            yield [ctr_point] + exp_points
+            points = [ctr_point] + exp_points
+            yield points
 
             # Updates the control point
-            ctr_point = 2 * exp_points[-1] - exp_points[-2]
+            ctr_point = 2 * points[-1] - points[-2]
 
     return generator
 
@@ -258,15 +498,3 @@ def extract_arc_data(inp, path, relative):
         yield points, large_arc, sweep, rotation
 
         start_pos = end_pos
-
-
-def _parse_command_input(command_input):
-    """Parses command inputs and returns a list of floats"""
-    # Finds a number
-    pattern = r"\-?\.?(?:(?:(?<=\.)\d+(?:e\d+)?)|(?:(?<!\.)\d+(?:\.?\d+(?:e\-?\d+)?)?))" # wtf?
-    result = re.findall(pattern, command_input)
-
-    if len(result) == 0:
-        return []
-
-    return [float(num) for num in result]
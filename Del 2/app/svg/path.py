@@ -1,9 +1,24 @@
 """Contains the Path class"""
 from app.abc import Curve
+from app.arc.arc import Arc
 from app.point.point import Point
 from app.utils.curves import make_curve
 
 
+def merge_bounding_boxes(box, other):
+    """
+    Returns the smallest bounding box (min_position, max_position) containing
+    two bounding boxes. A box that is None is ignored.
+    """
+    if box is None:
+        return other
+
+    return (
+        Point(min(box[0].x, other[0].x), min(box[0].y, other[0].y)),
+        Point(max(box[1].x, other[1].x), max(box[1].y, other[1].y)),
+    )
+
+
 class Path(list):
     """Represents a path (list of curves)"""
 
@@ -16,15 +31,59 @@ class Path(list):
             raise TypeError("Start position must be a Point")
 
         self._start_pos = start_position
+        self._bounding_box = None
         super().__init__()
 
     def append(self, curve):
-        """Appends curve at the end of path"""
+        """Appends curve at the end of path and updates the bounding box"""
         if not isinstance(curve, Curve):
             raise TypeError("Appended item must be a curve")
 
+        # The box is only kept up to date while it is valid (see bounding_box)
+        if self._bounding_box is not None or len(self) == 0:
+            self._bounding_box = merge_bounding_boxes(
+                self._bounding_box, curve.bounding_box
+            )
         super().append(curve)
 
+    # Other changes to the curves make the bounding box be computed again when needed
+
+    def extend(self, curves):
+        super().extend(curves)
+        self._bounding_box = None
+
+    def insert(self, index, curve):
+        super().insert(index, curve)
+        self._bounding_box = None
+
+    def pop(self, index=-1):
+        self._bounding_box = None
+        return super().pop(index)
+
+    def remove(self, curve):
+        super().remove(curve)
+        self._bounding_box = None
+
+    def clear(self):
+        super().clear()
+        self._bounding_box = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._bounding_box = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._bounding_box = None
+
+    def __iadd__(self, curves):
+        self._bounding_box = None
+        return super().__iadd__(curves)
+
+    def __imul__(self, count):
+        self._bounding_box = None
+        return super().__imul__(count)
+
     def append_curve(self, points, relative=False):
         """
         Appends a new curve based on the current endpoint
@@ -36,6 +95,31 @@ class Path(list):
         curve = make_curve([self.end_position] + points, relative=relative)
         self.append(curve)
 
+    def append_arc(self, points, large_arc, sweep, rotation=0):
+        """
+        Appends an eliptic arc. The parameters are the same as for app.arc.Arc, but
+        the start point (points[0]) is always the current endpoint.
+        """
+        self.append(Arc([self.end_position] + points[1:], large_arc, sweep, rotation))
+
+    def last_curve_points(self):
+        """
+        Returns the points of the last curve if it is a bezier curve,
+        otherwise None
+        """
+        if len(self) == 0 or isinstance(self[-1], Arc):
+            return None
+
+        return self[-1].points
+
+    def reversed(self):
+        """Returns a new path that goes through the reversed curves in reverse order"""
+        result = type(self)(self.end_position)
+        for curve in self[::-1]:
+            result.append(curve.reversed())
+
+        return result
+
     def length(self):
         """Returns the total length of the path"""
         return sum(map(lambda s: s.length(), self))
@@ -66,19 +150,33 @@ class Path(list):
         """Returns the end angle of the path"""
         return self[-1].get_end_angle()
 
+    @property
+    def bounding_box(self):
+        """
+        Returns the smallest axis aligned box containing every curve of the path as
+        a tuple (min_position, max_position). It is updated when curves are appended,
+        and computed again from the curves after other changes.
+        """
+        if len(self) == 0:
+            return self.start_position, self.start_position
+
+        if self._bounding_box is None:
+            for curve in self:
+                self._bounding_box = merge_bounding_boxes(
+                    self._bounding_box, curve.bounding_box
+                )
+
+        return self._bounding_box
+
     @property
     def min_position(self):
         """Retuns a point with the min x and y value"""
-        min_x = min(point.x for curve in self for point in curve.points)
-        min_y = min(point.y for curve in self for point in curve.points)
-        return Point(min_x, min_y)
+        return self.bounding_box[0]
 
     @property
     def max_position(self):
         """Returns a point with the max x and y value"""
-        max_x = max(point.x for curve in self for point in curve.points)
-        max_y = max(point.y for curve in self for point in curve.points)
-        return Point(max_x, max_y)
+        return self.bounding_box[1]
 
     @classmethod
     def from_curves_list(cls, curves):
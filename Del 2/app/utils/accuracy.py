@@ -0,0 +1,211 @@
+"""
+Utility functions used to measure how closely a trace (the positions the pen
+was at) follows the paths of a drawing
+"""
+import math
+
+import numpy as np
+
+# Max distance (in mm) between the positions the paths are sampled at
+SPACING = 0.25
+
+# Max number of points in the leaves of a KDTree
+LEAF_SIZE = 16
+
+
+def sample_paths(paths, scale=1, spacing=SPACING):
+    """
+    Returns the positions (an (N, 2) numpy array, in mm) along every curve of the
+    paths and the index of the path of every position (an (N,) numpy array).
+
+    scale converts from the coordinates of the paths to mm. The curves are
+    sampled at evenly spaced t values, at least length / spacing of them.
+    """
+    positions = []
+    indices = []
+    for index, path in enumerate(paths):
+        for curve in path:
+            count = max(int(math.ceil(2 * curve.length() * scale / spacing)), 1) + 1
+            points = np.asarray(curve.get_pos_many(np.linspace(0, 1, count)))
+            positions.append(points * scale)
+            indices.append(np.full(len(points), index))
+
+    if not positions:
+        return np.empty((0, 2)), np.empty(0, dtype=int)
+
+    return np.concatenate(positions), np.concatenate(indices)
+
+
+class KDTree:
+    """
+    A balanced k-d tree over a set of points, used to find the nearest point of the
+    set for many query points at once.
+
+    The points are sorted so every node of the tree is a range of them, and the
+    nodes of a level split the points evenly. Every query point is searched in all
+    nodes closer than the nearest point found so far, one level at a time for all
+    query points together.
+    """
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        self.points = np.asarray(points, dtype=float).reshape(-1, 2)
+        count = len(self.points)
+        if count == 0:
+            raise ValueError("Can not build a KDTree without points")
+
+        self.depth = 0
+        if count > leaf_size:
+            self.depth = int(math.ceil(math.log2(count / leaf_size)))
+
+        # Sorts the points of every node along the axis it is split on
+        self.order = np.arange(count)
+        for level in range(self.depth):
+            bounds = self._bounds(level)
+            nodes = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+            points = self.points[self.order]
+            sizes = np.maximum.reduceat(points, bounds[:-1]) - np.minimum.reduceat(
+                points, bounds[:-1]
+            )
+            values = points[np.arange(count), np.argmax(sizes, axis=1)[nodes]]
+            self.order = self.order[np.lexsort((values, nodes))]
+
+        # Bounding boxes of the nodes of every level
+        points = self.points[self.order]
+        self.mins = []
+        self.maxs = []
+        for level in range(self.depth + 1):
+            starts = self._bounds(level)[:-1]
+            self.mins.append(np.minimum.reduceat(points, starts))
+            self.maxs.append(np.maximum.reduceat(points, starts))
+
+    def _bounds(self, level):
+        """Returns where the ranges of the nodes of a level start (and end)"""
+        return (np.arange(2 ** level + 1) * len(self.points)) // 2 ** level
+
+    def _min_distances(self, level, nodes, points):
+        """Returns the distances from the points to the bounding boxes of the nodes"""
+        outside = np.maximum(self.mins[level][nodes] - points, 0) + np.maximum(
+            points - self.maxs[level][nodes], 0
+        )
+        return np.hypot(outside[:, 0], outside[:, 1])
+
+    def _max_distances(self, level, nodes, points):
+        """
+        Returns upper bounds of the distances from the points to the nearest point in
+        the nodes. Every side of a bounding box touches a point, so the nearest point
+        is at most as far away as the far end of the closest side.
+        """
+        to_mins = np.abs(points - self.mins[level][nodes])
+        to_maxs = np.abs(points - self.maxs[level][nodes])
+        near = np.minimum(to_mins, to_maxs)
+        far = np.maximum(to_mins, to_maxs)
+        return np.minimum(
+            np.hypot(near[:, 0], far[:, 1]), np.hypot(far[:, 0], near[:, 1])
+        )
+
+    def query(self, points):
+        """
+        Returns the distance to the nearest point and the index of it, for every
+        point in points (an (N, 2) array)
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        distances = np.full(len(points), np.inf)
+        nearest = np.zeros(len(points), dtype=int)
+
+        # The leaf every query point is in (or closest to) gives a first guess
+        nodes = np.zeros(len(points), dtype=int)
+        for level in range(1, self.depth + 1):
+            left = self._min_distances(level, 2 * nodes, points)
+            right = self._min_distances(level, 2 * nodes + 1, points)
+            nodes = 2 * nodes + (right < left)
+        self._search_leaves(points, np.arange(len(points)), nodes, distances, nearest)
+
+        # Searches every leaf that can be closer than the nearest point found
+        bounds = distances.copy()
+        queries = np.arange(len(points))
+        nodes = np.zeros(len(points), dtype=int)
+        for level in range(1, self.depth + 1):
+            queries = np.repeat(queries, 2)
+            nodes = 2 * np.repeat(nodes, 2) + np.tile([0, 1], len(nodes))
+
+            near_points = points[queries]
+            np.minimum.at(
+                bounds, queries, self._max_distances(level, nodes, near_points)
+            )
+            closer = self._min_distances(level, nodes, near_points) <= bounds[queries]
+            queries = queries[closer]
+            nodes = nodes[closer]
+        self._search_leaves(points, queries, nodes, distances, nearest)
+
+        return distances, nearest
+
+    def _search_leaves(  # pylint: disable=too-many-arguments
+        self, points, queries, leaves, distances, nearest
+    ):
+        """Updates distances and nearest with the points in the leaves of the queries"""
+        bounds = self._bounds(self.depth)
+        starts = bounds[leaves]
+        counts = bounds[leaves + 1] - starts
+        total = counts.sum()
+        if total == 0:
+            return
+
+        # Every (query, point in its leaf) pair
+        pair_queries = np.repeat(queries, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_points = self.order[np.repeat(starts, counts) + offsets]
+        pair_distances = np.hypot(*(self.points[pair_points] - points[pair_queries]).T)
+
+        # Keeps the closest pair of every query
+        np.minimum.at(distances, pair_queries, pair_distances)
+        closest = pair_distances == distances[pair_queries]
+        nearest[pair_queries[closest]] = pair_points[closest]
+
+
+class Accuracy:
+    """
+    How closely a trace follows the paths of a drawing (all distances in mm).
+
+    hausdorff is the Hausdorff distance between the trace and the paths, the
+    largest distance from a position on one of them to the other. rms is the root
+    mean square distance from the trace to the paths. path_errors is the largest
+    distance in either direction for every path.
+
+    The paths are sampled (see sample_paths), so the distances are at most half
+    the spacing of the samples too large.
+    """
+
+    def __init__(self, hausdorff, rms, path_errors):
+        self.hausdorff = hausdorff
+        self.rms = rms
+        self.path_errors = path_errors
+
+    def __repr__(self):
+        return "Accuracy(hausdorff={:.3f}, rms={:.3f}, worst path={})".format(
+            self.hausdorff, self.rms, int(np.argmax(self.path_errors))
+        )
+
+
+def measure(trace, paths, scale=1, spacing=SPACING):
+    """
+    Returns the Accuracy of a trace (an (N, 2) array of positions in mm) drawn to
+    follow the paths, where scale converts from the coordinates of the paths to mm.
+    """
+    trace = np.asarray(trace, dtype=float).reshape(-1, 2)
+    samples, indices = sample_paths(paths, scale, spacing)
+    if len(trace) == 0 or len(samples) == 0:
+        raise ValueError("Can not measure the accuracy of an empty trace or drawing")
+
+    # Distances from the trace to the paths, and from the paths to the trace
+    deviations, nearest = KDTree(samples).query(trace)
+    misses, _ = KDTree(trace).query(samples)
+
+    path_errors = np.zeros(len(paths))
+    np.maximum.at(path_errors, indices[nearest], deviations)
+    np.maximum.at(path_errors, indices, misses)
+
+    return Accuracy(
+        hausdorff=float(max(deviations.max(), misses.max())),
+        rms=float(np.sqrt(np.mean(deviations ** 2))),
+        path_errors=path_errors,
+    )
@@ -1,4 +1,6 @@
 """Util functions related to creation of curves"""
+import math
+
 from app.curves import Line, QuadraticCurve, CubicCurve
 from app.abc.curve import Curve
 
@@ -21,3 +23,74 @@ def make_curve(points, relative=False):
         return CubicCurve(points)
 
     raise ValueError("The number of points needs to be higher than one and less than 5")
+
+
+def angle_difference(angle, other_angle):
+    """Returns the change of direction (in radians) from angle to other_angle"""
+    return (other_angle - angle + math.pi) % (2 * math.pi) - math.pi
+
+
+def is_smooth_junction(curve, next_curve, position_tolerance=1e-9, angle_tolerance=0):
+    """
+    Returns True if next_curve starts where curve ends (G0 continuity) and in the
+    direction curve ends in (G1 continuity).
+
+    position_tolerance is the max distance between the end and the start, and
+    angle_tolerance is the max change of direction (in radians).
+    """
+    if abs(next_curve.get_start_pos() - curve.get_end_pos()) > position_tolerance:
+        return False
+
+    angle_delta = angle_difference(curve.get_end_angle(), next_curve.get_start_angle())
+    return abs(angle_delta) <= angle_tolerance
+
+
+def bezier_range(values):
+    """
+    Returns the min and max value of one coordinate along a bezier curve, from the
+    values of that coordinate at its points (2 to 4 floats, start to end position).
+
+    Uses the same formulas as QuadraticCurve and CubicCurve, but works on plain
+    floats, so no curve objects are created (see PackedPath).
+    """
+    low = min(values[0], values[-1])
+    high = max(values[0], values[-1])
+    positions = []
+    if len(values) == 3:
+        point_a = values[2] - values[1]
+        point_b = values[0] - values[1]
+        if point_a + point_b != 0:
+            t_param = point_b / (point_a + point_b)
+            if 0 < t_param < 1:
+                positions.append(
+                    values[1] + point_a * t_param ** 2 + point_b * (1 - t_param) ** 2
+                )
+    elif len(values) == 4:
+        point_a = values[3] - 3 * values[2] + 3 * values[1] - values[0]
+        point_b = values[2] - 2 * values[1] + values[0]
+        point_c = values[1] - values[0]
+
+        # Roots of a*t^2 + 2*b*t + c
+        t_params = []
+        if abs(point_a) <= 1e-12 * (abs(point_b) + abs(point_c)):
+            if point_b != 0:
+                t_params.append(-point_c / (2 * point_b))
+        elif point_b ** 2 - point_a * point_c >= 0:
+            root = math.sqrt(point_b ** 2 - point_a * point_c)
+            t_params.append((-point_b + root) / point_a)
+            t_params.append((-point_b - root) / point_a)
+
+        for t_param in t_params:
+            if 0 < t_param < 1:
+                positions.append(
+                    t_param ** 3 * point_a
+                    + 3 * t_param ** 2 * point_b
+                    + 3 * t_param * point_c
+                    + values[0]
+                )
+
+    for position in positions:
+        low = min(low, position)
+        high = max(high, position)
+
+    return low, high
@@ -2,16 +2,163 @@
 import time
 import sys
 
+from app.utils.timing import TimerRegistry, _at_exit, ticks_diff, ticks_us
 
-class Logger:
+try:
+    import os
+except ImportError:  # micropython might only have uos
+    import uos as os # pylint: disable=import-error
+
+try:
+    from weakref import WeakSet
+except ImportError:  # micropython does not have weakref
+    WeakSet = set
+
+# Number of characters an output keeps in memory before writing them
+BUFFER_SIZE = 4096
+
+# Max time (in seconds) between the first line kept in memory and writing it. Only checked
+# when something is logged
+FLUSH_INTERVAL = 1
+
+# Loggers that are closed when the program exits (micropython only runs one function at
+# exit, and does not call __del__), and if the function closing them is registered.
+# Loggers that are no longer used are closed by __del__ where there is weakref, and stay
+# open until the program exits on micropython
+_OPEN_LOGGERS = WeakSet()
+_EXIT_REGISTERED = False
+
+LEVEL_NAMES = {
+    0: "NOTSET",
+    10: "DEBUG",
+    20: "INFO",
+    30: "WARNING",
+    40: "ERROR",
+    50: "CRITICAL",
+}
+
+
+class BufferedOutput: # pylint: disable=too-many-instance-attributes
+    """
+    An output that keeps the lines written to it in memory and writes them to a file
+    together. Lines written to a stream are written right away by default, so they are
+    not out of order with what is printed.
+
+    params:
+        output : str or writeable io buffer object - A file name (the file is opened, in
+                 append mode, when the first line is written to it) or a stream
+        buffer_size : int - Number of characters kept before they are written. Defaults to
+                      BUFFER_SIZE for files and 0 (every line is written) for streams
+        flush_interval : float - Max time (in seconds) a line is kept before it is written
+        max_bytes : int - The file is rotated when it is larger (0 to never rotate it)
+        backups : int - Number of rotated files kept (file.1 is the newest)
+    """
+    def __init__(self, output, # pylint: disable=too-many-arguments
+                 buffer_size=None,
+                 flush_interval=FLUSH_INTERVAL,
+                 max_bytes=0,
+                 backups=1):
+        self.file_name = output if isinstance(output, str) else None
+        self.stream = None if self.file_name else output
+        if buffer_size is None:
+            buffer_size = BUFFER_SIZE if self.file_name else 0
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self.lines = []
+        self.size = 0
+        self.first_time = 0
+        self.file_size = 0
+
+    def write(self, line):
+        """Keeps a line, and writes all the kept lines if there are enough or they are too old"""
+        if not self.lines:
+            self.first_time = time.time()
+
+        self.lines.append(line)
+        self.size += len(line)
+        if self.size >= self.buffer_size or time.time() - self.first_time >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Writes all the kept lines"""
+        if not self.lines:
+            return
+
+        text = "".join(self.lines)
+        self.lines = []
+        self.size = 0
+
+        stream = self.open()
+        stream.write(text)
+        stream.flush()
+
+        self.file_size += len(text)
+        if self.file_name and self.max_bytes and self.file_size >= self.max_bytes:
+            self.rotate()
+
+    def open(self):
+        """Returns the stream, and opens the file the first time it is used"""
+        if self.stream is None:
+            self.stream = open( # pylint: disable=consider-using-with
+                self.file_name, "a", encoding="UTF-8")
+            try:
+                self.file_size = os.stat(self.file_name)[6]
+            except OSError:
+                self.file_size = 0
+
+        return self.stream
+
+    def rotate(self):
+        """Renames the file to file.1 (and file.1 to file.2 ...), the next line starts a new file"""
+        self.stream.close()
+        self.stream = None
+
+        for index in range(self.backups, 0, -1):
+            source = self.file_name if index == 1 else "{}.{}".format(self.file_name, index - 1)
+            target = "{}.{}".format(self.file_name, index)
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+            try:
+                os.rename(source, target)
+            except OSError:
+                pass
+
+        if self.backups < 1:
+            os.remove(self.file_name)
+
+    def close(self):
+        """Writes all the kept lines, and closes the file if it was opened by the output"""
+        self.flush()
+        if self.file_name and self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def __repr__(self):
+        return "BufferedOutput({})".format(self.file_name or self.stream)
+
+
+class Logger: # pylint: disable=too-many-instance-attributes
     """
     A class for logging functions
 
     params:
         stdout : bool - If stdout should be an output
-        outputs : dict - Keys are writeable io buffer objects, values are logging level (0 - 50)
+        outputs : dict - Keys are outputs, values are logging level (0 - 50). An output is a
+                  BufferedOutput, a file name or a writeable io buffer object (both are written
+                  through a BufferedOutput). Defaults to stdout (10) and latest.log (20)
         format : str - Logging format
 
+    Messages are only formatted when an output has a level that lets them through, so
+    arguments can be passed after the message (logger.debug("%s mm", distance)) to make
+    filtered messages cheap. Lines are kept in memory by file outputs and written together
+    (see BufferedOutput), warnings and worse are written right away. The outputs are
+    flushed and closed when the program exits, or when close is called.
+
     Note:
         The valid string format parameters are the same as in the logging standard python module
         found here: https://docs.python.org/3/library/logging.html#logrecord-attributes
@@ -24,98 +171,175 @@ class Logger:
     WARNING = 30
     ERROR = 40
     CRITICAL = 50
-    def __init__(self, # pylint: disable=dangerous-default-value
+    def __init__(self,
                  name=__name__,
-                 outputs={
-                     sys.stdout: 10,
-                     open("latest.log", "a", encoding="UTF-8"): 20 # pylint: disable=consider-using-with
-                 },
+                 outputs=None,
                  log_format="%(asctime)s |:| %(name)s:%(levelname)-8s |:| %(message)s",
                  silent_log_errors=True):
+        if outputs is None:
+            outputs = {
+                sys.stdout: self.DEBUG,
+                "latest.log": self.INFO,
+            }
+
         self.name = name
-        self.outputs = outputs
+        self.outputs = {
+            output if isinstance(output, BufferedOutput) else BufferedOutput(output): level
+            for output, level in outputs.items()
+        }
         self.log_format = log_format
         self.silent_log_errors = silent_log_errors
+        self.timers = TimerRegistry()
+
+        # The lowest level any output lets through
+        self.level = min(self.outputs.values()) if self.outputs else self.CRITICAL + 1
+
+        # The formatted time is only made if the format uses it, and reused within a second
+        self.uses_asctime = "asctime" in log_format
+        self.last_second = None
+        self.last_asctime = ""
 
-    def debug(self, message):
+        # Level the timer summary is logged with when the program exits (see Logger.time)
+        self.timers_loglevel = None
+        _close_at_exit(self)
+
+    def enabled(self, level):
+        """Returns True if a message with the given level is written to any output"""
+        return level >= self.level
+
+    def debug(self, message, *args):
         """Sends a debug logging message with logging level 10"""
-        return self.log(message, self.DEBUG)
+        if self.DEBUG >= self.level:
+            self.log(message, self.DEBUG, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Sends an info logging message with logging level 20"""
-        return self.log(message, self.INFO)
+        if self.INFO >= self.level:
+            self.log(message, self.INFO, *args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Sends a warning logging message with logging level 30"""
-        return self.log(message, self.WARNING)
+        return self.log(message, self.WARNING, *args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Sends a error logging message with logging level 40"""
-        return self.log(message, self.ERROR)
+        return self.log(message, self.ERROR, *args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Sends a critical logging message with logging level 50"""
-        return self.log(message, self.CRITICAL)
+        return self.log(message, self.CRITICAL, *args)
+
+    def log(self, message, level, *args):
+        """
+        Sends a logging message with the given logging level. If args are given, the message
+        is formatted with them (message % args) when it is written.
+        """
+        if level < self.level:
+            return None
 
-    def log(self, message, level):
-        """Sends a logging message with the given logging message"""
         return self.write_to_outputs({
             "message": message,
+            "args": args,
         }, level)
 
     def write_to_outputs(self, data, loglevel):
         """Writes to all the outputs with a loglevel lower than or equal to the given loglevel"""
-        data["name"] = self.name
-        data["time"] = time.time()
-        time_struct = time.localtime()
-        data["asctime"] = "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d},{:03d}".format(
-            time_struct.tm_year,
-            time_struct.tm_mon,
-            time_struct.tm_mday,
-            time_struct.tm_hour,
-            time_struct.tm_min,
-            time_struct.tm_sec,
-            round(time.time() % 1 * 1000)
-        )
+        if loglevel < self.level:
+            return
+
+        line = None
 
         # Track errors, then display them later
         errors = []
-        for output in self.outputs:
-            data["levelno"] = self.outputs[output]
-            data["levelname"] = self.level_num_to_name(loglevel)
-            if self.outputs[output] <= loglevel:
-                try:
-                    output.write(self.log_format % data)
-                    output.write("\n")
+        for output, level in self.outputs.items():
+            if level > loglevel:
+                continue
+
+            try:
+                if line is None:
+                    line = self.format(data, loglevel)
+
+                output.write(line)
+                if loglevel >= self.WARNING:
                     output.flush()
-                except Exception as error: # pylint: disable=broad-except
-                    if not self.silent_log_errors:
-                        raise error
-                    errors.append((output, error))
+            except Exception as error: # pylint: disable=broad-except
+                if not self.silent_log_errors:
+                    raise error
+                errors.append((output, error))
 
         for output, error in errors:
-            print("Failed to log to {} ({}).\n\n".format(output, output.name) +
-                  "{}\n{}".format(error.traceback, error))
+            print("Failed to log to {}.\n\n{}".format(output, error))
+
+    def format(self, data, loglevel):
+        """Returns the line written for a message (data) with the given loglevel"""
+        args = data.pop("args", None)
+        if args:
+            if len(args) == 1 and isinstance(args[0], dict):
+                args = args[0]
+            data["message"] = data["message"] % args
 
-    def time(self, loglevel=DEBUG, time_log_format="%(name)s() took %(time_ms).3fms to run"):
+        data["name"] = self.name
+        data["levelno"] = loglevel
+        data["levelname"] = self.level_num_to_name(loglevel)
+        data["time"] = time.time()
+        if self.uses_asctime:
+            data["asctime"] = self.asctime(data["time"])
+
+        return self.log_format % data + "\n"
+
+    def asctime(self, seconds):
+        """Returns the time as a string (ex: 2021-11-11 20:00:00,000)"""
+        second = int(seconds)
+        if second != self.last_second:
+            time_struct = time.localtime(second)
+            self.last_second = second
+            self.last_asctime = "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(
+                time_struct[0],
+                time_struct[1],
+                time_struct[2],
+                time_struct[3],
+                time_struct[4],
+                time_struct[5]
+            )
+
+        return "{},{:03d}".format(self.last_asctime, int(seconds % 1 * 1000))
+
+    def time(self, loglevel=DEBUG,
+             time_log_format="%(name)s() took %(time_ms).3fms to run",
+             aggregate=False):
         """
         Returns a function that executes the given function, but logs the time taken as well.
 
         Intended to be used as a decorator. To run and time the function, see Logger.run_and_time
         instead.
+
+        If aggregate is True, the time of every call is added to the statistics of the function
+        in self.timers instead of being logged, and a summary of all timers is logged when the
+        program exits (see Logger.log_timers).
         """
         def decorator(function):
+            if aggregate:
+                timed_function = self.timers.timed()(function)
+                self.timers_loglevel = loglevel
+
             def decorated_function(*args, **kwargs):
-                start = time.perf_counter()
+                if loglevel < self.level:
+                    return function(*args, **kwargs)
+
+                if aggregate:
+                    return timed_function(*args, **kwargs)
+
+                start = ticks_us()
                 result = function(*args, **kwargs)
-                end = time.perf_counter()
-                self.log(time_log_format % {
+                end = ticks_us()
+                duration = ticks_diff(end, start) / 1000000
+                self.log(time_log_format, loglevel, {
                     "name": function.__name__,
-                    "time": end-start,
-                    "time_ms": (end-start)*1000,
-                    "start_time": start,
-                    "end_time": end
-                }, loglevel)
+                    "time": duration,
+                    "time_ms": duration*1000,
+                    "start_time": start / 1000000,
+                    "end_time": end / 1000000
+                })
                 return result
             return decorated_function
         return decorator
@@ -124,23 +348,63 @@ class Logger:
         """Run and time the given function"""
         return self.time()(function)(*args, **kwargs)
 
+    def log_timers(self, loglevel=INFO):
+        """Logs a table with the statistics of every aggregated timer (see Logger.time)"""
+        for line in self.timers.summary():
+            self.log(line, loglevel)
+        self.flush()
+
     def level_num_to_name(self, num):
         """Returns the name of the given level"""
-        if num >= self.CRITICAL:
-            return "CRITICAL"
-        if num >= self.ERROR:
-            return "ERROR"
-        if num >= self.WARNING:
-            return "WARNING"
-        if num >= self.INFO:
-            return "INFO"
-        if num >= self.DEBUG:
-            return "DEBUG"
+        if num in LEVEL_NAMES:
+            return LEVEL_NAMES[num]
+        for level in (self.CRITICAL, self.ERROR, self.WARNING, self.INFO, self.DEBUG):
+            if num >= level:
+                return LEVEL_NAMES[level]
         return "NOTSET"
 
+    def flush(self):
+        """Writes all the lines kept by the outputs"""
+        for output in self.outputs:
+            output.flush()
+
+    def close(self):
+        """Writes all the lines kept by the outputs, and closes the files they opened"""
+        _OPEN_LOGGERS.discard(self)
+
+        for output in self.outputs:
+            output.close()
+
+    def at_exit(self):
+        """Logs the timer summary (if functions are aggregated) and closes the logger"""
+        if self.timers_loglevel is not None:
+            self.log_timers(self.timers_loglevel)
+        self.close()
+
     def __del__(self):
         """Close all output streams when the object is destructured"""
-        for output in self.outputs.keys():
-            if output == sys.stdout:
-                continue
-            output.close()
+        try:
+            self.close()
+        except Exception: # pylint: disable=broad-except
+            # The interpreter might be shutting down
+            pass
+
+
+def _close_at_exit(logger):
+    """Closes the logger when the program exits"""
+    global _EXIT_REGISTERED # pylint: disable=global-statement
+    if not _EXIT_REGISTERED and _at_exit is not None:
+        _at_exit(_close_loggers)
+        _EXIT_REGISTERED = True
+
+    _OPEN_LOGGERS.add(logger)
+
+
+def _close_loggers():
+    """Closes every logger that is still open, called when the program exits"""
+    for logger in list(_OPEN_LOGGERS):
+        try:
+            logger.at_exit()
+        except Exception: # pylint: disable=broad-except
+            # Nothing can be logged about it anymore
+            pass
@@ -11,12 +11,8 @@ def plot_path(path, plot_obj=plt):
 
 def plot_curve(curve, plot_obj=plt):
     """Plots a given curve"""
-    t_values = np.linspace(0, 1)
-    points = [curve.get_pos(t) for t in t_values]
-
-    x = [p.x for p in points]
-    y = [p.y for p in points]
-    plot_obj.plot(x, y)
+    points = curve.get_pos_many(np.linspace(0, 1))
+    plot_obj.plot(points[:, 0], points[:, 1])
 
 
 def plot_point(point, plot_obj=plt):
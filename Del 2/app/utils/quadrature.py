@@ -0,0 +1,72 @@
+"""Util functions for numerical integration"""
+
+# Nodes and weights of the 8 point Gauss-Legendre quadrature on [-1, 1]
+GAUSS_LEGENDRE_NODES = (
+    (-0.9602898564975362, 0.10122853629037706),
+    (-0.7966664774136267, 0.22238103445337443),
+    (-0.525532409916329, 0.3137066458778869),
+    (-0.18343464249564978, 0.36268378337836166),
+    (0.18343464249564978, 0.36268378337836166),
+    (0.525532409916329, 0.3137066458778869),
+    (0.7966664774136267, 0.22238103445337443),
+    (0.9602898564975362, 0.10122853629037706),
+)
+
+
+def gauss_legendre(function, start, end, panels=1):
+    """
+    Returns the integral of function from start to end using Gauss-Legendre quadrature.
+
+    The interval is split into panels of equal width, each integrated with the
+    8 point rule, which is exact for polynomials up to degree 15.
+    """
+    width = (end - start) / panels
+    half_width = width / 2
+
+    result = 0
+    for panel in range(panels):
+        middle = start + (panel + 0.5) * width
+        for node, weight in GAUSS_LEGENDRE_NODES:
+            result += weight * function(middle + half_width * node)
+
+    return result * half_width
+
+
+def adaptive_gauss_legendre(  # pylint: disable=too-many-arguments, too-many-locals
+    function, start, end, relative_tolerance, panels=1, max_depth=12
+):
+    """
+    Returns the integral of function from start to end using Gauss-Legendre quadrature,
+    with panels that are split in two until the halves agree with the whole panel.
+
+    The interval starts as panels panels of equal width. The tolerance is
+    relative_tolerance times the integral over those panels. A panel is kept when the
+    sum of its halves is within its share of the tolerance (by width) of the whole
+    panel, or after max_depth splits. Smooth parts of the function therefore keep wide
+    panels, while parts that are hard to integrate (ex: a kink) get narrow ones.
+    """
+    width = (end - start) / panels
+    intervals = []
+    for panel in range(panels):
+        panel_start = start + panel * width
+        panel_end = panel_start + width
+        whole = gauss_legendre(function, panel_start, panel_end)
+        intervals.append((panel_start, panel_end, whole, 0))
+
+    tolerance = relative_tolerance * abs(sum(interval[2] for interval in intervals))
+    result = 0
+    while intervals:
+        panel_start, panel_end, whole, depth = intervals.pop()
+        middle = (panel_start + panel_end) / 2
+        first_half = gauss_legendre(function, panel_start, middle)
+        second_half = gauss_legendre(function, middle, panel_end)
+
+        share = tolerance * (panel_end - panel_start) / (end - start)
+        if depth >= max_depth or abs(first_half + second_half - whole) <= share:
+            result += first_half + second_half
+            continue
+
+        intervals.append((panel_start, middle, first_half, depth + 1))
+        intervals.append((middle, panel_end, second_half, depth + 1))
+
+    return result
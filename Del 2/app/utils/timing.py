@@ -0,0 +1,189 @@
+"""
+Timers that aggregate how long functions take, instead of logging every call.
+
+Works on pybricks-micropython, where time.ticks_us is used instead of
+time.perf_counter.
+"""
+import sys
+import time
+
+try:
+    from atexit import register as _at_exit
+except ImportError:  # micropython only has sys.atexit (for a single function)
+    _at_exit = getattr(sys, "atexit", None)
+
+if hasattr(time, "perf_counter"):
+
+    def ticks_us():
+        """Returns a time stamp in microseconds (only differences are meaningful)"""
+        return int(time.perf_counter() * 1000000)
+
+    def ticks_diff(end, start):
+        """Returns the time (in microseconds) between two time stamps"""
+        return end - start
+
+else:  # micropython
+    ticks_us = time.ticks_us  # pylint: disable=no-member
+    ticks_diff = time.ticks_diff  # pylint: disable=no-member
+
+# Number of buckets in the latency histograms. Bucket 0 counts durations under 1 us,
+# bucket i durations from 2 ** (i - 1) us up to 2 ** i us, and the last bucket every
+# longer duration (over about 1 s)
+BUCKETS = 22
+
+
+class TimerStats:
+    """
+    The count, total, min, max (in microseconds) and latency histogram (see BUCKETS)
+    of the durations recorded for one timer. Uses the same memory no matter how many
+    durations are recorded.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = [0] * BUCKETS
+
+    def reset(self):
+        """Forgets every recorded duration"""
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, duration):
+        """Records a duration (in microseconds)"""
+        self.count += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        self.max = max(self.max, duration)
+
+        # int.bit_length is not available on micropython
+        index = 0
+        bound = 1
+        while duration >= bound and index < BUCKETS - 1:
+            index += 1
+            bound <<= 1
+        self.buckets[index] += 1
+
+    def mean(self):
+        """Returns the mean duration (in microseconds)"""
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, fraction):
+        """
+        Returns an upper bound of the duration (in microseconds) that fraction of the
+        durations are shorter than, from the histogram
+        """
+        if not self.count:
+            return 0
+
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and index < BUCKETS - 1:
+                return min(1 << index, self.max)
+
+        return self.max
+
+
+class TimerRegistry:
+    """
+    Keeps a TimerStats for every timer, by name.
+
+    Functions are timed with the timed decorator (or record is called with a
+    duration), and summary returns a table of all timers. If at_exit is True, the
+    table is printed when the program exits (see report).
+    """
+
+    def __init__(self, at_exit=False):
+        self.stats = {}
+        self.exit_registered = False
+        if at_exit:
+            self.report_at_exit(self.report)
+
+    def record(self, name, duration):
+        """Records a duration (in microseconds) for the timer with the given name"""
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = TimerStats(name)
+
+        stats.add(duration)
+
+    def timed(self, name=None):
+        """
+        Returns a decorator that records how long every call of the function takes,
+        with the name of the function as the name of the timer by default
+        """
+
+        def decorator(function):
+            stats = self.stats.get(name or function.__name__)
+            if stats is None:
+                stats = TimerStats(name or function.__name__)
+                self.stats[stats.name] = stats
+
+            def timed_function(*args, **kwargs):
+                start = ticks_us()
+                result = function(*args, **kwargs)
+                stats.add(ticks_diff(ticks_us(), start))
+                return result
+
+            return timed_function
+
+        return decorator
+
+    def summary(self):
+        """Returns a table (a list of lines) with the statistics of every timer"""
+        lines = [
+            "{:<32} {:>9} {:>11} {:>10} {:>9} {:>9} {:>9} {:>9}".format(
+                "timer",
+                "calls",
+                "total ms",
+                "mean us",
+                "min us",
+                "p50 us",
+                "p99 us",
+                "max us",
+            )
+        ]
+        for stats in sorted(self.stats.values(), key=lambda stats: -stats.total):
+            lines.append(
+                "{:<32} {:>9} {:>11.3f} {:>10.2f} {:>9} {:>9} {:>9} {:>9}".format(
+                    stats.name,
+                    stats.count,
+                    stats.total / 1000,
+                    stats.mean(),
+                    stats.min or 0,
+                    stats.percentile(0.5),
+                    stats.percentile(0.99),
+                    stats.max,
+                )
+            )
+
+        return lines
+
+    def report(self, output=None):
+        """Writes the summary to an output (stdout by default), if anything was timed"""
+        if not self.stats:
+            return
+
+        output = output or sys.stdout
+        for line in self.summary():
+            output.write(line + "\n")
+
+    def reset(self):
+        """Forgets every recorded duration (the timers are kept)"""
+        for stats in self.stats.values():
+            stats.reset()
+
+    def report_at_exit(self, function):
+        """Calls function (once) when the program exits, if that is supported"""
+        if not self.exit_registered and _at_exit is not None:
+            _at_exit(function)
+            self.exit_registered = True
@@ -0,0 +1 @@
+"""Benchmarks used to measure the performance of the application on a host pc"""
@@ -0,0 +1,102 @@
+"""
+Benchmarks for the accuracy of the robot with different speed settings.
+
+Simulates the sample svgs with the EventTurtle for every setting and prints the
+time it takes to drive, the mean RMS deviation and the largest Hausdorff distance
+between the traces and the paths (see app.utils.accuracy).
+
+Run from the "Del 2" directory: python -m bench.accuracy
+"""
+import os
+import time
+
+import numpy as np
+
+from app.planning import optimize_travel
+from app.planning.velocity import plan_velocity
+from app.svg.parsing import parse_drawing
+from app.utils.accuracy import SPACING, measure
+from bench.parsing import SAMPLE_SVGS
+from robot.robot import Robot
+from robot.config import (
+    ACCELERATION,
+    DRAWING_LEN,
+    JERK,
+    LATERAL_ACCELERATION,
+    MAX_SPEED,
+    MIN_SPEED,
+)
+from turtle_sim import simulate_drawing
+
+# Speed settings compared: name, max speed (mm/s), lateral acceleration (mm/s^2).
+# None uses the constant speed the turn rates are planned with (config.SPEED)
+SETTINGS = (
+    ("constant speed", None, None),
+    ("slow", MAX_SPEED / 2, LATERAL_ACCELERATION / 2),
+    ("config", MAX_SPEED, LATERAL_ACCELERATION),
+    ("fast", MAX_SPEED * 2, LATERAL_ACCELERATION * 2),
+)
+
+
+def robot_class(max_speed, lateral_acceleration):
+    """Returns a Robot class that plans the speed profile with the settings"""
+
+    class SettingsRobot(Robot):
+        """A robot with other speed settings"""
+
+        def plan_velocity(self, schedule):
+            if max_speed is None:
+                return schedule
+
+            return plan_velocity(
+                schedule,
+                max_speed=max_speed,
+                min_speed=MIN_SPEED,
+                acceleration=ACCELERATION,
+                lateral_acceleration=lateral_acceleration,
+                jerk=JERK,
+            )
+
+    return SettingsRobot
+
+
+def main():
+    """Runs the accuracy benchmarks"""
+    drawings = []
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        drawing = parse_drawing(SAMPLE_SVGS + file_name)
+        drawings.append((drawing, optimize_travel(drawing, drawing.min_position)))
+
+    for name, max_speed, lateral_acceleration in SETTINGS:
+        start = time.perf_counter()
+        driving_time = 0
+        results = []
+        for drawing, paths in drawings:
+            drive_base = simulate_drawing(
+                drawing,
+                paths,
+                robot_class=robot_class(max_speed, lateral_acceleration),
+                trace_step=SPACING,
+            )
+            _, xs, ys, _ = drive_base.trace()
+            driving_time += drive_base.time
+            results.append(
+                measure(
+                    np.stack([xs, ys], axis=1), paths, drawing.scale_for(DRAWING_LEN)
+                )
+            )
+
+        print(
+            "{:<16} driving {:>6.1f} s, mean rms {:>6.2f} mm, max hausdorff {:>7.2f} mm"
+            " ({:.1f} s)".format(
+                name,
+                driving_time,
+                np.mean([result.rms for result in results]),
+                max(result.hausdorff for result in results),
+                time.perf_counter() - start,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmarks for evaluating curves.
+
+Compares sampling every curve in the sample svgs one t value at a time (get_pos,
+get_curvature) with the batch methods (get_pos_many, get_curvature_many).
+
+Run from the "Del 2" directory: python -m bench.curves
+"""
+import os
+import time
+
+import numpy as np
+
+from app.svg.parsing import parse_svg
+
+SAMPLE_SVGS = "app/svg/sample_svgs/"
+
+
+def sample_scalar(curves, t_params):
+    """Samples the position and curvature of every curve, one t value at a time"""
+    for curve in curves:
+        positions = [curve.get_pos(t_param) for t_param in t_params]
+        np.array([(point.x, point.y) for point in positions])
+        np.array([curve.get_curvature(t_param) for t_param in t_params])
+
+
+def sample_batch(curves, t_params):
+    """Samples the position and curvature of every curve with the batch methods"""
+    for curve in curves:
+        curve.get_pos_many(t_params)
+        curve.get_curvature_many(t_params)
+
+
+def best_time(function, *args, repeats=5):
+    """Returns the shortest time (in seconds) out of a number of calls"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def main(samples=(50, 1000)):
+    """Runs the curve benchmarks"""
+    curves = [
+        curve
+        for file_name in sorted(os.listdir(SAMPLE_SVGS))
+        for path in parse_svg(SAMPLE_SVGS + file_name)
+        for curve in path
+    ]
+
+    print("Sampling {} curves (position and curvature)".format(len(curves)))
+    for sample_count in samples:
+        t_params = np.linspace(0, 1, sample_count)
+        scalar = best_time(sample_scalar, curves, t_params)
+        batch = best_time(sample_batch, curves, t_params)
+        print(
+            "  {:>6} samples: scalar {:>9.2f} ms, batch {:>8.2f} ms ({:.0f}x)".format(
+                sample_count, scalar * 1000, batch * 1000, scalar / batch
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmarks for driving through the junctions between curves and for the speed
+profile.
+
+Draws the sample svgs with a simulated robot:
+- stopping, turning and lifting the pen at every junction between two curves
+  (like the robot did before)
+- driving through smooth junctions without stopping, at a constant speed
+- driving through smooth junctions with the planned speed profile
+Prints the number of stops, turns and pen lifts, an estimate of the time it takes
+to draw the svg and the max distance between the end of a path and where the
+simulated robot ended up.
+
+Run from the "Del 2" directory: python -m bench.junctions
+"""
+import math
+import os
+
+from app.planning import optimize_travel
+from app.svg.parsing import parse_drawing
+from bench.motion import SimulatedDriveBase
+from bench.parsing import SAMPLE_SVGS
+from robot.robot import Robot
+from robot.config import DRAWING_LEN, SPEED, TURN_RATE, TURN_SPEED
+from turtle_sim.simulation import drawing_robot
+
+# Estimated turn rate (deg/s) of the robot when it turns on the spot
+TURN_ON_SPOT_RATE = 90
+
+# Estimated time (in seconds) it takes the robot to stop and start again
+STOP_TIME = 0.3
+
+# Time (in seconds) it takes to lift or lower the pen
+PEN_TIME = TURN_RATE / TURN_SPEED
+
+
+class CountingDriveBase(  # pylint: disable=too-many-instance-attributes
+    SimulatedDriveBase
+):
+    """A simulated drive base that counts what the robot does"""
+
+    def __init__(self, position, heading):
+        super().__init__(position, heading)
+        self.stops = 0
+        self.turns = 0
+        self.turned = 0
+        self.straight_distance = 0
+        self.pen_down = False
+        self.pen_moves = 0
+        self.max_error = 0
+
+    def stop(self):
+        super().stop()
+        self.stops += 1
+
+    def turn(self, angle):
+        """Turns on the spot (in degrees)"""
+        self.heading += math.radians(angle)
+        self.turns += 1
+        self.turned += abs(angle)
+
+    def straight(self, distance):
+        """Drives straight (in mm)"""
+        self.position = (
+            self.position[0] + distance * math.cos(self.heading),
+            self.position[1] + distance * math.sin(self.heading),
+        )
+        self.straight_distance += distance
+        self.stops += 1
+
+    def penup(self):
+        """Lifts the pen"""
+        if self.pen_down:
+            self.pen_moves += 1
+        self.pen_down = False
+
+    def pendown(self):
+        """Lowers the pen"""
+        if not self.pen_down:
+            self.pen_moves += 1
+        self.pen_down = True
+
+    def estimated_time(self):
+        """Returns an estimate of the time (in seconds) it took to draw"""
+        return (
+            self.time
+            + self.straight_distance / SPEED
+            + self.turned / TURN_ON_SPOT_RATE
+            + self.stops * STOP_TIME
+            + self.pen_moves * PEN_TIME
+        )
+
+
+class ConstantSpeedRobot(Robot):
+    """The robot as it was before the speed profile was planned"""
+
+    def plan_velocity(self, schedule):
+        return schedule
+
+
+class LegacyRobot(ConstantSpeedRobot):
+    """The robot as it was before smooth junctions were driven through"""
+
+    def is_smooth_junction(self, curve, next_curve):
+        return False
+
+    def change_angle(self, end_angle):
+        angle_delta = ((end_angle - self.angle) + math.pi) % (math.pi * 2) - math.pi
+
+        self.lift_pen()
+        self.drive_base.turn(math.degrees(angle_delta))
+
+        self.angle = end_angle
+
+
+def draw(robot_class, drawing, paths):
+    """Draws the paths with a simulated robot and returns its drive base"""
+    scale = drawing.scale_for(DRAWING_LEN)
+    start = drawing.min_position * scale
+    drive_base = CountingDriveBase((start.x, start.y), 0)
+    robot = drawing_robot(drawing, drive_base, robot_class)
+    for path in paths:
+        robot.drive_through_path(path, drawing=True)
+
+        end = path.end_position * scale
+        drive_base.max_error = max(
+            drive_base.max_error,
+            math.hypot(drive_base.position[0] - end.x, drive_base.position[1] - end.y),
+        )
+
+    return drive_base
+
+
+def main():
+    """Runs the junction benchmarks"""
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        drawing = parse_drawing(SAMPLE_SVGS + file_name)
+        paths = optimize_travel(drawing, drawing.min_position)
+        print("{} ({} curves)".format(file_name, drawing.segment_count))
+        for name, robot_class in (
+            ("stop at every curve", LegacyRobot),
+            ("smooth", ConstantSpeedRobot),
+            ("speed profile", Robot),
+        ):
+            drive_base = draw(robot_class, drawing, paths)
+            print(
+                "  {:<20} {:>5} stops {:>5} turns {:>5} pen moves {:>8.1f} s "
+                "{:>6.2f} mm max error".format(
+                    name,
+                    drive_base.stops,
+                    drive_base.turns,
+                    drive_base.pen_moves,
+                    drive_base.estimated_time(),
+                    drive_base.max_error,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
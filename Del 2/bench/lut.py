@@ -0,0 +1,137 @@
+"""
+Benchmarks for the look-up tables (LUT) of nonlinear curves.
+
+Compares the fixed 100 entry look-up table with the adaptive look-up table for every
+nonlinear curve in the sample svgs, drawn at the size used by the robot.
+
+Run from the "Del 2" directory: python -m bench.lut
+"""
+import os
+import time
+
+from app.abc import NonLinearCurve
+from app.svg.parsing import parse_drawing
+from robot.config import DRAWING_LEN, LUT_TOLERANCE
+
+SAMPLE_SVGS = "app/svg/sample_svgs/"
+
+# Number of entries in the look-up table used as the reference for the errors
+REFERENCE_ENTRIES = 4096
+
+# Number of traversed lengths the error is measured at per curve
+ERROR_SAMPLES = 50
+
+
+def build_time(curves, build):
+    """Returns the time (in seconds) it takes to build a look-up table for every curve"""
+    start = time.perf_counter()
+    for curve in curves:
+        build(curve)
+
+    return time.perf_counter() - start
+
+
+def max_error(curve, look_up_table, reference):
+    """
+    Returns the max distance between the positions given by get_t with look_up_table
+    and with the reference look-up table.
+    """
+    length = min(look_up_table.total_length, reference.total_length)
+
+    error = 0
+    for i in range(ERROR_SAMPLES):
+        traversed_length = length * i / ERROR_SAMPLES
+
+        curve._look_up_table = look_up_table  # pylint: disable=protected-access
+        pos = curve.get_pos(curve.get_t(traversed_length))
+
+        curve._look_up_table = reference  # pylint: disable=protected-access
+        error = max(error, abs(pos - curve.get_pos(curve.get_t(traversed_length))))
+
+    return error
+
+
+def compare(svg_file_name):
+    """Prints the size, build time and accuracy of both kinds of look-up tables"""
+    drawing = parse_drawing(svg_file_name)
+    curves = [
+        curve for path in drawing for curve in path if isinstance(curve, NonLinearCurve)
+    ]
+    if len(curves) == 0:
+        return
+
+    scale = drawing.scale_for(DRAWING_LEN)
+    tolerance = LUT_TOLERANCE / scale
+
+    fixed_time = build_time(curves, lambda curve: curve.generate_lut(100))
+    adaptive_time = build_time(
+        curves, lambda curve: curve.generate_adaptive_lut(tolerance)
+    )
+
+    print("{} ({} curves, tolerance {:.3f} mm)".format(
+        os.path.basename(svg_file_name), len(curves), LUT_TOLERANCE
+    ))
+    for name, build, seconds in (
+        ("fixed", lambda curve: curve.generate_lut(100), fixed_time),
+        ("adaptive", lambda curve: curve.generate_adaptive_lut(tolerance), adaptive_time),
+    ):
+        entries = 0
+        error = 0
+        for curve in curves:
+            look_up_table = build(curve)
+            entries += len(look_up_table)
+            error = max(
+                error,
+                max_error(curve, look_up_table, curve.generate_lut(REFERENCE_ENTRIES)),
+            )
+
+        print(
+            "  {:<10} {:>8} entries {:>10.2f} ms {:>10.3f} mm max error".format(
+                name, entries, seconds * 1000, error * scale
+            )
+        )
+
+
+def get_t_benchmark(svg_file_name=SAMPLE_SVGS + "inkscapeSVG.svg", calls=100):
+    """
+    Prints how long a step of the drive loop (Robot.drive_through_curve) takes on
+    average while following the nonlinear curves in an svg file, not counting the
+    drive base. Every step compares the distance to the length and calls get_t.
+    """
+    drawing = parse_drawing(svg_file_name)
+    curves = [
+        curve for path in drawing for curve in path if isinstance(curve, NonLinearCurve)
+    ]
+    tolerance = LUT_TOLERANCE / drawing.scale_for(DRAWING_LEN)
+
+    print("Drive loop steps on the curves of {}".format(os.path.basename(svg_file_name)))
+    for name, lut_tolerance in (("fixed", None), ("adaptive", tolerance)):
+        elapsed = 0
+        for curve in curves:
+            curve.set_lut_tolerance(lut_tolerance)
+            length = curve.look_up_table.total_length
+            traversed_lengths = [length * i / calls for i in range(calls)]
+
+            start = time.perf_counter()
+            for traversed_length in traversed_lengths:
+                if traversed_length < curve.length():
+                    curve.get_t(traversed_length)
+            elapsed += time.perf_counter() - start
+
+        print(
+            "  {:<10} {:>10.3f} us per step".format(
+                name, elapsed / (calls * len(curves)) * 1e6
+            )
+        )
+
+
+def main():
+    """Runs the look-up table benchmarks"""
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        compare(SAMPLE_SVGS + file_name)
+
+    get_t_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmarks for the drive loop used to follow curves.
+
+Runs the previous drive loop (which searched the look-up table and calculated the
+curvature on every iteration) and the loop that follows a planned turn rate
+schedule against a simulated drive base, and prints the control frequency (loop
+iterations per second) reached on this computer, the number of commands sent to
+the drive base and the distance between where the robot ends up and the end of
+the curve.
+
+Run from the "Del 2" directory: python -m bench.motion
+"""
+import math
+import time
+
+from app.planning.motion import plan_curve
+from app.svg.parsing import parse_drawing
+from bench.parsing import SAMPLE_SVGS
+from robot.robot import Robot
+from robot.config import DRAWING_LEN, LUT_TOLERANCE, SPEED
+
+# Simulated time (in seconds) that passes every time the distance is read
+TIME_STEP = 1e-3
+
+
+class SimulatedDriveBase:  # pylint: disable=too-many-instance-attributes
+    """A drive base that moves a simulated robot TIME_STEP every time it is polled"""
+
+    def __init__(self, position, heading):
+        self.position = position
+        self.heading = heading
+        self.speed = 0
+        self.turn_rate = 0
+        self.driven = 0
+        self.commands = 0
+        self.polls = 0
+        self.time = 0
+
+    def reset(self):
+        """Resets the driven distance"""
+        self.driven = 0
+
+    def drive(self, speed, turn_rate):
+        """Starts driving with a speed (mm/s) and a turn rate (deg/s)"""
+        self.speed = speed
+        self.turn_rate = turn_rate
+        self.commands += 1
+
+    def stop(self):
+        """Stops the robot"""
+        self.speed = 0
+        self.turn_rate = 0
+
+    def distance(self):
+        """Moves the robot one time step and returns the driven distance"""
+        self.polls += 1
+        if self.speed:
+            self.time += TIME_STEP
+
+        distance = self.speed * TIME_STEP
+        turn = math.radians(self.turn_rate) * TIME_STEP
+
+        # Drives along the chord of the circular arc driven during the time step
+        heading = self.heading + turn / 2
+        self.position = (
+            self.position[0] + distance * math.cos(heading),
+            self.position[1] + distance * math.sin(heading),
+        )
+        self.heading += turn
+        self.driven += distance
+        return self.driven
+
+
+def legacy_follow_curve(drive_base, curve, scale):
+    """The drive loop of Robot.drive_through_curve before the turn rates were planned"""
+    drive_base.reset()
+    while (
+        drive_base.distance() is None and curve.length() != 0
+    ) or drive_base.distance() < curve.length() * scale:
+        distance = drive_base.distance()
+        try:
+            t_param = curve.get_t(distance / scale)
+        except ValueError:
+            break
+
+        curvature = curve.get_curvature(t_param)
+        drive_base.drive(SPEED, math.degrees(SPEED * curvature / scale))
+    drive_base.stop()
+
+
+def follow_schedule(drive_base, schedule):
+    """Follows a schedule with Robot.follow_schedule, returns the loop iterations"""
+    robot = Robot(scale=1, _drive_base=drive_base, _pen_motor=None)
+    robot.follow_schedule(schedule)
+    return drive_base.polls
+
+
+def run(curves, scale, follow):
+    """
+    Follows every curve with a simulated drive base. Returns the number of loop
+    iterations, the time it took, the number of commands and the mean end error (mm)
+    """
+    iterations = commands = errors = elapsed = 0
+    for curve in curves:
+        start = curve.get_start_pos() * scale
+        drive_base = SimulatedDriveBase((start.x, start.y), curve.get_start_angle())
+
+        loop_start = time.perf_counter()
+        loops = follow(drive_base, curve)
+        elapsed += time.perf_counter() - loop_start
+
+        end = curve.get_end_pos() * scale
+        errors += math.hypot(
+            drive_base.position[0] - end.x, drive_base.position[1] - end.y
+        )
+        iterations += loops if loops is not None else drive_base.commands
+        commands += drive_base.commands
+
+    return iterations, elapsed, commands, errors / len(curves)
+
+
+def main(svg_file_name=SAMPLE_SVGS + "inkscapeSVG.svg"):
+    """Runs the drive loop benchmarks"""
+    drawing = parse_drawing(svg_file_name)
+    scale = drawing.scale_for(DRAWING_LEN)
+    curves = [curve for path in drawing for curve in path if curve.length() != 0]
+    for curve in curves:
+        curve.set_lut_tolerance(LUT_TOLERANCE / scale)
+
+    start = time.perf_counter()
+    schedules = {id(curve): plan_curve(curve, scale, SPEED) for curve in curves}
+    planning_time = time.perf_counter() - start
+
+    print("{} curves of {}".format(len(curves), svg_file_name))
+    print(
+        "  planning: {:.3f} s, {:.1f} parts per curve".format(
+            planning_time,
+            sum(len(schedule) for schedule in schedules.values()) / len(curves),
+        )
+    )
+
+    for name, follow in (
+        ("legacy loop", lambda base, curve: legacy_follow_curve(base, curve, scale)),
+        ("schedule", lambda base, curve: follow_schedule(base, schedules[id(curve)])),
+    ):
+        iterations, elapsed, commands, error = run(curves, scale, follow)
+        print(
+            "  {:<12} {:>9.0f} Hz {:>8} commands {:>7.3f} mm mean end error".format(
+                name, iterations / elapsed, commands, error
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
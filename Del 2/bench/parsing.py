@@ -0,0 +1,172 @@
+"""
+Benchmarks for the svg parser.
+
+Compares the incremental svg reader with the previous whole-file reader, both on
+the sample svgs and on a synthetic svg file with a given number of segments (see
+bench.synthetic), and the path data lexer with the previous regex based parsing
+of command inputs.
+
+Run from the "Del 2" directory: python -m bench.parsing [segments]
+"""
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from app.svg.parsing import (
+    _iter_path_data,
+    _lex_path_data,
+    _lex_tokens,
+    _scan_tokens,
+    _tokenize,
+    iter_svg_paths,
+)
+from bench.synthetic import write_svg
+
+SAMPLE_SVGS = "app/svg/sample_svgs/"
+SYNTHETIC_SVG = "synthetic.svg"
+
+
+def legacy_commands_from_svg(svg_file_name):
+    """
+    The reader used before the incremental reader (kept as a reference).
+
+    Reads the whole file, finds the paths with a regex and splits the commands.
+    """
+    with open(svg_file_name, "r", encoding="utf-8") as file:
+        text = file.read().replace("\n", "")
+
+    matches = re.findall(r"(?<=\bd=\").*?(?=\")", text)
+    paths = [re.split("([cCsSqQtTlLaAvVhHmMzZ])", match) for match in matches]
+    flat = [cmd.strip() for path in paths for cmd in path[1:]]
+
+    return list(flat[::2]), list(flat[1::2])
+
+
+def legacy_lex_path_data(path_data):
+    """
+    The parsing of path data used before the lexer (kept as a reference).
+
+    Splits the data at every command letter and parses the inputs of every command
+    with a regex.
+    """
+    pattern = r"\-?\.?(?:(?:(?<=\.)\d+(?:e\d+)?)|(?:(?<!\.)\d+(?:\.?\d+(?:e\-?\d+)?)?))"
+    split = re.split("([cCsSqQtTlLaAvVhHmMzZ])", path_data)
+    commands = [cmd.strip() for cmd in split[1:]]
+
+    return commands[::2], [
+        [float(num) for num in re.findall(pattern, inp)] for inp in commands[1::2]
+    ]
+
+
+def tokenizer_lex_path_data(path_data):
+    """Runs the lexer on tokens from the regex tokenizer (used for compact path data)"""
+    return _lex_tokens(_tokenize(path_data))
+
+
+def scanner_lex_path_data(path_data):
+    """Runs the lexer on tokens from the tokenizer that is used on micropython"""
+    return _lex_tokens(_scan_tokens(path_data))
+
+
+def streaming_commands_from_svg(svg_file_name):
+    """Reads the commands of every path with the incremental reader, one path at a time"""
+    instruction_count = 0
+    for path_data in _iter_path_data(svg_file_name):
+        commands, _, _ = _lex_path_data(path_data)
+        instruction_count += len(commands)
+
+    return instruction_count
+
+
+def consume_svg_paths(svg_file_name):
+    """Parses every path in an svg file without keeping them"""
+    curve_count = 0
+    for path in iter_svg_paths(svg_file_name):
+        curve_count += len(path)
+
+    return curve_count
+
+
+def measure(function, *args):
+    """Returns the time taken (in seconds) and the peak memory usage (in bytes) of a call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return end - start, peak
+
+
+def time_per_call(function, args_list, repeats=50):
+    """Returns the median time (in seconds) it takes to call function on every args"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for args in args_list:
+            function(args)
+        times.append(time.perf_counter() - start)
+
+    return sorted(times)[len(times) // 2]
+
+
+def report(name, results):
+    """Prints the time and peak memory of a benchmarked function"""
+    seconds, peak = results
+    print("  {:<34} {:>10.2f} ms {:>12.1f} KiB".format(name, seconds * 1000, peak / 1024))
+
+
+def lexer_benchmark(svg_file_name=SAMPLE_SVGS + "Mediamodifier-Design.svg"):
+    """Prints the time it takes to lex all the path data in an svg file"""
+    path_data = list(_iter_path_data(svg_file_name))
+    results = [
+        (name, time_per_call(function, path_data))
+        for name, function in (
+            ("legacy split + regex", legacy_lex_path_data),
+            ("lexer", _lex_path_data),
+            ("lexer (regex tokenizer)", tokenizer_lex_path_data),
+            ("lexer (micropython tokenizer)", scanner_lex_path_data),
+        )
+    ]
+
+    print("Lexing {}".format(svg_file_name))
+    for name, seconds in results:
+        print(
+            "  {:<34} {:>10.3f} ms {:>10.2f}x".format(
+                name, seconds * 1000, results[0][1] / seconds
+            )
+        )
+
+
+def main(synthetic_segments=1000000):
+    """Runs the parsing benchmarks"""
+    lexer_benchmark()
+
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        svg = SAMPLE_SVGS + file_name
+        print("{} ({:.1f} KiB)".format(file_name, os.path.getsize(svg) / 1024))
+        report("legacy reader", measure(legacy_commands_from_svg, svg))
+        report("incremental reader", measure(streaming_commands_from_svg, svg))
+        report("incremental parse (all curves)", measure(consume_svg_paths, svg))
+
+    if synthetic_segments <= 0:
+        return
+
+    write_svg(SYNTHETIC_SVG, synthetic_segments)
+    try:
+        print(
+            "{} ({:.1f} MiB)".format(
+                SYNTHETIC_SVG, os.path.getsize(SYNTHETIC_SVG) / 1024 / 1024
+            )
+        )
+        report("legacy reader", measure(legacy_commands_from_svg, SYNTHETIC_SVG))
+        report("incremental reader", measure(streaming_commands_from_svg, SYNTHETIC_SVG))
+    finally:
+        os.remove(SYNTHETIC_SVG)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,82 @@
+"""
+Benchmarks for the memory used by parsed drawings.
+
+Compares the memory kept by the paths of an svg file when they are stored as lists
+of curve objects (Path) and when they are stored in typed arrays (PackedPath), and
+the time it takes to parse and iterate over them.
+
+Run from the "Del 2" directory: python -m bench.paths [segments]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+from app.svg import Path, PackedPath
+from app.svg.parsing import parse_svg
+from bench.parsing import SAMPLE_SVGS, SYNTHETIC_SVG
+from bench.synthetic import write_svg
+
+
+def retained_memory(svg_file_name, path_class):
+    """
+    Returns the number of segments in an svg file, the memory (in bytes) kept by its
+    parsed paths and the time (in seconds) it took to parse it.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    paths = parse_svg(svg_file_name, path_class)
+    end = time.perf_counter()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return sum(len(path) for path in paths), current, end - start, paths
+
+
+def iteration_time(paths):
+    """Returns the time (in seconds) it takes to visit the end of every curve"""
+    start = time.perf_counter()
+    for path in paths:
+        for curve in path:
+            curve.get_end_pos()
+
+    return time.perf_counter() - start
+
+
+def compare(svg_file_name):
+    """Prints the memory used by a parsed svg file for both path representations"""
+    print(
+        "{} ({:.1f} KiB)".format(svg_file_name, os.path.getsize(svg_file_name) / 1024)
+    )
+    for path_class in (Path, PackedPath):
+        segments, memory, parse_time, paths = retained_memory(svg_file_name, path_class)
+        print(
+            "  {:<10} {:>7} segments {:>10.1f} KiB {:>7.1f} B/segment, "
+            "parse {:.3f} s, iterate {:.3f} s".format(
+                path_class.__name__,
+                segments,
+                memory / 1024,
+                memory / max(segments, 1),
+                parse_time,
+                iteration_time(paths),
+            )
+        )
+
+
+def main(synthetic_segments=100000):
+    """Runs the path memory benchmarks"""
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        compare(SAMPLE_SVGS + file_name)
+
+    if synthetic_segments <= 0:
+        return
+
+    write_svg(SYNTHETIC_SVG, synthetic_segments)
+    try:
+        compare(SYNTHETIC_SVG)
+    finally:
+        os.remove(SYNTHETIC_SVG)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,134 @@
+"""
+Benchmarks for how the parser, the paths and the planner scale with the size of a
+drawing.
+
+Writes synthetic svg files (see bench.synthetic) from 1k to 1M segments and
+measures the time and peak memory of parsing them (into Path and PackedPath),
+measuring the length of every path and planning the order of the paths. The
+growth between two sizes is printed as an exponent (time ~ segments ** exponent),
+and steps that grow faster than linear are marked. The results are written to a
+CSV file, to be plotted against the size.
+
+Run from the "Del 2" directory: python -m bench.scaling [max_segments] [results.csv]
+"""
+import csv
+import math
+import os
+import sys
+import time
+
+from app.planning import optimize_travel
+from app.svg import PackedPath
+from app.svg.parsing import parse_drawing
+from bench.parsing import SYNTHETIC_SVG, measure
+from bench.synthetic import write_svg
+
+SIZES = (1000, 10000, 100000, 1000000)
+RESULTS = "scaling.csv"
+
+# Growth exponents above this are marked as superlinear
+SUPERLINEAR = 1.2
+
+# Times (in seconds) below this are too short to compare
+MIN_TIME = 0.005
+
+
+def stages(svg_file_name):
+    """Returns the name and function of every measured step, in the order they run"""
+    state = {}
+
+    def parse():
+        state["drawing"] = parse_drawing(svg_file_name)
+
+    return [
+        ("parse", parse),
+        ("parse (PackedPath)", lambda: parse_drawing(svg_file_name, PackedPath)),
+        ("length", lambda: [path.length() for path in state["drawing"]]),
+        (
+            "plan",
+            lambda: optimize_travel(state["drawing"], state["drawing"].min_position),
+        ),
+    ]
+
+
+def time_and_memory(function):
+    """
+    Returns the time taken (in seconds) and the peak memory usage (in bytes) of a
+    function. tracemalloc slows the function down, so it is timed in a separate call.
+    """
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    _, peak = measure(function)
+    return seconds, peak
+
+
+def exponent(size, seconds, previous_size, previous_seconds):
+    """Returns the exponent of the growth in time between two sizes (or None)"""
+    if previous_seconds < MIN_TIME:
+        return None
+
+    return math.log(seconds / previous_seconds) / math.log(size / previous_size)
+
+
+def run(sizes=SIZES):
+    """Measures every step for every size and returns the results as rows (dicts)"""
+    rows = []
+    previous = {}
+    for size in sizes:
+        write_svg(SYNTHETIC_SVG, size)
+        try:
+            file_size = os.path.getsize(SYNTHETIC_SVG)
+            print("{} segments ({:.1f} KiB)".format(size, file_size / 1024))
+            for name, function in stages(SYNTHETIC_SVG):
+                seconds, peak = time_and_memory(function)
+                growth = None
+                if name in previous:
+                    growth = exponent(size, seconds, *previous[name])
+                previous[name] = (size, seconds)
+
+                print(
+                    "  {:<20} {:>10.2f} ms {:>8.2f} us/segment {:>12.1f} KiB{}".format(
+                        name,
+                        seconds * 1000,
+                        seconds / size * 1e6,
+                        peak / 1024,
+                        (
+                            ""
+                            if growth is None
+                            else " growth {:.2f}{}".format(
+                                growth, " (superlinear)" if growth > SUPERLINEAR else ""
+                            )
+                        ),
+                    )
+                )
+                rows.append(
+                    {
+                        "segments": size,
+                        "bytes": file_size,
+                        "stage": name,
+                        "seconds": seconds,
+                        "peak_bytes": peak,
+                        "growth": "" if growth is None else growth,
+                    }
+                )
+        finally:
+            os.remove(SYNTHETIC_SVG)
+
+    return rows
+
+
+def main(max_segments=SIZES[-1], results_path=RESULTS):
+    """Runs the scaling benchmarks and writes the results to a CSV file"""
+    rows = run([size for size in SIZES if size <= max_segments])
+    with open(results_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print("The results were written to {}".format(results_path))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]], *sys.argv[2:3])
@@ -0,0 +1,76 @@
+"""
+Benchmarks for the simulated drive bases.
+
+Draws the sample svgs with the robot and a HeadlessTurtle (which drives one sample
+at a time) and an EventTurtle (which jumps between control events) at different
+sampling frequencies. Prints the time it takes to simulate the whole job and the
+drive loops, and the distance between where the two simulations end up.
+
+Run from the "Del 2" directory: python -m bench.simulation
+"""
+import math
+import os
+import time
+
+from app.svg.parsing import parse_drawing
+from bench.parsing import SAMPLE_SVGS
+from robot.robot import Robot
+from turtle_sim import EventTurtle, HeadlessTurtle, simulate_drawing
+
+
+class TimedRobot(Robot):
+    """A robot that measures the time spent in its drive loops (in loop_time)"""
+
+    loop_time = 0
+
+    def follow_schedule(self, schedule):
+        start = time.perf_counter()
+        super().follow_schedule(schedule)
+        TimedRobot.loop_time += time.perf_counter() - start
+
+
+def simulate(drawing, drive_base_class, sampling_freq):
+    """
+    Draws a drawing with a simulated robot. Returns the drive base, the time it
+    took and the time spent in the drive loops
+    """
+    TimedRobot.loop_time = 0
+    start_time = time.perf_counter()
+    drive_base = simulate_drawing(
+        drawing,
+        robot_class=TimedRobot,
+        drive_base_class=drive_base_class,
+        sampling_freq=sampling_freq,
+    )
+
+    return drive_base, time.perf_counter() - start_time, TimedRobot.loop_time
+
+
+def main(sampling_freqs=(250, 1000, 10000)):
+    """Runs the simulation benchmarks"""
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        drawing = parse_drawing(SAMPLE_SVGS + file_name)
+        print(file_name)
+        for sampling_freq in sampling_freqs:
+            fixed, fixed_time, fixed_loops = simulate(
+                drawing, HeadlessTurtle, sampling_freq
+            )
+            events, events_time, events_loops = simulate(
+                drawing, EventTurtle, sampling_freq
+            )
+            print(
+                "  {:>6} Hz: job {:>7.3f} -> {:.3f} s, loops {:>7.3f} -> {:.3f} s "
+                "({:>5.1f}x), {:.1e} mm apart".format(
+                    sampling_freq,
+                    fixed_time,
+                    events_time,
+                    fixed_loops,
+                    events_loops,
+                    fixed_loops / events_loops,
+                    math.hypot(fixed.x - events.x, fixed.y - events.y),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark of how long the commands of main.py take to import what they use.
+
+Importing (and compiling) modules is slow on the brick, so every command of
+main.py imports the modules it uses when it runs. The imports of every command
+are run in a new python process with -X importtime, which reports the time of
+every imported module, and the fastest of a few runs is kept. Modules imported
+when python starts are not counted.
+
+Budget: the imports of every command must take less than BUDGETS (in ms, on
+CPython on a pc, with the modules already compiled to .pyc files), and must not
+import the packages in FORBIDDEN. Importing main.py alone (help) must not import
+anything, and play must not import the parser and the planner (app). The brick is
+much slower, but the time grows with the same modules. Raise a budget on purpose,
+in the same commit as the imports that need it.
+
+Run from the "Del 2" directory: python -m bench.startup [repeats]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+# Directory main.py is imported from
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statement with the imports of every command
+COMMANDS = {
+    "help": "import main",
+    "play": "import main, robot.config, robot.player",
+    "compile": (
+        "import main, app.svg.parsing, app.planning.travel, robot.config, "
+        "robot.plan, robot.robot"
+    ),
+    "main": (
+        "import main, app.svg.parsing, app.planning.travel, robot.config, "
+        "robot.metrics, robot.robot"
+    ),
+}
+
+# Max import time (in ms) of every command
+BUDGETS = {
+    "help": 5,
+    "play": 25,
+    "compile": 60,
+    "main": 60,
+}
+
+# Packages every command must not import
+FORBIDDEN = {
+    "help": ("app", "robot", "re"),
+    "play": ("app", "re"),
+}
+
+# Number of times the imports of every command are timed
+REPEATS = 5
+
+# Number of modules with the longest import time printed for every command
+SHOWN = 8
+
+
+def import_times(statement, cache):
+    """
+    Runs a statement in a new python process and returns the time (in us) it took
+    to import every module it imported, as a list of (module, self, cumulative).
+    The compiled modules are written to and read from the cache directory.
+    """
+    environment = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return times
+
+
+def measure(statement, repeats=REPEATS):
+    """
+    Returns the module times (see import_times) of the fastest of repeats runs of a
+    statement, without the modules python imports when it starts. The statement is
+    run once before it is timed, to compile the modules.
+    """
+    with tempfile.TemporaryDirectory() as cache:
+        import_times(statement, cache)
+        startup = {module for module, _, _ in import_times("pass", cache)}
+
+        fastest = None
+        for _ in range(repeats):
+            times = [
+                row for row in import_times(statement, cache) if row[0] not in startup
+            ]
+            if fastest is None or total(times) < total(fastest):
+                fastest = times
+
+    return fastest
+
+
+def total(times):
+    """Returns the total import time (in ms) of the module times"""
+    return sum(self_us for _, self_us, _ in times) / 1000
+
+
+def forbidden_imports(command, times):
+    """Returns the modules a command imports from the packages it must not import"""
+    return [
+        module
+        for module, _, _ in times
+        if module.split(".")[0] in FORBIDDEN.get(command, ())
+    ]
+
+
+def main(repeats=REPEATS):
+    """
+    Measures the imports of every command and prints the modules that take the
+    longest. Returns an exit code, 1 if a command is over its budget or imports a
+    package it must not
+    """
+    failures = []
+    for command, statement in COMMANDS.items():
+        times = measure(statement, repeats)
+        milliseconds = total(times)
+        print(
+            "{:<8} {:>4} modules {:>8.2f} ms (budget {} ms)".format(
+                command, len(times), milliseconds, BUDGETS[command]
+            )
+        )
+        slowest = sorted(times, key=lambda row: -row[1])[:SHOWN]
+        for module, self_us, cumulative_us in slowest:
+            print(
+                "  {:<40} {:>8.2f} ms {:>8.2f} ms cumulative".format(
+                    module, self_us / 1000, cumulative_us / 1000
+                )
+            )
+
+        if milliseconds > BUDGETS[command]:
+            failures.append(
+                "{} takes {:.2f} ms to import, over the budget of {} ms".format(
+                    command, milliseconds, BUDGETS[command]
+                )
+            )
+
+        forbidden = forbidden_imports(command, times)
+        if forbidden:
+            failures.append(
+                "{} imports {}".format(command, ", ".join(sorted(forbidden)))
+            )
+
+    for failure in failures:
+        print("Startup: {}".format(failure))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,314 @@
+"""
+Benchmark suite with regression thresholds.
+
+Times parsing every sample svg, building the look-up tables and calling get_t and
+get_curvature for every kind of curve, and a full simulated Robot job. Every
+benchmark is repeated and the median and 95th percentile are reported. The
+results are written as JSON and compared with a stored baseline.
+
+The fastest runs are compared relative to a calibration benchmark (a plain python
+loop), so a baseline recorded on one computer can be used on another.
+
+Run from the "Del 2" directory: python -m bench.suite [results.json] [update]
+or: python main.py bench [results.json] [update]
+"""
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+from app.abc import NonLinearCurve
+from app.svg.parsing import parse_drawing
+from bench.parsing import SAMPLE_SVGS
+from robot.config import DRAWING_LEN, LUT_TOLERANCE
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+RESULTS = "bench_results.json"
+
+# Number of times every benchmark is timed
+REPEATS = 15
+
+# Min time (in seconds) of one timed run, short benchmarks are called several times
+# per run (like timeit)
+MIN_TIME = 0.02
+
+# A benchmark regresses when its fastest run (relative to the calibration) is this
+# many times slower than in the baseline. The fastest run is used because other
+# programs running at the same time can only make a run slower. Stored in the
+# baseline, so it can be changed there
+THRESHOLD = 2
+
+# Number of get_t and get_curvature calls per curve
+CALLS = 20
+
+# File drawn by the robot job benchmark
+JOB_SVG = SAMPLE_SVGS + "smiley.svg"
+
+
+def calibration():
+    """A plain python loop, used to compare times measured on different computers"""
+    total = 0
+    for i in range(200000):
+        total += i * i % 7
+
+    return total
+
+
+def calls_per_run(function):
+    """
+    Returns the number of calls of a function needed to run for at least MIN_TIME.
+    The function is called once to measure it, which also warms up caches.
+    """
+    start = time.perf_counter()
+    function()
+    return max(int(MIN_TIME / max(time.perf_counter() - start, 1e-9)), 1)
+
+
+def time_run(function, calls):
+    """
+    Returns the time (in seconds) per call of calling a function calls times.
+    The garbage collector is disabled meanwhile (like timeit), so collecting the
+    garbage of one benchmark does not slow down another.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+
+        return (time.perf_counter() - start) / calls
+    finally:
+        gc.enable()
+
+
+def percentile(sorted_times, fraction):
+    """Returns the value below which fraction of the sorted times are"""
+    return sorted_times[max(int(math.ceil(fraction * len(sorted_times))) - 1, 0)]
+
+
+def curves_by_type():
+    """
+    Returns a dict from the name of a kind of curve to every curve of that kind in
+    the sample svgs (that is not empty), and the tolerance of their look-up tables
+    """
+    curves = {}
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        drawing = parse_drawing(SAMPLE_SVGS + file_name)
+        tolerance = LUT_TOLERANCE / drawing.scale_for(DRAWING_LEN)
+        for path in drawing:
+            for curve in path:
+                if curve.length() == 0:
+                    continue
+                curves.setdefault(type(curve).__name__, []).append((curve, tolerance))
+
+    return curves
+
+
+def build_luts(curves):
+    """Builds the adaptive look-up table of every curve"""
+    for curve, tolerance in curves:
+        curve.generate_adaptive_lut(tolerance)
+
+
+def follow_curves(curves, method):
+    """Calls method CALLS times along every curve (get_t or get_curvature)"""
+    for curve, _ in curves:
+        length = curve.length()
+        for i in range(CALLS):
+            method(curve, length * i / CALLS)
+
+
+def get_t(curve, traversed_length):
+    """Finds the t value at a traversed length"""
+    return curve.get_t(traversed_length)
+
+
+def get_curvature(curve, traversed_length):
+    """Finds the curvature at a traversed length"""
+    return curve.get_curvature(curve.get_t(traversed_length))
+
+
+def robot_job(file_name=JOB_SVG):
+    """Draws an svg file with the robot and a simulated drive base"""
+    # Imported here, because turtle_sim needs numpy
+    from turtle_sim import simulate_drawing  # pylint: disable=import-outside-toplevel
+
+    simulate_drawing(parse_drawing(file_name))
+
+
+def benchmarks():
+    """Returns a list of the name of every benchmark, its function and operations"""
+    result = [("calibration", calibration, 1)]
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        result.append(
+            (
+                "parse/{}".format(file_name),
+                lambda svg=SAMPLE_SVGS + file_name: parse_drawing(svg),
+                1,
+            )
+        )
+
+    for name, curves in sorted(curves_by_type().items()):
+        for curve, tolerance in curves:
+            curve.set_lut_tolerance(tolerance)
+
+        if issubclass(type(curves[0][0]), NonLinearCurve):
+            result.append(
+                ("lut/{}".format(name), lambda c=curves: build_luts(c), len(curves))
+            )
+
+        for method in (get_t, get_curvature):
+            result.append(
+                (
+                    "{}/{}".format(method.__name__, name),
+                    lambda c=curves, m=method: follow_curves(c, m),
+                    CALLS * len(curves),
+                )
+            )
+
+    result.append(("robot/{}".format(os.path.basename(JOB_SVG)), robot_job, 1))
+    return result
+
+
+def run(repeats=REPEATS, names=None):
+    """
+    Runs every benchmark (or the calibration and the benchmarks in names) and
+    returns the results (a dict that is saved as JSON).
+
+    The benchmarks are run in rounds, one run of every benchmark per round, so a
+    period where the computer is slower affects all of them.
+    """
+    selected = [
+        (name, function, operations, calls_per_run(function))
+        for name, function, operations in benchmarks()
+        if names is None or name == "calibration" or name in names
+    ]
+
+    times = {name: [] for name, _, _, _ in selected}
+    for _ in range(repeats):
+        for name, function, _, calls in selected:
+            times[name].append(time_run(function, calls))
+
+    results = {}
+    for name, _, operations, calls in selected:
+        runs = sorted(times[name])
+        results[name] = {
+            "min": runs[0],
+            "median": percentile(runs, 0.5),
+            "p95": percentile(runs, 0.95),
+            "operations": operations,
+            "calls": calls,
+            "repeats": repeats,
+        }
+
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "threshold": THRESHOLD,
+        "benchmarks": results,
+    }
+
+
+def regressions(results, baseline):
+    """
+    Returns the name, relative time and relative baseline time of every benchmark
+    whose fastest run is more than threshold times slower than in the baseline.
+    The times are relative to the fastest run of the calibration benchmark.
+    """
+    threshold = baseline.get("threshold", THRESHOLD)
+    current = results["benchmarks"]
+    previous = baseline["benchmarks"]
+    current_unit = current["calibration"]["min"]
+    previous_unit = previous["calibration"]["min"]
+
+    slower = []
+    for name, result in current.items():
+        if name == "calibration" or name not in previous:
+            continue
+
+        relative = result["min"] / current_unit
+        relative_baseline = previous[name]["min"] / previous_unit
+        if relative > threshold * relative_baseline:
+            slower.append((name, relative, relative_baseline))
+
+    return slower
+
+
+def report(results, baseline=None):
+    """Prints the results, and how they compare with the baseline"""
+    unit = results["benchmarks"]["calibration"]["min"]
+    for name, result in results["benchmarks"].items():
+        line = "{:<34} median {:>9.3f} ms p95 {:>9.3f} ms {:>10.2f} us/op".format(
+            name,
+            result["median"] * 1000,
+            result["p95"] * 1000,
+            result["median"] / result["operations"] * 1e6,
+        )
+        if baseline is not None and name in baseline["benchmarks"]:
+            previous = (
+                baseline["benchmarks"][name]["min"]
+                / baseline["benchmarks"]["calibration"]["min"]
+            )
+            line += " {:>6.2f}x baseline".format(result["min"] / unit / previous)
+
+        print(line)
+
+
+def main(results_path=RESULTS, update=None):
+    """
+    Runs the benchmark suite and writes the results to results_path. Returns an
+    exit code, 1 if a benchmark regressed past the baseline or there is no baseline.
+
+    If update is "update", the results are stored as the new baseline instead.
+    """
+    if update != "update" and not os.path.exists(BASELINE):
+        print(
+            "There is no baseline at {}, record one with: python -m bench.suite "
+            "{} update".format(BASELINE, results_path)
+        )
+        return 1
+
+    results = run()
+    if update == "update":
+        with open(results_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+        report(results)
+        with open(BASELINE, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print("The baseline was written to {}".format(BASELINE))
+        return 0
+
+    with open(BASELINE, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    slower = regressions(results, baseline)
+    if slower:
+        # Other programs may have slowed the benchmarks down, so they are run again
+        rerun = run(names=[name for name, _, _ in slower])
+        for name, result in rerun["benchmarks"].items():
+            previous = results["benchmarks"][name]
+            previous["min"] = min(previous["min"], result["min"])
+        slower = regressions(results, baseline)
+
+    with open(results_path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    report(results, baseline)
+    for name, relative, relative_baseline in slower:
+        print(
+            "Regression: {} is {:.2f}x slower than the baseline".format(
+                name, relative / relative_baseline
+            )
+        )
+
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:3]))
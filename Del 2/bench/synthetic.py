@@ -0,0 +1,258 @@
+"""
+Generates synthetic svg files of a chosen size, used to measure how the parser,
+the paths and the planner scale with the size of a drawing.
+
+The path data is random, but the same seed always gives the same file. The mix of
+commands, how often they are relative and the formats the numbers are written in
+can be chosen.
+
+Run from the "Del 2" directory:
+python -m bench.synthetic file_name [segments] [paths] [seed]
+"""
+import random
+import sys
+
+# Relative weight of every command, every command but M draws one segment
+MIX = {"M": 1, "L": 4, "H": 1, "V": 1, "C": 4, "S": 2, "Q": 2, "T": 1, "A": 1, "Z": 1}
+
+# Number of points given by every command (H and V give one coordinate instead)
+POINTS = {"M": 1, "L": 1, "T": 1, "Q": 2, "S": 2, "C": 3, "A": 1}
+
+# The formats numbers are written in (used in turn for every path):
+# fixed: 12.500000,-3.000000 (pairs separated by commas, like inkscape)
+# short: 12.5 -3
+# compact: no zeros or separators that are not needed (ex: L12.5-3.5.5)
+# exponent: 1.2500e+01 -3.0000e+00
+FORMATS = ("fixed", "short", "compact", "exponent")
+
+# Size (width and height) of the area the positions are in
+SIZE = 1000
+
+# Max distance along each axis between a position and the next
+STEP = 50
+
+# Number of segments in every path element, if the number of paths is not given
+SEGMENTS_PER_PATH = 100
+
+
+class PathDataGenerator:  # pylint: disable=too-many-instance-attributes
+    """
+    Generates random path data (the d attribute of a path) from a seed.
+
+    mix is the relative weight of every command (see MIX), relative is the
+    probability that a command is relative, implicit is the probability that the
+    letter of a command is left out when the previous command has the same letter
+    (ex: L 1 2 3 4) and formats are the number formats that are used (see FORMATS).
+
+    The positions only depend on the seed and the mix, so the same drawing can be
+    written in different ways.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, seed=0, mix=None, relative=0.5, implicit=0.5, formats=FORMATS
+    ):
+        mix = MIX if mix is None else mix
+        if not any(mix.get(command, 0) > 0 for command in "LHVCSQTA"):
+            raise ValueError("The mix needs a command that draws a segment")
+
+        unknown = [name for name in formats if name not in FORMATS]
+        if unknown or len(formats) == 0:
+            raise ValueError("Unknown number formats {}".format(unknown))
+
+        self.random = random.Random(seed)
+        self.commands = [command for command in mix if mix[command] > 0]
+        self.weights = [mix[command] for command in self.commands]
+        self.relative = relative
+        self.implicit = implicit
+        self.formats = formats
+
+        self.number_format = formats[0]
+        self.path_count = 0
+        self.position = (0, 0)
+        self.start = (0, 0)
+
+        # The last token written (text and if it is an arc flag)
+        self.last = ("", False)
+
+    def path_data(self, segments):
+        """Returns the path data of a path that draws the given number of segments"""
+        self.number_format = self.formats[self.path_count % len(self.formats)]
+        self.path_count += 1
+        self.last = ("", False)
+
+        parts = [self._format("M", self._command("M", False))]
+        previous = "M"
+        subpath_segments = 0
+        count = 0
+        while count < segments:
+            command = self.random.choices(self.commands, self.weights)[0]
+
+            # Only moves to a new subpath or closes it after drawing a segment
+            if subpath_segments == 0 and command in "MZ":
+                continue
+
+            relative = self.random.random() < self.relative
+            implicit = self.random.random() < self.implicit
+            letter = command.lower() if relative else command
+
+            # Repeated inputs after a moveto are linetos
+            repeated = letter == previous or letter == {"M": "L", "m": "l"}.get(
+                previous
+            )
+            groups = self._command(command, relative)
+            if repeated and implicit and command not in "MZ":
+                parts.append(self._format("", groups))
+            else:
+                parts.append(self._format(letter, groups))
+                previous = letter
+
+            if command == "M":
+                subpath_segments = 0
+            else:
+                subpath_segments = 0 if command == "Z" else subpath_segments + 1
+                count += 1
+
+        return "".join(parts)
+
+    def _command(self, command, relative):
+        """
+        Returns the inputs of a command that starts at the current position as a list
+        of groups (tuples) of numbers, and moves to the end of the command.
+        The flags of arcs are ints.
+        """
+        x, y = self.position
+        if command == "Z":
+            self.position = self.start
+            return []
+
+        if command == "H":
+            end = (self._coordinate(x), y)
+            groups = [(round(end[0] - x, 2) if relative else end[0],)]
+        elif command == "V":
+            end = (x, self._coordinate(y))
+            groups = [(round(end[1] - y, 2) if relative else end[1],)]
+        else:
+            groups = [self._point() for _ in range(POINTS[command])]
+            end = groups[-1]
+            if relative:
+                groups = [(round(px - x, 2), round(py - y, 2)) for px, py in groups]
+
+        if command == "A":
+            radii = (
+                round(self.random.uniform(STEP / 4, STEP), 2),
+                round(self.random.uniform(STEP / 4, STEP), 2),
+            )
+            rotation = round(self.random.uniform(0, 360), 1)
+            large_arc = self.random.randint(0, 1)
+            sweep = self.random.randint(0, 1)
+            groups = [radii, (rotation,), (large_arc,), (sweep,)] + groups
+
+        self.position = end
+        if command == "M":
+            self.start = end
+
+        return groups
+
+    def _coordinate(self, value):
+        """Returns a coordinate at least 1 away from value, inside the area"""
+        delta = self.random.uniform(1, STEP) * self.random.choice((-1, 1))
+        if not 0 <= value + delta <= SIZE:
+            delta = -delta
+
+        return round(value + delta, 2)
+
+    def _point(self):
+        """Returns a position near the current position"""
+        return self._coordinate(self.position[0]), self._coordinate(self.position[1])
+
+    def _number(self, value):
+        """Writes a number in the current number format"""
+        if isinstance(value, int):
+            return str(value)
+
+        if self.number_format == "fixed":
+            return "{:.6f}".format(value + 0.0)
+
+        if self.number_format == "exponent":
+            return "{:.4e}".format(value + 0.0)
+
+        text = "{:.2f}".format(value + 0.0).rstrip("0").rstrip(".")
+        if self.number_format == "compact":
+            if text.startswith("0."):
+                text = text[1:]
+            elif text.startswith("-0."):
+                text = "-" + text[2:]
+
+        return text
+
+    def _format(self, letter, groups):
+        """Writes a command (letter is empty for an implicit command)"""
+        compact = self.number_format == "compact"
+        text = ""
+        if letter:
+            text = letter if compact or not self.last[0] else " " + letter
+            self.last = (letter, False)
+
+        for group in groups:
+            for index, value in enumerate(group):
+                number = self._number(value)
+                last_text, last_flag = self.last
+                if compact:
+                    joined = (
+                        last_text.isalpha()
+                        or last_flag
+                        or number[0] == "-"
+                        or (number[0] == "." and "." in last_text)
+                    )
+                    separator = "" if joined else " "
+                elif index == 1 and self.number_format == "fixed":
+                    separator = ","
+                else:
+                    separator = " "
+
+                text += separator + number
+                self.last = (number, isinstance(value, int))
+
+        return text
+
+
+def write_svg(  # pylint: disable=too-many-arguments
+    file_name, segments, paths=None, seed=0, mix=None, **options
+):
+    """
+    Writes an svg file with the given number of path elements (one for every
+    SEGMENTS_PER_PATH segments by default), that draw the given number of segments
+    in total (spread evenly between the paths).
+
+    The path data is made by a PathDataGenerator, the seed, mix and options
+    (relative, implicit and formats) are passed on to it.
+    """
+    generator = PathDataGenerator(seed, mix, **options)
+    if paths is None:
+        paths = segments // SEGMENTS_PER_PATH
+    paths = max(min(paths, segments), 1)
+
+    with open(file_name, "w", encoding="utf-8") as file:
+        file.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{0}" '
+            'viewBox="0 0 {0} {0}">\n'.format(SIZE)
+        )
+        for index in range(paths):
+            path_segments = segments // paths + (index < segments % paths)
+            file.write(
+                '  <path style="fill:none;stroke:#000000" d="{}" />\n'.format(
+                    generator.path_data(path_segments)
+                )
+            )
+
+        file.write("</svg>\n")
+
+
+def main(file_name, segments=1000, paths=None, seed=0):
+    """Writes a synthetic svg file"""
+    write_svg(file_name, segments, paths, seed)
+    print("Wrote {} segments to {}".format(segments, file_name))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], *[int(arg) for arg in sys.argv[2:5]])
@@ -0,0 +1,64 @@
+"""
+Benchmarks for the pen-up travel optimizer.
+
+Prints the distance driven with the pen lifted before and after the paths are
+reordered, for the sample svgs and for synthetic drawings with many short paths.
+
+Run from the "Del 2" directory: python -m bench.travel
+"""
+import os
+import random
+import time
+
+from app.planning import optimize_travel, travel_distance
+from app.point import Point
+from app.svg import Path
+from app.svg.parsing import parse_drawing
+from bench.parsing import SAMPLE_SVGS
+
+
+def synthetic_paths(count, size=1000, seed=0):
+    """Returns count short lines spread at random over a size x size square"""
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(count):
+        start = Point(rng.uniform(0, size), rng.uniform(0, size))
+        path = Path(start)
+        path.append_curve([start + Point(rng.uniform(-5, 5), rng.uniform(-5, 5))])
+        paths.append(path)
+
+    return paths
+
+
+def report(name, paths, start_position):
+    """Prints the pen-up travel before and after optimizing the order of the paths"""
+    start = time.perf_counter()
+    optimized = optimize_travel(paths, start_position)
+    elapsed = time.perf_counter() - start
+
+    before = travel_distance(paths, start_position)
+    after = travel_distance(optimized, start_position)
+    print(
+        "{:<28} {:>6} paths {:>12.1f} -> {:>10.1f} ({:>5.1f} %) in {:.3f} s".format(
+            name,
+            len(paths),
+            before,
+            after,
+            100 * (1 - after / before) if before else 0,
+            elapsed,
+        )
+    )
+
+
+def main(synthetic_counts=(1000, 10000)):
+    """Runs the travel benchmarks"""
+    for file_name in sorted(os.listdir(SAMPLE_SVGS)):
+        drawing = parse_drawing(SAMPLE_SVGS + file_name)
+        report(file_name, drawing.paths, drawing.min_position)
+
+    for count in synthetic_counts:
+        report("synthetic", synthetic_paths(count), Point(0, 0))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,60 @@
 #!/usr/bin/env pybricks-micropython
-"""Entrypoint file"""
+"""
+Entrypoint file
+
+Every command imports the modules it uses when it runs, because importing modules
+is slow on the brick (see bench/startup.py for the import time budget). The
+modules of the robot package are imported directly (robot.robot and not robot),
+so the parser and the planner are only imported by the commands that use them.
+"""
 import sys
-import re
-
-from app.svg.parsing import parse_svg
-from app.point import Point
-from robot import Robot
-from robot.config import DRAWING_LEN
 
 SAMPLE_SVGS = "app/svg/sample_svgs/"
 
 
 def main():
     """Program entrypoint - Here comes the main logic"""
+    # pylint: disable=import-outside-toplevel
+    from app.svg.parsing import parse_drawing
+    from robot import config
+    from robot.metrics import JobMetrics
+    from robot.robot import Robot
+
+    # pylint: enable=import-outside-toplevel
+
+    metrics = JobMetrics()
 
     print("Parsing SVG-file")
-    paths = parse_svg(SAMPLE_SVGS + "triangle.svg")
+    with metrics.phase("parse"):
+        drawing = parse_drawing(SAMPLE_SVGS + "triangle.svg")
 
     # Debugging
     print("File fully parsed.")
-    print("Finding min and max positions of the path...")
+    print(
+        "The max point is ({}, {}) ".format(
+            drawing.max_position.x, drawing.max_position.y
+        )
+        + "and the min point is ({}, {})".format(
+            drawing.min_position.x, drawing.min_position.y
+        )
+    )
 
-    # Finds min position of the paths
-    min_x = min(path.min_position.x for path in paths)
-    min_y = min(path.min_position.y for path in paths)
+    scale = drawing.scale_for(config.DRAWING_LEN)
+    print("The scale is: {:.3f}".format(scale))
 
-    # Finds max position of the paths
-    max_x = max(path.max_position.x for path in paths)
-    max_y = max(path.max_position.y for path in paths)
+    with metrics.phase("plan"):
+        paths = plan_paths(drawing)
 
-    print("Found min and max positions of the paths")
-    print(
-        "The max point is ({}, {}) ".format(max_x, max_y)
-        + "and the min point is ({}, {})".format(min_x, min_y)
-    )
+    tracer = None
+    if config.LOOP_TRACE_CAPACITY:
+        from robot.tracer import Tracer  # pylint: disable=import-outside-toplevel
 
-    print(
-        "The scale is: {:.3f}".format(DRAWING_LEN / max(max_x - min_x, max_y - min_y))
-    )
+        tracer = Tracer(config.LOOP_TRACE_CAPACITY)
 
     print("Initializing robot...")
     print("Check pen motor if initializing does not work")
     robot = Robot(
-        scale=DRAWING_LEN / max(max_x - min_x, max_y - min_y),
-        start_pos=Point(min_x, min_y),
+        scale=scale, start_pos=drawing.min_position, tracer=tracer, metrics=metrics
     )
     print("Done.")
 
@@ -53,6 +64,95 @@ def main():
         robot.drive_through_path(path, drawing=True)
 
     print("All paths completed.")
+    metrics.report(config.JOB_METRICS)
+
+    if tracer is not None:
+        tracer.dump(config.LOOP_TRACE)
+        print("The drive loop trace was written to {}".format(config.LOOP_TRACE))
+
+
+def plan_paths(drawing):
+    """
+    Returns the paths of a drawing in the order (and direction) that minimizes the
+    distance driven with the pen lifted, starting at the min position of the drawing.
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.planning.travel import optimize_travel, travel_distance
+
+    # pylint: enable=import-outside-toplevel
+
+    print("Optimizing the order of the paths...")
+    paths = optimize_travel(drawing, start_position=drawing.min_position)
+    print(
+        "Pen-up travel: {:.1f} before and {:.1f} after".format(
+            travel_distance(drawing, drawing.min_position),
+            travel_distance(paths, drawing.min_position),
+        )
+    )
+
+    return paths
+
+
+def compile(
+    file_path=SAMPLE_SVGS + "triangle.svg", plan_path=None
+):  # pylint: disable=redefined-builtin
+    """
+    Used to compile an svg file on a pc to a motion plan the robot plays without
+    parsing or planning anything (see robot/plan.py and the play command)
+
+    The files can be manually specified by passing the paths (relative or absolute),
+    the plan is written to PLAN in robot/config.py by default
+    """
+    # pylint: disable=import-outside-toplevel
+    import os
+    from app.svg.parsing import parse_drawing
+    from robot.config import DRAWING_LEN, PLAN
+    from robot.plan import PlanRecorder
+    from robot.robot import Robot
+
+    # pylint: enable=import-outside-toplevel
+
+    plan_path = plan_path or PLAN
+    drawing = parse_drawing(file_path)
+    paths = plan_paths(drawing)
+
+    with open(plan_path, "wb") as file:
+        recorder = PlanRecorder(file)
+        robot = Robot(
+            scale=drawing.scale_for(DRAWING_LEN),
+            start_pos=drawing.min_position,
+            _drive_base=recorder,
+            _pen_motor=None,
+        )
+        for path in paths:
+            robot.drive_through_path(path, drawing=True)
+
+    print(
+        "{} commands ({:.1f} KiB) were written to {}".format(
+            recorder.records, os.path.getsize(plan_path) / 1024, plan_path
+        )
+    )
+
+
+def play(plan_path=None):
+    """
+    Used to draw a motion plan compiled with the compile command on the robot
+
+    The file can be manually specified by passing the path (relative or absolute),
+    PLAN in robot/config.py is played by default. Running main.py without a command
+    (like from the brick menu) plays PLAN if it exists, and draws with main otherwise.
+    Compile the drawing on a pc and copy PLAN to the brick to start drawing at once.
+    """
+    # pylint: disable=import-outside-toplevel
+    from robot.config import PLAN
+    from robot.player import play as play_plan
+
+    # pylint: enable=import-outside-toplevel
+
+    print("Initializing robot...")
+    print("Check pen motor if initializing does not work")
+    records = play_plan(plan_path or PLAN)
+    print("All {} commands completed.".format(records))
 
 
 def plot(
@@ -68,8 +168,13 @@ def plot(
 
     The files can be manually specified by passing the path (relative or absolute)
     """
-    from app.utils import plotting  # pylint: disable=import-outside-toplevel
-    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+    # pylint: disable=import-outside-toplevel
+    import re
+    import matplotlib.pyplot as plt
+    from app.svg.parsing import parse_drawing
+    from app.utils import plotting
+
+    # pylint: enable=import-outside-toplevel
 
     if len(file_paths) > 4:
         print("Warning: This application only supports 4 plots at a time (max)")
@@ -79,7 +184,7 @@ def plot(
         for file_path in file_paths
     ]
 
-    svgs = [parse_svg(path) for path in file_paths[:4]]
+    svgs = [parse_drawing(path) for path in file_paths[:4]]
 
     _, axs = plt.subplots(2, 2)
     for i, coords in enumerate([(0, 0), (0, 1), (1, 0), (1, 1)]):
@@ -102,31 +207,34 @@ def turtle(file_path=SAMPLE_SVGS + "smiley.svg"):
 
     The file can be manually specified by passing the path (relative or absolute)
     """
-    from turtle_sim import Turtle  # pylint: disable=import-outside-toplevel
+    # pylint: disable=import-outside-toplevel
+    from app.svg.parsing import parse_drawing
+    from robot.config import DRAWING_LEN, JOB_METRICS
+    from robot.metrics import JobMetrics
+    from robot.robot import Robot
+    from turtle_sim import Turtle
+
+    # pylint: enable=import-outside-toplevel
+
+    metrics = JobMetrics()
 
     print("Parsing SVG-file")
-    paths = parse_svg(file_path)
+    with metrics.phase("parse"):
+        drawing = parse_drawing(file_path)
 
     # Debugging
     print("File fully parsed.")
-    print("Finding min and max positions of the path...")
+    with metrics.phase("plan"):
+        paths = plan_paths(drawing)
 
-    # Finds min position of the paths
-    min_x = min(path.min_position.x for path in paths)
-    min_y = min(path.min_position.y for path in paths)
-
-    # Finds max position of the paths
-    max_x = max(path.max_position.x for path in paths)
-    max_y = max(path.max_position.y for path in paths)
-
-    print("Found min and max positions of the paths")
     print("Initializing robot...")
     turtle_drivebase = Turtle()
     robot = Robot(
-        scale=DRAWING_LEN / max(max_x - min_x, max_y - min_y),
-        start_pos=Point(min_x, min_y),
+        scale=drawing.scale_for(DRAWING_LEN),
+        start_pos=drawing.min_position,
         _drive_base=turtle_drivebase,
         _pen_motor=None,
+        metrics=metrics,
     )
     print("Done.")
     print("Driving through paths...")
@@ -136,24 +244,173 @@ def turtle(file_path=SAMPLE_SVGS + "smiley.svg"):
         robot.drive_through_path(path, drawing=True)
 
     print("All paths completed.")
+    metrics.report(JOB_METRICS)
+
+
+def simulate(file_path=SAMPLE_SVGS + "smiley.svg", trace_path="trace.npz"):
+    """
+    Used to simulate the way the robot would drive through
+    an svg file without a window, using the EventTurtle
+
+    The path driven with the pen lowered is written to trace_path (a .npz file).
+    The files can be manually specified by passing the paths (relative or absolute)
+    """
+    # pylint: disable=import-outside-toplevel
+    import time
+    from app.svg.parsing import parse_drawing
+    from turtle_sim import simulate_drawing
+
+    # pylint: enable=import-outside-toplevel
+
+    drawing = parse_drawing(file_path)
+    paths = plan_paths(drawing)
+
+    print("Driving through paths...")
+    start_time = time.perf_counter()
+    drive_base = simulate_drawing(drawing, paths)
+    print(
+        "Simulated {:.1f} s of driving in {:.2f} s ({} samples, {} strokes)".format(
+            drive_base.time,
+            time.perf_counter() - start_time,
+            drive_base.samples,
+            drive_base.stroke_count,
+        )
+    )
+
+    drive_base.save(trace_path)
+    print("The trace was written to {}".format(trace_path))
+
+
+def accuracy(file_path=None, trace_path=None):  # pylint: disable=too-many-locals
+    """
+    Used to measure how closely the robot would follow svg files,
+    by simulating them with the EventTurtle (see app.utils.accuracy)
+
+    Measures every sample svg, or the svg file passed (relative or absolute).
+    If a trace_path is passed (a .npz file written by simulate), that trace is
+    measured instead of simulating the svg file, which then has to be the file
+    the trace was simulated from.
+    """
+    if trace_path is not None and file_path is None:
+        raise ValueError("A trace can only be measured with the svg file it drew")
+
+    # pylint: disable=import-outside-toplevel
+    import os
+    import numpy as np
+    from app.planning.travel import optimize_travel
+    from app.svg.parsing import parse_drawing
+    from app.utils.accuracy import SPACING, measure
+    from robot.config import DRAWING_LEN
+    from turtle_sim import simulate_drawing
+
+    # pylint: enable=import-outside-toplevel
+
+    if file_path is None:
+        file_paths = [SAMPLE_SVGS + name for name in sorted(os.listdir(SAMPLE_SVGS))]
+    else:
+        file_paths = [file_path]
+
+    for path in file_paths:
+        drawing = parse_drawing(path)
+        paths = optimize_travel(drawing, start_position=drawing.min_position)
+
+        driving_time = None
+        if trace_path is None:
+            drive_base = simulate_drawing(drawing, paths, trace_step=SPACING)
+            positions = np.stack(drive_base.trace()[1:3], axis=1)
+            driving_time = drive_base.time
+        else:
+            positions = np.load(trace_path)
+            positions = np.stack([positions["x"], positions["y"]], axis=1)
+
+        result = measure(positions, paths, drawing.scale_for(DRAWING_LEN))
+        print(
+            "{:<28} hausdorff {:>7.2f} mm, rms {:>6.2f} mm, ".format(
+                os.path.basename(path), result.hausdorff, result.rms
+            )
+            + "worst path {:>7.2f} mm".format(result.path_errors.max())
+            + (
+                ""
+                if driving_time is None
+                else ", driving {:.1f} s".format(driving_time)
+            )
+        )
+
+
+def trace(file_path=None):
+    """
+    Used to summarize a drive loop trace written by the robot (see robot/tracer.py)
+
+    Prints the loop frequency percentiles and jitter of every curve in the trace.
+    The file can be manually specified by passing the path (relative or absolute),
+    LOOP_TRACE in robot/config.py is summarized by default
+    """
+    # pylint: disable=import-outside-toplevel
+    from robot.config import LOOP_TRACE
+    from robot.tracer import loop_statistics, read_trace
+
+    # pylint: enable=import-outside-toplevel
+
+    rows = read_trace(file_path or LOOP_TRACE)
+    print("{} iterations".format(len(rows)))
+    for stats in loop_statistics(rows):
+        print(
+            "curve {:>5} {:>6} iterations {:>8.1f} mm ".format(
+                stats["curve"], stats["iterations"], stats["distance"]
+            )
+            + "p5 {:>7.1f} Hz p50 {:>7.1f} Hz p95 {:>7.1f} Hz ".format(
+                stats["p5_hz"], stats["p50_hz"], stats["p95_hz"]
+            )
+            + "jitter {:>8.1f} us max {:>7} us".format(
+                stats["jitter_us"], stats["max_period_us"]
+            )
+        )
 
 
 def profile(file_path=SAMPLE_SVGS + "Mediamodifier-Design.svg"):
     """
-    Used to profile the parse_svg function on an svg file using cProfile and snakeviz.
+    Used to profile the parse_drawing function on an svg file using cProfile and snakeviz.
 
-    The file can be manually by passing the path (relative or absolute)
+    The file can be manually by passing the path (relative or absolute), or a number
+    of segments to profile a synthetic svg file of that size (see bench/synthetic.py)
     """
-    import cProfile  # pylint: disable=import-outside-toplevel
-    import os  # pylint: disable=import-outside-toplevel
+    # pylint: disable=import-outside-toplevel
+    import cProfile
+    import os
+    from app.svg.parsing import parse_drawing
+
+    # pylint: enable=import-outside-toplevel
+
+    if file_path.isdigit():
+        from bench.synthetic import write_svg  # pylint: disable=import-outside-toplevel
+
+        segments = int(file_path)
+        file_path = "synthetic.svg"
+        write_svg(file_path, segments)
 
     profiler = cProfile.Profile()
-    profiler.runcall(parse_svg, file_path)
+    profiler.runcall(parse_drawing, file_path)
     profiler.dump_stats("latest.log")
 
     os.system('"{}" -m snakeviz latest.log'.format(sys.executable))
 
 
+def bench(results_path="bench_results.json", update=None):
+    """
+    Used to run the benchmark suite (see bench/suite.py)
+
+    The results are written to results_path (a JSON file) and compared with the
+    baseline in bench/baseline.json. Pass "update" after the results_path to store
+    the results as the new baseline instead.
+
+    Returns an exit code, 1 if a benchmark is slower than the baseline allows or
+    there is no baseline
+    """
+    from bench import suite  # pylint: disable=import-outside-toplevel
+
+    return suite.main(results_path, update)
+
+
 def test():
     """
     Used to run the tests
@@ -170,7 +427,19 @@ def help(func_name=None):  # pylint: disable=redefined-builtin
     Used to relay information about the different CLI commands
     to the user.
     """
-    funcs = [plot, turtle, profile, test, help]
+    funcs = [
+        compile,
+        play,
+        plot,
+        turtle,
+        simulate,
+        accuracy,
+        trace,
+        profile,
+        bench,
+        test,
+        help,
+    ]
     if func_name is None:
         for func in funcs:
             print("\n{}: {}".format(func.__name__, func.__doc__))
@@ -184,10 +453,38 @@ def help(func_name=None):  # pylint: disable=redefined-builtin
     print("The command {} does not exist".format(func_name))
 
 
+def start():
+    """Plays PLAN in robot/config.py if it exists, and draws with main otherwise"""
+    from robot.config import PLAN  # pylint: disable=import-outside-toplevel
+
+    try:
+        with open(PLAN, "rb"):
+            pass
+    except OSError:
+        main()
+        return
+
+    play(PLAN)
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         sys.exit(test())
 
+    if len(sys.argv) > 1 and sys.argv[1] == "compile":
+        try:
+            compile(*sys.argv[2:4])
+        except FileNotFoundError as e:
+            print(e)
+        sys.exit()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "play":
+        try:
+            play(*sys.argv[2:3])
+        except (OSError, ValueError) as e:
+            print(e)
+        sys.exit()
+
     if len(sys.argv) > 1 and sys.argv[1] == "plot":
         try:
             if len(sys.argv) > 2:
@@ -219,6 +516,30 @@ if __name__ == "__main__":
             print(e)
         sys.exit()
 
+    if len(sys.argv) > 1 and sys.argv[1] == "simulate":
+        try:
+            simulate(*sys.argv[2:4])
+        except FileNotFoundError as e:
+            print(e)
+        sys.exit()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "accuracy":
+        try:
+            accuracy(*sys.argv[2:4])
+        except (FileNotFoundError, ValueError) as e:
+            print(e)
+        sys.exit()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "trace":
+        try:
+            trace(*sys.argv[2:3])
+        except FileNotFoundError as e:
+            print(e)
+        sys.exit()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        sys.exit(bench(*sys.argv[2:4]))
+
     if len(sys.argv) > 1 and sys.argv[1] == "help":
         if len(sys.argv) > 2:
             help(func_name=sys.argv[2])
@@ -226,4 +547,4 @@ if __name__ == "__main__":
             help()
         sys.exit()
 
-    main()
+    start()
@@ -1,2 +1,7 @@
-"""The Robot class and related modules"""
-from robot.robot import Robot
+"""
+The Robot class and related modules
+
+The package does not import its modules, so importing robot.config or
+robot.player does not import the parser and the planner. Import the classes
+from their modules (ex: from robot.robot import Robot).
+"""
@@ -2,7 +2,7 @@
 """Functions used to calibrate the robot"""
 import math
 
-from robot import Robot
+from robot.robot import Robot
 from robot.config import SPEED
 
 bot = Robot(scale=1)
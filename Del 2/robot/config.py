@@ -18,6 +18,33 @@ ev3 = EV3Brick()
 SPEED = 50
 DRAWING_LEN = 600
 
+# Max error (in mm on the paper) of the look-up tables used to follow curves
+LUT_TOLERANCE = DRAWING_LEN / 1000
+
+# Speed profile (see app.planning.velocity). Speeds are in mm/s, accelerations
+# in mm/s^2 and jerk in mm/s^3. SPEED is still used to plan the turn rates.
+MAX_SPEED = 200
+MIN_SPEED = 30
+ACCELERATION = 200
+LATERAL_ACCELERATION = 80
+JERK = 1000
+
+# Max gap (in mm on the paper) and change of direction (in degrees) at a junction
+# between two curves that is driven through without stopping
+JUNCTION_GAP = 0.1
+JUNCTION_ANGLE = 1
+
+# Number of drive loop iterations kept by the tracer (see robot.tracer), 0 to not
+# trace the drive loop, and the file the trace is written to
+LOOP_TRACE_CAPACITY = 0
+LOOP_TRACE = "loop_trace.bin"
+
+# File the metrics of a drawing job (see robot.metrics) are written to
+JOB_METRICS = "job_metrics.json"
+
+# File a drawing is compiled to on a pc and played from on the brick (see robot.plan)
+PLAN = "plan.bin"
+
 # pen_motor
 TURN_SPEED = 100
 TURN_RATE = 300
@@ -0,0 +1,132 @@
+"""
+Counters and phase timers of a drawing job, used to see where the time of a job
+goes and to compare optimizations.
+"""
+from app.utils.timing import ticks_diff, ticks_us
+
+# Phases of a job, in the order they are reported
+PHASES = ("parse", "plan", "travel", "draw", "pen")
+
+
+class JobMetrics:  # pylint: disable=too-many-instance-attributes
+    """
+    The counters of a drawing job (distances in mm, angles in degrees) and the time
+    (in seconds) spent in every phase of it.
+
+    A phase is timed with "with metrics.phase(name):". Phases can be nested, the
+    time of the inner phase is not counted in the outer phase. The total time is
+    measured from when the metrics are created until they are reported.
+    """
+
+    def __init__(self, clock=ticks_us):
+        self.clock = clock
+        self.start = clock()
+
+        self.draw_distance = 0
+        self.travel_distance = 0
+        self.pen_lifts = 0
+        self.pen_engages = 0
+        self.turns = 0
+        self.turned = 0
+        self.curves = 0
+        self.paths = 0
+
+        # Time (in microseconds) of every phase, the phases that are being timed
+        # (the last one is counted) and when the last one was started or resumed
+        self.phase_times = {name: 0 for name in PHASES}
+        self.phases = []
+        self.mark = self.start
+
+    def phase(self, name):
+        """Starts timing a phase until the end of the with block"""
+        now = self.clock()
+        if self.phases:
+            self._add_time(self.phases[-1], now)
+
+        self.phases.append(name)
+        self.mark = now
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._add_time(self.phases.pop(), self.clock())
+
+    def _add_time(self, name, now):
+        """Adds the time since the mark to a phase, and moves the mark to now"""
+        self.phase_times[name] = self.phase_times.get(name, 0) + ticks_diff(
+            now, self.mark
+        )
+        self.mark = now
+
+    def total_time(self):
+        """Returns the time (in seconds) since the metrics were created"""
+        return ticks_diff(self.clock(), self.start) / 1000000
+
+    def to_dict(self):
+        """Returns the metrics as a dict (the times are in seconds)"""
+        total = self.total_time()
+        phases = {name: time / 1000000 for name, time in self.phase_times.items()}
+        return {
+            "draw_distance": self.draw_distance,
+            "travel_distance": self.travel_distance,
+            "pen_lifts": self.pen_lifts,
+            "pen_engages": self.pen_engages,
+            "turns": self.turns,
+            "turned": self.turned,
+            "curves": self.curves,
+            "paths": self.paths,
+            "total_time": total,
+            "phases": phases,
+            "other_time": total - sum(phases.values()),
+            "curves_per_second": self.curves / total if total > 0 else 0,
+        }
+
+    def summary(self):
+        """Returns a summary of the metrics (a list of lines)"""
+        metrics = self.to_dict()
+        lines = [
+            "Drawn {:.1f} mm, pen-up travel {:.1f} mm".format(
+                metrics["draw_distance"], metrics["travel_distance"]
+            ),
+            "Pen lifted {} times and lowered {} times".format(
+                metrics["pen_lifts"], metrics["pen_engages"]
+            ),
+            "Turned in place {} times, {:.1f} degrees in total".format(
+                metrics["turns"], metrics["turned"]
+            ),
+            "{} curves in {} paths, {:.2f} curves per second".format(
+                metrics["curves"], metrics["paths"], metrics["curves_per_second"]
+            ),
+        ]
+
+        total = metrics["total_time"]
+        times = list(metrics["phases"].items()) + [("other", metrics["other_time"])]
+        for name, time in times:
+            lines.append(
+                "  {:<8} {:>9.2f} s {:>5.1f} %".format(
+                    name, time, 100 * time / total if total > 0 else 0
+                )
+            )
+        lines.append("  {:<8} {:>9.2f} s".format("total", total))
+
+        return lines
+
+    def report(self, file_name):
+        """Prints the summary and writes the metrics to a JSON file"""
+        # Imported here, so drawing does not wait for it on the brick
+        # pylint: disable=import-outside-toplevel
+        try:
+            import json
+        except ImportError:  # micropython might only have ujson
+            import ujson as json  # pylint: disable=import-error
+        # pylint: enable=import-outside-toplevel
+
+        for line in self.summary():
+            print(line)
+
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+
+        print("The job metrics were written to {}".format(file_name))
@@ -0,0 +1,142 @@
+"""
+Compact binary motion plans, compiled on a pc and played on the brick.
+
+Parsing an svg file and planning how to drive through it is slow on the brick, so
+a pc drives a Robot with a PlanRecorder as its drive base, which writes every
+command the robot gives to a plan file. The brick only has to read the commands
+and give them to its drive base again (see robot.player).
+
+A plan file starts with a header (magic and version) followed by one record per
+command, in little endian. Every record has an opcode and three values:
+    RESET                               resets the driven distance
+    DRIVE (distance, speed, turn_rate)  drives with the speed (mm/s) and turn
+                                        rate (deg/s) once the driven distance
+                                        (mm) reaches distance
+    STOP (distance)                     stops once the driven distance reaches
+                                        distance
+    STRAIGHT (distance)                 drives distance (mm) straight
+    TURN (angle)                        turns angle (deg) in place
+    PEN_UP, PEN_DOWN                    lifts or lowers the pen
+"""
+import struct
+
+MAGIC = b"PLAN"
+VERSION = 1
+HEADER = "<4sH"
+RECORD = "<Bfff"
+HEADER_SIZE = struct.calcsize(HEADER)
+RECORD_SIZE = struct.calcsize(RECORD)
+
+RESET = 0
+DRIVE = 1
+STOP = 2
+STRAIGHT = 3
+TURN = 4
+PEN_UP = 5
+PEN_DOWN = 6
+
+
+class PlanRecorder:  # pylint: disable=too-many-instance-attributes
+    """
+    A drive base that writes the commands it is given to a binary stream (a file
+    opened in binary mode) instead of driving.
+
+    The robot tells the recorder where the parts of a schedule start (see expect),
+    so distance returns the start of the next part, and the robot gives exactly
+    one command per part.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.records = 0
+
+        self.pen_down = False
+        self.distance_traveled = 0
+        self.events = ()
+        self.event_index = 0
+        self.events_length = 0
+
+        stream.write(struct.pack(HEADER, MAGIC, VERSION))
+
+    def write(self, opcode, first=0, second=0, third=0):
+        """Writes a record to the stream"""
+        self.stream.write(struct.pack(RECORD, opcode, first, second, third))
+        self.records += 1
+
+    def expect(self, distances, length):
+        """
+        Tells the recorder the driven distances where the robot changes commands,
+        and the distance where it stops
+        """
+        self.events = distances
+        self.event_index = 0
+        self.events_length = length
+
+    def reset(self):
+        """Resets the driven distance"""
+        self.distance_traveled = 0
+        self.events = ()
+        self.write(RESET)
+
+    def drive(self, speed, turnrate):
+        """Drives with the speed and turn rate from the current driven distance"""
+        self.write(DRIVE, self.distance_traveled, speed, turnrate)
+
+    def distance(self):
+        """Returns the start of the next part of the schedule (or its length)"""
+        events = self.events
+        index = self.event_index
+        while index < len(events) and events[index] <= self.distance_traveled:
+            index += 1
+
+        self.event_index = index
+        self.distance_traveled = (
+            events[index] if index < len(events) else self.events_length
+        )
+        return self.distance_traveled
+
+    def stop(self):
+        """Stops at the current driven distance"""
+        self.write(STOP, self.distance_traveled)
+
+    def straight(self, distance):
+        """Drives distance (mm) straight"""
+        self.write(STRAIGHT, distance)
+
+    def turn(self, angle):
+        """Turns angle (deg) in place"""
+        self.write(TURN, angle)
+
+    def pendown(self):
+        """Lowers the pen, if it is lifted"""
+        if not self.pen_down:
+            self.write(PEN_DOWN)
+        self.pen_down = True
+
+    def penup(self):
+        """Lifts the pen, if it is lowered"""
+        if self.pen_down:
+            self.write(PEN_UP)
+        self.pen_down = False
+
+
+def read_header(stream):
+    """Reads the header of a plan from a binary stream, raises ValueError if it is not a plan"""
+    data = stream.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE:
+        raise ValueError("The file is not a motion plan")
+
+    magic, version = struct.unpack(HEADER, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("The file is not a version {} motion plan".format(VERSION))
+
+
+def read_records(stream):
+    """Yields the records (opcode and three values) of a plan, one at a time"""
+    read_header(stream)
+    while True:
+        data = stream.read(RECORD_SIZE)
+        if len(data) < RECORD_SIZE:
+            return
+
+        yield struct.unpack(RECORD, data)
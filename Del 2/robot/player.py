@@ -0,0 +1,106 @@
+"""
+Plays a motion plan compiled on a pc (see robot.plan) on the brick.
+
+Only the plan format and the configuration are imported, so the brick starts
+drawing without parsing or planning anything. The plan is read one record at a
+time while the robot drives.
+"""
+from pybricks.parameters import Stop
+
+from robot.config import drive_base, pen_motor, PEN_TORQUE, TURN_RATE, TURN_SPEED
+from robot.plan import (
+    DRIVE,
+    PEN_DOWN,
+    PEN_UP,
+    RESET,
+    STOP,
+    STRAIGHT,
+    TURN,
+    read_records,
+)
+
+
+class Player:
+    """
+    Gives the commands of a motion plan to a drive base.
+
+    If there is no pen_motor (when the drive base is simulated), the pen is moved
+    with the penup and pendown methods of the drive base.
+    """
+
+    def __init__(self, _drive_base=drive_base, _pen_motor=pen_motor):
+        self.drive_base = _drive_base
+        self.pen_motor = _pen_motor
+        self.pen_state = False
+        self.lower_angle = 0
+
+        if _pen_motor is not None:
+            self.calibrate_pen()
+
+    def calibrate_pen(self):
+        """Used to calibrate the pen (see Robot.calibrate_pen)"""
+        self.lower_angle = self.pen_motor.run_until_stalled(
+            TURN_SPEED, then=Stop.COAST, duty_limit=PEN_TORQUE
+        )
+        self.pen_state = True
+        self.lift_pen()
+
+    def lift_pen(self):
+        """Lifts the pen from the paper"""
+        if self.pen_motor is None:
+            self.drive_base.penup()
+        elif self.pen_state:
+            self.pen_motor.run_angle(TURN_SPEED, -TURN_RATE, then=Stop.HOLD, wait=True)
+
+        self.pen_state = False
+
+    def engage_pen(self):
+        """Puts the pen on the paper"""
+        if self.pen_motor is None:
+            self.drive_base.pendown()
+        elif not self.pen_state:
+            self.pen_motor.run_target(
+                TURN_SPEED, self.lower_angle, then=Stop.COAST, wait=True
+            )
+
+        self.pen_state = True
+
+    def wait_for(self, distance):
+        """Waits until the driven distance reaches distance (mm)"""
+        while (self.drive_base.distance() or 0) < distance:
+            pass
+
+    def play(self, stream):
+        """Plays the plan in a binary stream, returns the number of records played"""
+        drive = self.drive_base
+        records = 0
+        for opcode, first, second, third in read_records(stream):
+            records += 1
+            if opcode == DRIVE:
+                if first > 0:
+                    self.wait_for(first)
+                drive.drive(second, third)
+            elif opcode == STOP:
+                self.wait_for(first)
+                drive.stop()
+            elif opcode == RESET:
+                drive.reset()
+            elif opcode == STRAIGHT:
+                drive.straight(first)
+            elif opcode == TURN:
+                drive.turn(first)
+            elif opcode == PEN_UP:
+                self.lift_pen()
+            elif opcode == PEN_DOWN:
+                self.engage_pen()
+            else:
+                raise ValueError("Unknown opcode {} in the plan".format(opcode))
+
+        self.lift_pen()
+        return records
+
+
+def play(file_name, _drive_base=drive_base, _pen_motor=pen_motor):
+    """Plays the plan in a file, returns the number of records played"""
+    with open(file_name, "rb") as file:
+        return Player(_drive_base, _pen_motor).play(file)
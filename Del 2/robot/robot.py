@@ -5,7 +5,26 @@ from pybricks.parameters import Stop
 
 from app.point import Point
 from app.curves import Line
-from robot.config import drive_base, pen_motor, TURN_SPEED, TURN_RATE, PEN_TORQUE, SPEED
+from app.planning.motion import join_schedules, plan_curve
+from app.planning.velocity import plan_velocity
+from app.utils.curves import angle_difference, is_smooth_junction
+from robot.metrics import JobMetrics
+from robot.config import (
+    drive_base,
+    pen_motor,
+    TURN_SPEED,
+    TURN_RATE,
+    PEN_TORQUE,
+    SPEED,
+    LUT_TOLERANCE,
+    JUNCTION_GAP,
+    JUNCTION_ANGLE,
+    MAX_SPEED,
+    MIN_SPEED,
+    ACCELERATION,
+    LATERAL_ACCELERATION,
+    JERK,
+)
 
 
 class Robot:  # pylint: disable=too-many-instance-attributes
@@ -22,6 +41,8 @@ class Robot:  # pylint: disable=too-many-instance-attributes
         start_pos=Point(x=0, y=0),
         _drive_base=drive_base,
         _pen_motor=pen_motor,
+        tracer=None,
+        metrics=None,
     ):
         """
         Creates a new robot instance.
@@ -32,8 +53,15 @@ class Robot:  # pylint: disable=too-many-instance-attributes
         drive_base is the DriveBase instance of the robot.
 
         pen_motor is the motor that drives the pen.
+
+        tracer is a robot.tracer.Tracer that records every iteration of the drive
+        loop, or None to not record them.
+
+        metrics is the robot.metrics.JobMetrics the distances, pen moves, turns
+        and time of the drawing are counted in (a new one if it is not given).
         """
         self.scale = scale
+        self.lut_tolerance = LUT_TOLERANCE / scale
         self.angle = start_angle
         self.pos = start_pos
 
@@ -46,6 +74,8 @@ class Robot:  # pylint: disable=too-many-instance-attributes
 
         self.drive_base = _drive_base
         self.pen_motor = _pen_motor
+        self.tracer = tracer
+        self.metrics = metrics if metrics is not None else JobMetrics()
 
         # Calibrates pen
         if not self.turtle:
@@ -55,10 +85,17 @@ class Robot:  # pylint: disable=too-many-instance-attributes
         """Lifts the pen from the paper"""
         if self.turtle:
             self.drive_base.penup()
+            if self.pen_state:
+                self.metrics.pen_lifts += 1
+            self.pen_state = False
             return
 
         if self.pen_state:
-            self.pen_motor.run_angle(TURN_SPEED, -TURN_RATE, then=Stop.HOLD, wait=True)
+            with self.metrics.phase("pen"):
+                self.pen_motor.run_angle(
+                    TURN_SPEED, -TURN_RATE, then=Stop.HOLD, wait=True
+                )
+            self.metrics.pen_lifts += 1
 
         self.pen_state = False
 
@@ -66,12 +103,17 @@ class Robot:  # pylint: disable=too-many-instance-attributes
         """Puts the pen on the paper"""
         if self.turtle:
             self.drive_base.pendown()
+            if not self.pen_state:
+                self.metrics.pen_engages += 1
+            self.pen_state = True
             return
 
         if not self.pen_state:
-            self.pen_motor.run_target(
-                TURN_SPEED, self.lower_angle, then=Stop.COAST, wait=True
-            )
+            with self.metrics.phase("pen"):
+                self.pen_motor.run_target(
+                    TURN_SPEED, self.lower_angle, then=Stop.COAST, wait=True
+                )
+            self.metrics.pen_engages += 1
 
         self.pen_state = True
 
@@ -84,44 +126,166 @@ class Robot:  # pylint: disable=too-many-instance-attributes
         self.lift_pen()
 
     def drive_through_path(self, path, drawing=True):
-        """Drives through a given path"""
-        for curve in path:
-            self.drive_through_curve(curve, drawing=drawing)
+        """
+        Drives through a given path.
+        Every curve of the path is planned before the robot starts driving.
+
+        Consecutive curves that meet without a gap or a change of direction
+        (see is_smooth_junction) are driven through as one continuous motion,
+        without stopping, turning or lifting the pen between them. The changes of
+        direction that are not turned at the junctions add up, so the curves are
+        split when they add up to more than JUNCTION_ANGLE, and the robot turns.
+        """
+        curves = list(path)
+        with self.metrics.phase("plan"):
+            schedules = [self.plan_curve(curve) for curve in curves]
+
+        start = 0
+        skipped = 0
+        for end in range(1, len(curves) + 1):
+            if end < len(curves) and self.is_smooth_junction(
+                curves[end - 1], curves[end]
+            ):
+                skipped += angle_difference(
+                    curves[end - 1].get_end_angle(), curves[end].get_start_angle()
+                )
+                if abs(math.degrees(skipped)) <= JUNCTION_ANGLE:
+                    continue
+
+            self.drive_through_curves(
+                curves[start:end], drawing=drawing, schedules=schedules[start:end]
+            )
+            start = end
+            skipped = 0
+
         self.lift_pen()
+        self.metrics.paths += 1
+
+    def is_smooth_junction(self, curve, next_curve):
+        """Returns True if the robot can drive from curve to next_curve without stopping"""
+        return is_smooth_junction(
+            curve,
+            next_curve,
+            position_tolerance=JUNCTION_GAP / self.scale,
+            angle_tolerance=math.radians(JUNCTION_ANGLE),
+        )
+
+    def plan_curve(self, curve):
+        """
+        Returns the schedule of turn rates used to drive through a curve
+        (see app.planning.motion)
+        """
+        curve.set_lut_tolerance(self.lut_tolerance)
+        return plan_curve(curve, self.scale, SPEED)
+
+    def plan_velocity(self, schedule):
+        """
+        Returns the schedule with the speed profile used to drive through it
+        (see app.planning.velocity)
+        """
+        return plan_velocity(
+            schedule,
+            max_speed=MAX_SPEED,
+            min_speed=MIN_SPEED,
+            acceleration=ACCELERATION,
+            lateral_acceleration=LATERAL_ACCELERATION,
+            jerk=JERK,
+        )
 
-    def drive_through_curve(self, curve, drawing=True):
+    def drive_through_curve(self, curve, drawing=True, schedule=None):
         """
         Drives the robot to the start position of the curve and drives through it.
+
+        The schedule is planned with self.plan_curve if it is not given.
         """
+        self.drive_through_curves(
+            [curve], drawing=drawing, schedules=None if schedule is None else [schedule]
+        )
+
+    def drive_through_curves(self, curves, drawing=True, schedules=None):
+        """
+        Drives the robot to the start position of the first curve and drives through
+        the curves without stopping in between.
+
+        The schedules are planned with self.plan_curve if they are not given.
+        """
+        metrics = self.metrics
+        with metrics.phase("plan"):
+            if schedules is None:
+                schedules = [self.plan_curve(curve) for curve in curves]
+            joined = self.plan_velocity(join_schedules(schedules))
+
         # Moves the robot
-        self.move_to(curve.get_start_pos())
-        self.change_angle(curve.get_start_angle())
+        self.move_to(curves[0].get_start_pos())
+        self.change_angle(curves[0].get_start_angle())
 
         if drawing:
             self.engage_pen()
 
-        # Follows the curve
+        # Follows the curves
+        if self.tracer is not None:
+            self.tracer.begin([schedule.length for schedule in schedules])
+        with metrics.phase("draw" if drawing else "travel"):
+            self.follow_schedule(joined)
+
+        if drawing:
+            metrics.draw_distance += joined.length
+        else:
+            metrics.travel_distance += joined.length
+        metrics.curves += len(curves)
+
+        # Updates params. The robot turns as much as the curves do, which is not the
+        # end angle if a turn or a junction was skipped, so the next turn corrects it
+        for curve in curves:
+            self.angle += angle_difference(
+                curve.get_start_angle(), curve.get_end_angle()
+            )
+        self.pos = curves[-1].get_end_pos()
+
+    def follow_schedule(self, schedule):
+        """
+        Drives until the driven distance reaches the length of the schedule.
+
+        The drive base is only given a new command when the driven distance passes
+        the start of the next part of the schedule. Every iteration is recorded by
+        the tracer, if the robot has one.
+        """
+        if schedule.length == 0:
+            return
+
+        distances = schedule.distances
+        speeds = schedule.speeds
+        turn_rates = schedule.turn_rates
+        last = len(distances) - 1
+        index = 0
+
         self.drive_base.reset()
-        while (
-            self.drive_base.distance() is None and curve.length() != 0
-        ) or self.drive_base.distance() < curve.length() * self.scale:
+        if self.turtle and hasattr(self.drive_base, "expect"):
+            # Lets a simulated drive base jump to where the next command is given
+            self.drive_base.expect(distances, schedule.length)
+
+        self.drive_base.drive(speeds[0], turn_rates[0])
 
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.start(schedule.length)
+
+        distance = 0
+        while distance < schedule.length:
             distance = self.drive_base.distance()
             if distance is None:
                 distance = 0
 
-            try:
-                t_param = curve.get_t(distance / self.scale)
-            except ValueError:
-                break
+            if index < last and distances[index + 1] <= distance:
+                while index < last and distances[index + 1] <= distance:
+                    index += 1
 
-            curvature = curve.get_curvature(t_param)
-            self.drive_base.drive(SPEED, math.degrees(SPEED * curvature / self.scale))
-        self.drive_base.stop()
+                self.drive_base.drive(speeds[index], turn_rates[index])
 
-        # Updates params
-        self.angle = curve.get_end_angle()
-        self.pos = curve.get_end_pos()
+            if tracer is not None:
+                tracer.record(distance, index, speeds[index], turn_rates[index])
+
+        self.drive_base.stop()
 
     def move_to(self, pos):
         """Moves to a specified point in the coordinates system of the curves."""
@@ -136,20 +300,28 @@ class Robot:  # pylint: disable=too-many-instance-attributes
             self.change_angle(line.get_start_angle())
 
             # Drives the line
-            self.drive_base.straight(line.length() * self.scale)
+            with self.metrics.phase("travel"):
+                self.drive_base.straight(line.length() * self.scale)
+            self.metrics.travel_distance += line.length() * self.scale
 
-            # Updates params
-            self.angle = line.get_end_angle()
+            # Updates params (the angle is only changed by change_angle)
             self.pos = line.get_end_pos()
 
     def change_angle(self, end_angle):
         """
         Turns the robot in the direction specified by the end_angle (in radians).
         """
-        angle_delta = ((end_angle - self.angle) + math.pi) % (math.pi * 2) - math.pi
+        angle_delta = angle_difference(self.angle, end_angle)
+
+        # The robot already points in the right direction
+        if abs(math.degrees(angle_delta)) < JUNCTION_ANGLE:
+            return
 
         self.lift_pen()
-        self.drive_base.turn(math.degrees(angle_delta))
+        with self.metrics.phase("travel"):
+            self.drive_base.turn(math.degrees(angle_delta))
+        self.metrics.turns += 1
+        self.metrics.turned += abs(math.degrees(angle_delta))
 
         # Update params
         self.angle = end_angle
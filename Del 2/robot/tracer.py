@@ -0,0 +1,210 @@
+"""
+Records what the drive loop of the robot does (see Robot.follow_schedule).
+
+The Tracer keeps the last iterations in a ring buffer that is allocated once, so it
+can be left on while the robot draws. The trace is written to a binary or CSV file,
+which is read and summarized on a pc with read_trace and loop_statistics.
+"""
+
+import math
+import struct
+from array import array
+
+from app.utils.timing import ticks_diff, ticks_us
+
+# Number of iterations kept by default
+CAPACITY = 4096
+
+# Fields of every iteration: the time (in microseconds) since the previous iteration,
+# the index of the curve and of the part of the schedule being driven, the driven
+# distance (mm), and the commanded speed (mm/s) and turn rate (deg/s)
+FIELDS = ("dt_us", "curve", "part", "distance", "speed", "turn_rate")
+
+# Binary trace files start with a header (magic, version and number of iterations)
+# followed by one record per iteration, in little endian
+MAGIC = b"LOOP"
+VERSION = 1
+HEADER = "<4sHI"
+RECORD = "<iiifff"
+
+
+class Tracer:  # pylint: disable=too-many-instance-attributes
+    """
+    A ring buffer with the last capacity iterations of the drive loop.
+
+    The robot calls begin with the lengths (in mm) of the curves it is about to drive
+    through without stopping, start when its drive loop starts and record on every
+    iteration. clock returns a time stamp in microseconds (ticks_us by default).
+    """
+
+    def __init__(self, capacity=CAPACITY, clock=ticks_us):
+        self.capacity = capacity
+        self.clock = clock
+
+        self.dt_us = array("l", [0] * capacity)
+        self.curves = array("l", [0] * capacity)
+        self.parts = array("l", [0] * capacity)
+        self.distances = array("f", [0] * capacity)
+        self.speeds = array("f", [0] * capacity)
+        self.turn_rates = array("f", [0] * capacity)
+
+        # Index the next iteration is written to, and the number of recorded iterations
+        self.index = 0
+        self.count = 0
+
+        # Curves of the current drive loop: the driven distances where they end, the
+        # index of the first one and the one being driven
+        self.curve_ends = []
+        self.first_curve = 0
+        self.curve = 0
+        self.curve_count = 0
+        self.pending = None
+        self.last = 0
+
+    def begin(self, curve_lengths):
+        """Tells the tracer the lengths (in mm) of the curves the next drive loop follows"""
+        self.pending = curve_lengths
+
+    def start(self, length):
+        """
+        Starts tracing a drive loop of the given length (in mm), through the curves given
+        to begin, or one curve if begin was not called
+        """
+        lengths = self.pending or [length]
+        self.pending = None
+
+        self.curve_ends = []
+        end = 0
+        for curve_length in lengths:
+            end += curve_length
+            self.curve_ends.append(end)
+
+        self.first_curve = self.curve_count
+        self.curve_count += len(lengths)
+        self.curve = 0
+        self.last = self.clock()
+
+    def record(self, distance, part, speed, turn_rate):
+        """Records an iteration of the drive loop"""
+        now = self.clock()
+        while (
+            self.curve < len(self.curve_ends) - 1
+            and distance >= self.curve_ends[self.curve]
+        ):
+            self.curve += 1
+
+        index = self.index
+        self.dt_us[index] = ticks_diff(now, self.last)
+        self.curves[index] = self.first_curve + self.curve
+        self.parts[index] = part
+        self.distances[index] = distance
+        self.speeds[index] = speed
+        self.turn_rates[index] = turn_rate
+
+        self.last = now
+        self.index = index + 1 if index + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        """Forgets every recorded iteration"""
+        self.index = 0
+        self.count = 0
+
+    def rows(self):
+        """Yields the recorded iterations (tuples with the FIELDS), oldest first"""
+        for i in range(self.index - self.count, self.index):
+            i %= self.capacity
+            yield (
+                self.dt_us[i],
+                self.curves[i],
+                self.parts[i],
+                self.distances[i],
+                self.speeds[i],
+                self.turn_rates[i],
+            )
+
+    def dump(self, file_name):
+        """Writes the recorded iterations to a CSV file (.csv) or a binary file"""
+        if file_name.endswith(".csv"):
+            with open(file_name, "w", encoding="utf-8") as file:
+                file.write(",".join(FIELDS) + "\n")
+                for row in self.rows():
+                    file.write("{},{},{},{:.3f},{:.3f},{:.3f}\n".format(*row))
+            return
+
+        with open(file_name, "wb") as file:
+            file.write(struct.pack(HEADER, MAGIC, VERSION, self.count))
+            for row in self.rows():
+                file.write(struct.pack(RECORD, *row))
+
+
+def read_trace(file_name):
+    """Reads a trace written by Tracer.dump, returns the rows (tuples with the FIELDS)"""
+    if file_name.endswith(".csv"):
+        with open(file_name, "r", encoding="utf-8") as file:
+            lines = file.read().split()
+
+        return [
+            tuple(
+                int(value) if index < 3 else float(value)
+                for index, value in enumerate(line.split(","))
+            )
+            for line in lines[1:]
+        ]
+
+    with open(file_name, "rb") as file:
+        data = file.read()
+
+    magic, version, count = struct.unpack_from(HEADER, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("{} is not a drive loop trace".format(file_name))
+
+    offset = struct.calcsize(HEADER)
+    size = struct.calcsize(RECORD)
+    return [struct.unpack_from(RECORD, data, offset + i * size) for i in range(count)]
+
+
+def _percentile(sorted_values, fraction):
+    """Returns the value below which fraction of the sorted values are"""
+    return sorted_values[
+        min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    ]
+
+
+def loop_statistics(rows):
+    """
+    Returns the statistics of the drive loop for every curve in a trace, as a list of
+    dicts: the curve, number of iterations, driven distance (mm), the 5th, 50th and
+    95th percentile of the loop frequency (Hz), the jitter (the standard deviation of
+    the time between iterations, in microseconds), the longest time between iterations
+    and the largest curvature (deg/mm).
+    """
+    curves = {}
+    for dt_us, curve, _, distance, speed, turn_rate in rows:
+        curves.setdefault(curve, []).append((dt_us, distance, speed, turn_rate))
+
+    statistics = []
+    for curve in sorted(curves):
+        iterations = curves[curve]
+        periods = sorted(max(dt_us, 1) for dt_us, _, _, _ in iterations)
+        mean = sum(periods) / len(periods)
+        variance = sum((period - mean) ** 2 for period in periods) / len(periods)
+        statistics.append(
+            {
+                "curve": curve,
+                "iterations": len(iterations),
+                "distance": iterations[-1][1] - iterations[0][1],
+                "p5_hz": 1e6 / _percentile(periods, 0.95),
+                "p50_hz": 1e6 / _percentile(periods, 0.5),
+                "p95_hz": 1e6 / _percentile(periods, 0.05),
+                "jitter_us": math.sqrt(variance),
+                "max_period_us": periods[-1],
+                "max_curvature": max(
+                    abs(turn_rate / speed) if speed else 0
+                    for _, _, speed, turn_rate in iterations
+                ),
+            }
+        )
+
+    return statistics
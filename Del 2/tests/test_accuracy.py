@@ -0,0 +1,82 @@
+"""Tests for app.utils.accuracy"""
+import numpy as np
+import pytest
+
+from app.point import Point
+from app.svg import Path
+from app.utils.accuracy import KDTree, measure, sample_paths
+
+
+def square(size, offset=Point(0, 0)):
+    """Returns a square path"""
+    path = Path(offset)
+    for point in (Point(size, 0), Point(size, size), Point(0, size), Point(0, 0)):
+        path.append_curve([point + offset])
+
+    return path
+
+
+@pytest.mark.parametrize("count", [1, 10, 1000])
+def test_kd_tree(count):
+    """The KDTree finds the same nearest points as comparing with every point"""
+    rng = np.random.default_rng(count)
+    points = rng.uniform(0, 100, (count, 2))
+    queries = np.concatenate(
+        [rng.uniform(-50, 150, (200, 2)), points[:5], rng.uniform(500, 600, (5, 2))]
+    )
+
+    distances, nearest = KDTree(points, leaf_size=4).query(queries)
+
+    expected = np.hypot(*(points[None, :, :] - queries[:, None, :]).transpose(2, 0, 1))
+    assert np.allclose(distances, expected.min(axis=1))
+    assert np.allclose(np.hypot(*(points[nearest] - queries).T), expected.min(axis=1))
+
+
+def test_kd_tree_empty():
+    with pytest.raises(ValueError):
+        KDTree(np.empty((0, 2)))
+
+
+def test_sample_paths():
+    positions, indices = sample_paths([square(1), square(2)], scale=10, spacing=0.5)
+
+    assert list(np.unique(indices)) == [0, 1]
+    assert positions[indices == 1].max(axis=0) == pytest.approx([20, 20])
+    gaps = np.hypot(*np.diff(positions[indices == 0], axis=0).T)
+    assert gaps.max() <= 0.5
+
+
+def test_measure_exact_trace():
+    paths = [square(10), square(10, Point(20, 0))]
+    trace, _ = sample_paths(paths, spacing=0.1)
+
+    result = measure(trace, paths, spacing=0.1)
+    assert result.hausdorff == pytest.approx(0)
+    assert result.rms == pytest.approx(0)
+
+
+def test_measure_offset_trace():
+    """A trace 1 mm off the paths, that does not draw the second path"""
+    paths = [square(10), square(10, Point(20, 0))]
+    trace, _ = sample_paths(paths[:1], spacing=0.1)
+    trace = trace + [1, 0]
+
+    result = measure(trace, paths, spacing=0.01)
+    assert result.rms == pytest.approx(np.sqrt(np.mean([0, 1, 0, 1])), abs=0.2)
+    assert result.path_errors[0] == pytest.approx(1, abs=0.01)
+    assert result.path_errors[1] == pytest.approx(19, abs=0.01)
+    assert result.hausdorff == pytest.approx(19, abs=0.01)
+
+
+def test_measure_scale():
+    path = Path(Point(0, 0))
+    path.append_curve([Point(1, 0)])
+    result = measure([[0, 1], [10, 1]], [path], scale=10)
+
+    assert result.rms == pytest.approx(1)
+    assert result.hausdorff == pytest.approx(np.hypot(5, 1), abs=0.01)
+
+
+def test_measure_empty():
+    with pytest.raises(ValueError):
+        measure(np.empty((0, 2)), [square(1)])
@@ -3,10 +3,12 @@ import math
 import pytest
 
 from app.abc.non_linear_curve import NonLinearCurve
+from app.arc import Arc
 from app.curves import Line
 from app.curves import QuadraticCurve
 from app.curves.cubic_curve import CubicCurve
 from app.point import Point
+from app.utils.curves import bezier_range, is_smooth_junction
 
 points = [
     Point(0, 0),
@@ -42,7 +44,7 @@ def test_quadratic_curve():
     _test_curve(c)
 
 
-def test_quadratic_curve():
+def test_cubic_curve():
     """Tests the CubicCurve class"""
     c = CubicCurve(points[:4])
 
@@ -70,5 +72,195 @@ def _test_curve(curve):
 
     if isinstance(curve, NonLinearCurve):
         # Checks that the keys in the the look-up table are sorted
-        keys = list(curve.look_up_table.keys())
-        assert all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1))
+        lengths = curve.look_up_table.lengths
+        assert all(lengths[i] <= lengths[i + 1] for i in range(len(lengths) - 1))
+
+
+def test_lazy_look_up_table():
+    """The look-up table is only generated when it is needed"""
+    c = CubicCurve(points[:4])
+    assert c._look_up_table is None  # pylint: disable=protected-access
+
+    c.get_t(0.5)
+    look_up_table = c.look_up_table
+    c.length()
+    assert c.look_up_table is look_up_table
+
+
+def test_adaptive_look_up_table():
+    """The adaptive look-up table stays within the tolerance with fewer entries"""
+    c = CubicCurve([Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)])
+    reference = CubicCurve(c.points)
+
+    c.set_lut_tolerance(0.01)
+    assert len(c.look_up_table) < len(reference.look_up_table)
+
+    lengths = c.look_up_table.lengths
+    assert all(lengths[i] < lengths[i + 1] for i in range(len(lengths) - 1))
+
+    for i in range(10):
+        traversed_length = min(c.length(), reference.length()) * i / 10
+        error = c.get_pos(c.get_t(traversed_length)) - reference.get_pos(
+            reference.get_t(traversed_length)
+        )
+        assert abs(error) < 0.01
+
+
+@pytest.mark.parametrize(
+    "curve_points",
+    [
+        # Almost has a cusp, where the speed of the curve is close to zero
+        [Point(8, 31), Point(80, 1), Point(11, 35), Point(17, 15)],
+        # The speed is lower in the middle of a quarter of the curve than at its ends
+        [Point(57, 25), Point(44.2, 46.4), Point(42.3, 26.9), Point(21.9, 75.1)],
+    ],
+)
+def test_uneven_speed_look_up_table(curve_points):
+    """The length and the adaptive look-up table are accurate where the speed changes"""
+    c = CubicCurve(curve_points)
+    reference = CubicCurve(curve_points).generate_lut(100000)
+    assert c.length() == pytest.approx(reference.total_length, rel=1e-7)
+
+    c.set_lut_tolerance(0.05)
+    for i in range(200):
+        traversed_length = c.length() * i / 200
+        error = c.get_pos(c.get_t(traversed_length)) - c.get_pos(
+            reference.get_t(traversed_length)
+        )
+        assert abs(error) < 0.05
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [
+        QuadraticCurve(points[:3]),
+        QuadraticCurve([Point(0, 0), Point(2, 0), Point(1, 0)]),
+        CubicCurve(points[:4]),
+        Arc([points[0], Point(1, 1), Point(2, 0)], large_arc=False, sweep=False),
+        Arc([points[0], Point(2, 1), Point(2, 0)], large_arc=True, sweep=False),
+    ],
+)
+def test_length(curve):
+    """The length matches the sum of the chords of a very fine look-up table"""
+    assert curve.length() == pytest.approx(
+        curve.generate_lut(10000).total_length, rel=1e-5
+    )
+    assert curve.look_up_table.total_length == curve.length()
+
+
+def test_quadratic_velocity():
+    """The velocity is the derivative of the position"""
+    c = QuadraticCurve(points[:3])
+    for t_param in (0, 0.3, 1):
+        derivative = (c.get_pos(t_param + 1e-6) - c.get_pos(t_param - 1e-6)) * 5e5
+        assert abs(c.get_vel(t_param) - derivative) < 1e-6
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [
+        Line(points[:2]),
+        QuadraticCurve(points[:3]),
+        CubicCurve(points[:4]),
+        Arc([points[0], Point(1, 2), points[3]], large_arc=False, sweep=True),
+        Arc([points[0], Point(2, 1), points[3]], large_arc=True, sweep=False, rotation=30),
+    ],
+)
+def test_batch_evaluation(curve):
+    """The batch methods give the same results as the scalar methods"""
+    t_params = [0, 0.25, 0.5, 1]
+
+    for many, single in (
+        (curve.get_pos_many, curve.get_pos),
+        (curve.get_vel_many, curve.get_vel),
+        (curve.get_acc_many, curve.get_acc),
+    ):
+        result = many(t_params)
+        assert result.shape == (len(t_params), 2)
+        for row, t_param in zip(result, t_params):
+            point = single(t_param)
+            assert tuple(row) == pytest.approx((point.x, point.y))
+
+    curvatures = curve.get_curvature_many(t_params)
+    assert curvatures.shape == (len(t_params),)
+    assert list(curvatures) == pytest.approx(
+        [curve.get_curvature(t_param) for t_param in t_params]
+    )
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [
+        Line(points[:2]),
+        QuadraticCurve(points[:3]),
+        QuadraticCurve([Point(0, 0), Point(2, 0), Point(1, 0)]),
+        CubicCurve(points[:4]),
+        CubicCurve([Point(0, 0), Point(0, 2), Point(1, -2), Point(1, 0)]),
+        Arc([points[0], Point(1, 2), points[3]], large_arc=False, sweep=True),
+        Arc([points[0], Point(2, 1), points[3]], large_arc=True, sweep=False, rotation=30),
+    ],
+)
+def test_bounding_box(curve):
+    """The bounding box is the smallest box containing every position on the curve"""
+    positions = [curve.get_pos(i / 1000) for i in range(1001)]
+    min_pos, max_pos = curve.bounding_box
+
+    assert min_pos.x == pytest.approx(min(p.x for p in positions), abs=1e-5)
+    assert min_pos.y == pytest.approx(min(p.y for p in positions), abs=1e-5)
+    assert max_pos.x == pytest.approx(max(p.x for p in positions), abs=1e-5)
+    assert max_pos.y == pytest.approx(max(p.y for p in positions), abs=1e-5)
+    assert curve.bounding_box is curve.bounding_box
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [
+        Line(points[:2]),
+        QuadraticCurve(points[:3]),
+        QuadraticCurve([Point(0, 0), Point(2, 0), Point(1, 0)]),
+        CubicCurve(points[:4]),
+        CubicCurve([Point(0, 0), Point(0, 2), Point(1, -2), Point(1, 0)]),
+    ],
+)
+def test_bezier_range(curve):
+    """bezier_range gives the same bounding box as the curve, from plain floats"""
+    min_x, max_x = bezier_range([point.x for point in curve.points])
+    min_y, max_y = bezier_range([point.y for point in curve.points])
+
+    assert (Point(min_x, min_y), Point(max_x, max_y)) == curve.bounding_box
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [
+        Line(points[:2]),
+        QuadraticCurve(points[:3]),
+        CubicCurve(points[:4]),
+        Arc([points[0], Point(1, 2), points[3]], large_arc=False, sweep=True),
+        Arc([points[0], Point(2, 1), points[3]], large_arc=True, sweep=False, rotation=30),
+    ],
+)
+def test_reversed(curve):
+    """A reversed curve goes through the same positions in the opposite direction"""
+    reversed_curve = curve.reversed()
+    assert type(reversed_curve) is type(curve)
+    assert reversed_curve.get_start_pos() == curve.get_end_pos()
+    assert reversed_curve.get_end_pos() == curve.get_start_pos()
+
+    for t_param in (0, 0.3, 0.5, 1):
+        assert abs(reversed_curve.get_pos(1 - t_param) - curve.get_pos(t_param)) < 1e-9
+
+
+def test_smooth_junction():
+    """Curves meeting at the same position and angle are smooth (G0 and G1)"""
+    curve = QuadraticCurve([Point(0, 0), Point(1, 1), Point(2, 0)])
+    assert is_smooth_junction(curve, QuadraticCurve([Point(2, 0), Point(3, -1), Point(4, 0)]))
+
+    # Change of direction
+    assert not is_smooth_junction(curve, Line([Point(2, 0), Point(3, 0)]))
+    assert is_smooth_junction(
+        curve, Line([Point(2, 0), Point(3, 0)]), angle_tolerance=math.pi / 4
+    )
+
+    # Gap
+    assert not is_smooth_junction(curve, Line([Point(2, 0.1), Point(3, -1)]))
@@ -0,0 +1,98 @@
+"""Tests for turtle_sim.events"""
+import math
+import pytest
+
+from app.curves import Line
+from app.point import Point
+from app.svg import Path
+from app.svg.parsing import parse_drawing
+from robot.robot import Robot
+from turtle_sim import EventTurtle, HeadlessTurtle
+
+
+class CountingEventTurtle(EventTurtle):
+    """An EventTurtle that counts the calls to distance"""
+
+    polls = 0
+
+    def distance(self):
+        self.polls += 1
+        return super().distance()
+
+
+def draw(drive_base, drawing, scale):
+    """Draws every path of a drawing with a robot"""
+    robot = Robot(
+        scale=scale,
+        start_pos=drawing.min_position,
+        _drive_base=drive_base,
+        _pen_motor=None,
+    )
+    for path in drawing:
+        robot.drive_through_path(path)
+
+
+def test_same_as_fixed_steps():
+    """Jumping between events ends up where driving one sample at a time does"""
+    drawing = parse_drawing("app/svg/sample_svgs/smiley.svg")
+    scale = drawing.scale_for(100)
+    start = drawing.min_position * scale
+
+    fixed = HeadlessTurtle(position=(start.x, start.y))
+    draw(fixed, drawing, scale)
+    events = EventTurtle(position=(start.x, start.y))
+    draw(events, drawing, scale)
+
+    assert (events.x, events.y) == pytest.approx((fixed.x, fixed.y), abs=1e-6)
+    assert events.heading == pytest.approx(fixed.heading)
+    assert events.time == pytest.approx(fixed.time)
+
+
+def test_jumps_to_events():
+    """Every part of the schedule is driven with one poll"""
+    line = Line([Point(0, 0), Point(100, 0)])
+    turtle = CountingEventTurtle()
+    robot = Robot(scale=1, _drive_base=turtle, _pen_motor=None)
+    robot.drive_through_curve(line)
+
+    assert turtle.polls == len(robot.plan_velocity(robot.plan_curve(line)))
+    assert (turtle.x, turtle.y) == pytest.approx((100, 0), abs=1)
+
+
+def test_trace_on_arc():
+    """The positions recorded along an arc are on its circle"""
+    path = Path(Point(0, 0))
+    path.append_arc([Point(0, 0), Point(50, 50), Point(100, 0)], False, False)
+    turtle = EventTurtle(trace_step=0.5)
+    robot = Robot(scale=1, _drive_base=turtle, _pen_motor=None)
+    robot.drive_through_path(path)
+
+    _, xs, ys, _ = turtle.trace()
+    assert len(xs) > 2 * math.pi * 50 / 2
+    for x, y in zip(xs, ys):
+        assert math.hypot(x - 50, y) == pytest.approx(50, abs=0.5)
+
+
+def test_latency():
+    """The previous command is used for latency seconds after a new command"""
+    turtle = EventTurtle(latency=0.1)
+    turtle.drive(50, 0)
+    turtle.expect([0], 10)
+    turtle.distance()
+    turtle.stop()
+
+    assert turtle.x == pytest.approx(15)
+
+
+def test_noise():
+    line = Line([Point(0, 0), Point(100, 0)])
+    ends = []
+    for seed in (1, 1, 2):
+        turtle = EventTurtle(speed_noise=0.05, turn_noise=2, seed=seed)
+        robot = Robot(scale=1, _drive_base=turtle, _pen_motor=None)
+        robot.drive_through_curve(line)
+        ends.append((turtle.x, turtle.y))
+
+    assert ends[0] == ends[1]
+    assert ends[0] != ends[2]
+    assert ends[0][1] != pytest.approx(0)
@@ -0,0 +1,119 @@
+"""Tests for turtle_sim.headless"""
+import math
+import pytest
+
+from app.point import Point
+from app.svg import Path
+from app.svg.parsing import parse_drawing
+from robot.robot import Robot
+from turtle_sim import HeadlessTurtle
+
+
+def test_straight_and_turn():
+    turtle = HeadlessTurtle(position=(1, 2))
+    turtle.pendown()
+    turtle.straight(10)
+    turtle.turn(90)
+    turtle.straight(5)
+    turtle.penup()
+    turtle.straight(5)
+
+    assert (turtle.x, turtle.y) == pytest.approx((11, 12))
+    _, xs, ys, strokes = turtle.trace()
+    assert list(xs) == pytest.approx([1, 11, 11])
+    assert list(ys) == pytest.approx([2, 2, 7])
+    assert list(strokes) == [0, 0, 0]
+
+
+def test_drive_circle():
+    """Driving with a constant turn rate follows a circle exactly"""
+    turtle = HeadlessTurtle(sampling_freq=10)
+    turtle.drive(math.pi * 10, 180)
+    for _ in range(9):
+        turtle.distance()
+
+    assert turtle.distance() == pytest.approx(math.pi * 10)
+    assert turtle.time == pytest.approx(1)
+    assert (turtle.x, turtle.y) == pytest.approx((0, 20))
+    assert turtle.heading == pytest.approx(180)
+
+    turtle.stop()
+    turtle.distance()
+    assert turtle.time == pytest.approx(1)
+
+
+def test_buffers_grow():
+    turtle = HeadlessTurtle(capacity=4)
+    turtle.pendown()
+    for _ in range(10):
+        turtle.straight(1)
+
+    _, xs, _, _ = turtle.trace()
+    assert list(xs) == pytest.approx(range(11))
+
+
+def test_save(tmp_path):
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    turtle = HeadlessTurtle()
+    turtle.pendown()
+    turtle.straight(3)
+    turtle.penup()
+    turtle.pendown()
+    turtle.straight(3)
+    turtle.save(tmp_path / "trace.npz")
+
+    trace = np.load(tmp_path / "trace.npz")
+    assert list(trace["x"]) == [0, 3, 3, 6]
+    assert list(trace["stroke"]) == [0, 0, 1, 1]
+
+
+def test_robot_path():
+    """The robot draws a square with the HeadlessTurtle"""
+    path = Path(Point(0, 0))
+    for point in (Point(10, 0), Point(10, 10), Point(0, 10), Point(0, 0)):
+        path.append_curve([point])
+
+    turtle = HeadlessTurtle()
+    robot = Robot(scale=2, _drive_base=turtle, _pen_motor=None)
+    robot.drive_through_path(path)
+
+    _, xs, ys, strokes = turtle.trace()
+    assert len(set(strokes)) == 4
+    for point in (Point(20, 0), Point(20, 20), Point(0, 20), Point(0, 0)):
+        assert min(math.hypot(x - point.x, y - point.y) for x, y in zip(xs, ys)) < 1
+
+
+def test_robot_heading_near_smooth_junctions():
+    """Junctions that are almost smooth do not add up to a heading error"""
+    path = Path(Point(0, 0))
+    point = Point(0, 0)
+    for i in range(1, 101):
+        angle = math.radians(0.9 * i)
+        point += Point(math.cos(angle), math.sin(angle))
+        path.append_curve([point])
+
+    turtle = HeadlessTurtle()
+    robot = Robot(scale=10, _drive_base=turtle, _pen_motor=None)
+    robot.drive_through_path(path)
+
+    assert abs(turtle.heading - math.degrees(path.end_angle)) <= 1
+    assert math.hypot(turtle.x - point.x * 10, turtle.y - point.y * 10) < 20
+
+
+def test_robot_drawing():
+    """The trace of a drawing stays close to its bounding box"""
+    drawing = parse_drawing("app/svg/sample_svgs/smiley.svg")
+    scale = drawing.scale_for(100)
+    start = drawing.min_position * scale
+    turtle = HeadlessTurtle(position=(start.x, start.y))
+    robot = Robot(
+        scale=scale, start_pos=drawing.min_position, _drive_base=turtle, _pen_motor=None
+    )
+    for path in drawing:
+        robot.drive_through_path(path)
+
+    _, xs, ys, _ = turtle.trace()
+    assert turtle.samples > 100
+    assert xs.min() > start.x - 5 and xs.max() < start.x + 105
+    assert ys.min() > start.y - 5 and ys.max() < start.y + 105
@@ -0,0 +1,141 @@
+"""Tests for app.utils.logging"""
+import gc
+import io
+import os
+import weakref
+
+from app.utils.logging import (
+    BUFFER_SIZE,
+    BufferedOutput,
+    Logger,
+    _OPEN_LOGGERS,
+    _close_loggers,
+)
+
+
+class Counted:
+    """An argument that counts how many times it is formatted"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return "counted"
+
+
+def test_filtered_messages_are_not_formatted():
+    """Messages below the level of every output are not formatted"""
+    stream = io.StringIO()
+    logger = Logger("TEST", {stream: Logger.INFO}, log_format="%(message)s")
+    argument = Counted()
+
+    logger.debug("%s", argument)
+    logger.log("%s", Logger.DEBUG, argument)
+    assert argument.count == 0
+
+    logger.info("%s %d", argument, 2)
+    logger.flush()
+    assert argument.count == 1
+    assert stream.getvalue() == "counted 2\n"
+
+
+def test_buffered_output():
+    """Lines are written when the buffer is full, on flush and right away for warnings"""
+    stream = io.StringIO()
+    output = BufferedOutput(stream, buffer_size=20, flush_interval=60)
+    logger = Logger(
+        "TEST", {output: Logger.DEBUG}, log_format="%(levelname)s %(message)s"
+    )
+
+    logger.debug("a")
+    assert stream.getvalue() == ""
+
+    logger.debug("b")
+    logger.debug("c")
+    assert stream.getvalue() == "DEBUG a\nDEBUG b\nDEBUG c\n"
+
+    logger.info("d")
+    assert stream.getvalue().endswith("c\n")
+    logger.warning("e")
+    assert stream.getvalue().endswith("INFO d\nWARNING e\n")
+
+
+def test_files_are_opened_when_used(tmp_path):
+    """A log file is not created before something is written to it"""
+    file_name = str(tmp_path / "test.log")
+    logger = Logger("TEST", {file_name: Logger.INFO}, log_format="%(message)s")
+
+    logger.debug("not written")
+    logger.flush()
+    assert not os.path.exists(file_name)
+
+    logger.info("written")
+    logger.close()
+    with open(file_name, "r", encoding="utf-8") as file:
+        assert file.read() == "written\n"
+
+
+def test_rotation(tmp_path):
+    """Files larger than max_bytes are rotated, and only backups of them are kept"""
+    file_name = str(tmp_path / "test.log")
+    output = BufferedOutput(file_name, buffer_size=1, max_bytes=10, backups=2)
+    for line in ("first line\n", "second line\n", "third line\n", "last\n"):
+        output.write(line)
+    output.close()
+
+    assert sorted(os.listdir(str(tmp_path))) == ["test.log", "test.log.1", "test.log.2"]
+    with open(file_name + ".2", "r", encoding="utf-8") as file:
+        assert file.read() == "second line\n"
+    with open(file_name, "r", encoding="utf-8") as file:
+        assert file.read() == "last\n"
+
+
+def test_time_decorator():
+    """The timing decorator logs the time and returns the result of the function"""
+    stream = io.StringIO()
+    logger = Logger("TEST", {stream: Logger.DEBUG}, log_format="%(message)s")
+
+    @logger.time()
+    def double(value):
+        return 2 * value
+
+    assert double(3) == 6
+    logger.flush()
+    assert stream.getvalue().startswith("double() took ")
+
+
+def test_streams_are_written_through():
+    """Lines logged to a stream are written right away, files are buffered"""
+    stream = io.StringIO()
+    output = BufferedOutput(stream)
+    output.write("line\n")
+    assert stream.getvalue() == "line\n"
+    assert BufferedOutput("test.log").buffer_size == BUFFER_SIZE
+
+
+def test_loggers_are_closed_at_exit(tmp_path):
+    """The lines kept by a logger are written when the program exits"""
+    file_name = str(tmp_path / "test.log")
+    logger = Logger("TEST", {file_name: Logger.INFO}, log_format="%(message)s")
+    logger.info("kept")
+    assert not os.path.exists(file_name)
+
+    _close_loggers()
+    with open(file_name, "r", encoding="utf-8") as file:
+        assert file.read() == "kept\n"
+
+
+def test_unused_loggers_are_closed(tmp_path):
+    """A logger that is no longer used is not kept open until the program exits"""
+    file_name = str(tmp_path / "test.log")
+    logger = Logger("TEST", {file_name: Logger.INFO}, log_format="%(message)s")
+    logger.info("kept")
+    assert logger in _OPEN_LOGGERS
+    reference = weakref.ref(logger)
+
+    del logger
+    gc.collect()
+    assert reference() is None
+    with open(file_name, "r", encoding="utf-8") as file:
+        assert file.read() == "kept\n"
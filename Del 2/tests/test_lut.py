@@ -0,0 +1,41 @@
+"""Tests for app.lut"""
+import bisect
+
+import pytest
+
+from app.lut import LookUpTable
+from app.lut.look_up_table import _bisect_right
+
+
+def _make_lut(entries):
+    """Returns a look-up table with the given (length, t) entries"""
+    look_up_table = LookUpTable()
+    for traversed_length, t_param in entries:
+        look_up_table.append(traversed_length, t_param)
+
+    return look_up_table
+
+
+def test_look_up_table():
+    """Tests interpolation and the ends of the table"""
+    look_up_table = _make_lut([(0, 0), (1, 0.5), (1, 0.5), (3, 1)])
+    assert len(look_up_table) == 4
+    assert look_up_table.total_length == 3
+
+    assert look_up_table.get_t(0) == 0
+    assert look_up_table.get_t(0.5) == pytest.approx(0.25)
+    assert look_up_table.get_t(1) == 0.5
+    assert look_up_table.get_t(2) == pytest.approx(0.75)
+
+    assert look_up_table.get_t(-1) == 0
+    assert look_up_table.get_t(4) == 1
+
+    assert look_up_table.search(0.5) == 0
+    assert look_up_table.search(2) == 2
+
+
+def test_bisect_right():
+    """The fallback used on micropython behaves like bisect.bisect_right"""
+    values = [0, 1, 1, 2.5, 4]
+    for value in (-1, 0, 0.5, 1, 2, 2.5, 4, 5):
+        assert _bisect_right(values, value) == bisect.bisect_right(values, value)
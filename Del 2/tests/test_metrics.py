@@ -0,0 +1,61 @@
+"""Tests for robot.metrics"""
+import json
+
+import pytest
+
+from app.curves import Line
+from app.point import Point
+from app.svg import Path
+from robot.metrics import JobMetrics
+from robot.robot import Robot
+from turtle_sim import HeadlessTurtle
+
+
+def test_nested_phases():
+    """The time of an inner phase is not counted in the outer phase"""
+    ticks = iter([0, 10, 30, 70, 100, 200])
+    metrics = JobMetrics(clock=lambda: next(ticks))
+    with metrics.phase("draw"):
+        with metrics.phase("pen"):
+            pass
+
+    assert metrics.phase_times["draw"] == 20 + 30
+    assert metrics.phase_times["pen"] == 40
+
+    result = metrics.to_dict()
+    assert result["total_time"] == pytest.approx(200e-6)
+    assert result["other_time"] == pytest.approx(110e-6)
+
+
+def test_robot_metrics(tmp_path):
+    """The robot counts the distances, pen moves and turns of a drawing"""
+    metrics = JobMetrics()
+    robot = Robot(
+        scale=2,
+        _drive_base=HeadlessTurtle(sampling_freq=250),
+        _pen_motor=None,
+        metrics=metrics,
+    )
+
+    first = Path()
+    first.append(Line([Point(0, 0), Point(10, 0)]))
+    first.append(Line([Point(10, 0), Point(20, 0)]))
+    second = Path()
+    second.append(Line([Point(20, 10), Point(20, 20)]))
+    for path in (first, second):
+        robot.drive_through_path(path)
+
+    assert metrics.draw_distance == pytest.approx(60)
+    assert metrics.travel_distance == pytest.approx(20)
+    assert metrics.pen_engages == metrics.pen_lifts == 2
+    assert metrics.turns == 1 and metrics.turned == pytest.approx(90)
+    assert metrics.curves == 3 and metrics.paths == 2
+
+    file_name = str(tmp_path / "metrics.json")
+    metrics.report(file_name)
+    with open(file_name, "r", encoding="utf-8") as file:
+        saved = json.load(file)
+
+    assert saved["curves"] == 3
+    assert set(saved["phases"]) == {"parse", "plan", "travel", "draw", "pen"}
+    assert saved["curves_per_second"] > 0
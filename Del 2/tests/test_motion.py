@@ -0,0 +1,72 @@
+"""Tests for app.planning.motion"""
+import math
+import pytest
+
+from app.arc import Arc
+from app.curves import CubicCurve, Line
+from app.planning.motion import join_schedules, plan_curve, plan_path
+from app.point import Point
+from app.svg import Path
+
+
+def turned_angle(schedule, speed):
+    """Returns the total angle (in degrees) turned when following a schedule"""
+    ends = list(schedule.distances[1:]) + [schedule.length]
+    return sum(
+        turn_rate * (end - start) / speed
+        for start, end, turn_rate in zip(schedule.distances, ends, schedule.turn_rates)
+    )
+
+
+def test_plan_line():
+    schedule = plan_curve(Line([Point(0, 0), Point(3, 4)]), scale=2, speed=50)
+    assert schedule.length == 10
+    assert list(schedule.distances) == [0]
+    assert list(schedule.turn_rates) == [0]
+
+
+def test_plan_circular_arc():
+    """A circle has a constant turn rate of speed / radius"""
+    arc = Arc([Point(0, 0), Point(1, 1), Point(2, 0)], large_arc=False, sweep=False)
+    schedule = plan_curve(arc, scale=10, speed=50)
+
+    assert schedule.length == pytest.approx(math.pi * 10)
+    assert len(schedule) == 1
+    assert abs(schedule.turn_rates[0]) == pytest.approx(math.degrees(50 / 10))
+    assert schedule.get_turn_rate(5) == schedule.turn_rates[0]
+
+
+def test_plan_cubic_curve():
+    """The schedule turns the robot from the start angle to the end angle"""
+    curve = CubicCurve([Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)])
+    schedule = plan_curve(curve, scale=3, speed=50)
+
+    assert 1 < len(schedule) < schedule.length / 2
+    assert list(schedule.distances) == sorted(schedule.distances)
+    assert turned_angle(schedule, 50) == pytest.approx(
+        math.degrees(curve.get_end_angle() - curve.get_start_angle())
+    )
+
+
+def test_plan_path():
+    path = Path(Point(0, 0))
+    path.append_curve([Point(1, 0)])
+    path.append_curve([Point(2, 0), Point(2, 1)])
+    assert len(plan_path(path, scale=1, speed=50)) == 2
+
+
+def test_join_schedules():
+    """Joined schedules follow each other and turn the same total angle"""
+    curve = CubicCurve([Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)])
+    line = Line([Point(10, 0), Point(10, -5)])
+    schedules = [plan_curve(c, scale=3, speed=50) for c in (line, curve, line)]
+
+    joined = join_schedules(schedules)
+    assert joined.length == pytest.approx(sum(s.length for s in schedules))
+    assert joined.distances[0] == 0
+    assert joined.get_turn_rate(1) == 0
+    assert joined.get_turn_rate(schedules[0].length + 1) != 0
+    assert joined.get_turn_rate(joined.length - 1) == 0
+    assert turned_angle(joined, 50) == pytest.approx(
+        sum(turned_angle(s, 50) for s in schedules)
+    )
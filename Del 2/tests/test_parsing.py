@@ -0,0 +1,157 @@
+"""Tests for app.svg.parsing"""
+import pytest
+
+from app.point import Point
+from app.svg import Drawing, PackedPath
+from app.svg.parsing import (
+    _commands_to_paths,
+    _iter_path_data,
+    _lex_path_data,
+    _scan_tokens,
+    _tokenize,
+    iter_svg_paths,
+    parse_drawing,
+    parse_svg,
+)
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg">
+  <path id="first" d="M 0 0 L 10
+    0 L 10 10" />
+  <path
+     d="M 20,20 Q 25,30 30,20" />
+</svg>
+"""
+
+
+@pytest.fixture(name="svg_file")
+def fixture_svg_file(tmp_path):
+    """Writes a small svg file and returns its name"""
+    file_name = tmp_path / "test.svg"
+    file_name.write_text(SVG, encoding="utf-8")
+    return str(file_name)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 16, 4096])
+def test_iter_path_data(svg_file, chunk_size):
+    """The path data is found no matter where the file is split into chunks"""
+    data = list(_iter_path_data(svg_file, chunk_size))
+    assert data == ["M 0 0 L 10     0 L 10 10", "M 20,20 Q 25,30 30,20"]
+
+
+def test_iter_svg_paths(svg_file):
+    """Tests that the paths are parsed one at a time"""
+    paths = list(iter_svg_paths(svg_file))
+    assert len(paths) == 2
+    assert [len(path) for path in paths] == [2, 1]
+    assert len(parse_svg(svg_file)) == 2
+
+
+@pytest.mark.parametrize(
+    "path_data, commands, numbers",
+    [
+        ("M 16,-0.034 L 7.1 0.5", "ML", [16, -0.034, 7.1, 0.5]),
+        ("M16-0.034L7.1.5", "ML", [16, -0.034, 7.1, 0.5]),
+        ("m1e-5-2E+3,.5.5z", "mz", [1e-5, -2000, 0.5, 0.5]),
+        ("M0 0a1,1 0 00.5,.5", "Ma", [0, 0, 1, 1, 0, 0, 0, 0.5, 0.5]),
+        ("M0 0 L 1 1 2 2 3 3", "ML", [0, 0, 1, 1, 2, 2, 3, 3]),
+    ],
+)
+def test_lex_path_data(path_data, commands, numbers):
+    """Tests the lexer on different ways of writing path data"""
+    lexed_commands, offsets, lexed_numbers = _lex_path_data(path_data)
+    assert lexed_commands == commands
+    assert list(lexed_numbers) == numbers
+    assert offsets[0] == 0 and offsets[-1] == len(numbers)
+    assert _scan_tokens(path_data) == _tokenize(path_data)
+
+
+def test_lex_path_data_invalid():
+    """Tests that invalid path data is not accepted"""
+    with pytest.raises(ValueError):
+        _lex_path_data("1 2 L 3 4")
+
+    with pytest.raises(ValueError):
+        _lex_path_data("M 1 2 L 3 # 4")
+
+
+@pytest.mark.parametrize(
+    "path_data",
+    [
+        "M 1_000 0",
+        "M inf 0",
+        "M -nan 1",
+        "M 0 0 L infinity 2",
+        "M 0 0 L INF 2",
+        "M 0 \u0661 1",
+        "M 0 1\u0661 1",
+        "M0-\u0661 1",
+        "M 0 0 K 1",
+    ],
+)
+def test_lex_path_data_forbidden_numbers(path_data):
+    """Numbers float accepts but the svg grammar does not, and unknown commands, are not accepted"""
+    with pytest.raises(ValueError):
+        _lex_path_data(path_data)
+
+
+def test_implicit_repetition():
+    """Repeated inputs without a new command letter create new curves"""
+    paths = _commands_to_paths(*_lex_path_data("M0 0 1 1 2 2 Q 3 3 4 4 5 5 6 6"))
+    assert len(paths) == 1
+    assert len(paths[0]) == 4
+
+
+def test_smooth_quadratic_curve():
+    """The control point of a smooth quadratic curve is reflected from the last one"""
+    path = _commands_to_paths(*_lex_path_data("M0 0 Q 1 1 2 0 T 4 0"))[0]
+    assert path[1].points[1] == Point(3, 1)
+
+
+def test_horizontal_and_vertical_lines():
+    """H and V lines keep the other coordinate of the current position"""
+    path = _commands_to_paths(*_lex_path_data("M1 2 H 5 v 3 h -2 V 0"))[0]
+    assert [curve.get_end_pos() for curve in path] == [
+        Point(5, -2),
+        Point(5, -5),
+        Point(3, -5),
+        Point(3, 0),
+    ]
+
+
+def test_relative_moveto():
+    """A relative moveto starts a new subpath relative to the current position"""
+    paths = _commands_to_paths(*_lex_path_data("m1 1 l 1 0 m 2 2 1 0 z m 1 1 l 1 1"))
+    assert [path.start_position for path in paths] == [
+        Point(1, -1),
+        Point(4, -3),
+        Point(5, -4),
+    ]
+    assert [curve.get_end_pos() for curve in paths[1]] == [Point(5, -3), Point(4, -3)]
+
+
+def test_parse_packed_paths(svg_file):
+    """The parser fills packed paths with the same curves"""
+    paths = parse_svg(svg_file)
+    packed_paths = parse_svg(svg_file, PackedPath)
+    assert all(isinstance(path, PackedPath) for path in packed_paths)
+    assert [[curve.points for curve in path] for path in packed_paths] == [
+        [curve.points for curve in path] for path in paths
+    ]
+
+
+def test_parse_drawing(svg_file):
+    """The aggregates of a drawing are computed while it is parsed"""
+    drawing = parse_drawing(svg_file)
+    assert isinstance(drawing, Drawing)
+    assert drawing.name == svg_file
+    assert len(drawing) == drawing.path_count == 2
+    assert drawing.segment_count == 3
+    assert drawing.min_position == Point(0, -25)
+    assert drawing.max_position == Point(30, 0)
+    assert drawing.scale_for(300) == 10
+    assert drawing.length() == sum(path.length() for path in drawing)
+
+    empty = Drawing()
+    assert len(empty) == 0
+    with pytest.raises(ValueError):
+        empty.scale_for(300)
@@ -3,11 +3,12 @@ import math
 from matplotlib.pyplot import plot
 import pytest
 
-from app.svg import Path
+from app.svg import Path, PackedPath
 from app.curves import *
 from app.arc import Arc
 from app.point import Point
 from app.utils import plotting
+from app.utils.curves import make_curve
 
 
 points = [
@@ -50,3 +51,94 @@ def test_path_start_end():
         Arc([Point(110, 215), Point(30, 50), Point(162.55, 162.45)], 0, 1, 0)
     )
     plotting.show()
+
+
+def test_packed_path():
+    connected = [
+        Line(points[:2]),
+        QuadraticCurve(points[1:4]),
+        Arc([points[3], Point(1, 2), points[0]], large_arc=False, sweep=True),
+    ]
+    path = Path.from_curves_list(connected)
+    packed = PackedPath.from_path(path)
+
+    assert len(packed) == len(path)
+    assert packed.start_position == path.start_position
+    assert packed.end_position == path.end_position
+    assert [type(curve) for curve in packed] == [type(curve) for curve in path]
+    assert packed[1].points == path[1].points
+    assert packed[-1].get_pos(0.5) == path[-1].get_pos(0.5)
+    assert math.isclose(packed.length(), path.length())
+    assert packed.last_curve_points() is None
+
+    unpacked = packed.to_path()
+    assert isinstance(unpacked, Path)
+    assert [curve.points for curve in unpacked] == [curve.points for curve in path]
+
+    # The start position of a curve is shared with the end of the path
+    with pytest.raises(ValueError):
+        packed.append(Line(points[1:3]))
+
+    with pytest.raises(IndexError):
+        packed[3]  # pylint: disable=pointless-statement
+
+
+def test_path_bounding_box():
+    path = Path(points[0])
+    assert path.bounding_box == (points[0], points[0])
+
+    # The control point (-1, 2) is outside of the curve
+    path.append_curve([Point(-1, 2), Point(1, 0)])
+    assert path.min_position.x == pytest.approx(-1 / 3)
+    assert path.min_position.y == 0
+    assert path.max_position == Point(1, 1)
+
+    path.append_curve([Point(2, -1)])
+    assert path.min_position.y == -1
+    assert path.max_position == Point(2, 1)
+
+    packed = PackedPath.from_path(path)
+    assert packed.bounding_box == path.bounding_box
+
+
+def test_path_bounding_box_after_changes():
+    """The bounding box follows changes that are not made with append"""
+    path = Path(points[0])
+    path.append_curve([Point(2, -1)])
+    line = make_curve([Point(2, -1), Point(5, 3)])
+
+    path.extend([line])
+    assert path.max_position == Point(5, 3)
+
+    path.pop()
+    assert path.max_position == Point(2, 0)
+
+    path.insert(0, line)
+    assert path.max_position == Point(5, 3)
+
+    path.remove(line)
+    path[0] = make_curve([Point(0, 0), Point(-1, 1)])
+    assert path.bounding_box == (Point(-1, 0), Point(0, 1))
+
+    path += [line]
+    path.append_curve([Point(6, 4)])
+    assert path.bounding_box == (Point(-1, -1), Point(6, 4))
+
+    path[:] = [line]
+    assert path.bounding_box == (Point(2, -1), Point(5, 3))
+
+    del path[0]
+    assert path.bounding_box == (points[0], points[0])
+
+
+def test_path_reversed():
+    path = Path(points[0])
+    path.append_curve(points[1:3])
+    path.append_arc([None, Point(1, 2), points[0]], large_arc=False, sweep=True)
+
+    for original in (path, PackedPath.from_path(path)):
+        reversed_path = original.reversed()
+        assert type(reversed_path) is type(original)
+        assert reversed_path.start_position == original.end_position
+        assert reversed_path.end_position == original.start_position
+        assert math.isclose(reversed_path.length(), original.length())
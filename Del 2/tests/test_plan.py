@@ -0,0 +1,89 @@
+"""Tests for robot.plan and robot.player"""
+import io
+
+import pytest
+
+from app.curves import CubicCurve, Line
+from app.point import Point
+from app.svg import Path
+from robot.robot import Robot
+from robot.plan import (
+    DRIVE,
+    HEADER_SIZE,
+    PEN_DOWN,
+    PEN_UP,
+    RECORD_SIZE,
+    RESET,
+    STOP,
+    TURN,
+    PlanRecorder,
+    read_records,
+)
+from robot.player import Player
+from turtle_sim import HeadlessTurtle
+
+
+def paths():
+    """Returns two paths, a line and a curve that is driven through without stopping"""
+    first = Path()
+    first.append(Line([Point(0, 0), Point(50, 0)]))
+    first.append(
+        CubicCurve([Point(50, 0), Point(80, 0), Point(100, 30), Point(100, 60)])
+    )
+    second = Path()
+    second.append(Line([Point(0, 60), Point(0, 100)]))
+    return [first, second]
+
+
+def compile_paths():
+    """Returns the plan of the paths, compiled to a binary stream"""
+    stream = io.BytesIO()
+    robot = Robot(scale=1, _drive_base=PlanRecorder(stream), _pen_motor=None)
+    for path in paths():
+        robot.drive_through_path(path)
+
+    stream.seek(0)
+    return stream
+
+
+def test_records():
+    """Every command of the robot is written as one record"""
+    stream = compile_paths()
+    size = len(stream.getvalue())
+    records = list(read_records(stream))
+
+    assert size == HEADER_SIZE + len(records) * RECORD_SIZE
+    opcodes = [record[0] for record in records]
+    assert opcodes.count(PEN_DOWN) == opcodes.count(PEN_UP) == 2
+    assert opcodes.count(RESET) == opcodes.count(STOP) == 2
+    assert TURN in opcodes
+
+    drives = [record for record in records if record[0] == DRIVE]
+    assert drives[0][1] == 0
+    assert all(speed > 0 for _, _, speed, _ in drives)
+
+    stops = [record for record in records if record[0] == STOP]
+    assert stops[1][1] == pytest.approx(40)
+
+
+def test_not_a_plan():
+    """Reading a file that is not a plan raises a ValueError"""
+    with pytest.raises(ValueError):
+        list(read_records(io.BytesIO(b"<svg></svg>")))
+
+
+def test_play_matches_robot():
+    """Playing a plan drives the same way as the robot that compiled it"""
+    expected = HeadlessTurtle()
+    robot = Robot(scale=1, _drive_base=expected, _pen_motor=None)
+    for path in paths():
+        robot.drive_through_path(path)
+
+    played = HeadlessTurtle()
+    Player(played, None).play(compile_paths())
+
+    assert played.stroke_count == expected.stroke_count == 2
+    assert played.samples == expected.samples
+    assert played.x == pytest.approx(expected.x, abs=0.01)
+    assert played.y == pytest.approx(expected.y, abs=0.01)
+    assert played.heading == pytest.approx(expected.heading, abs=0.01)
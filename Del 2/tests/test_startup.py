@@ -0,0 +1,17 @@
+"""Tests for bench.startup"""
+import pytest
+
+from bench.startup import COMMANDS, FORBIDDEN, forbidden_imports, measure
+
+
+@pytest.mark.parametrize("command", sorted(FORBIDDEN))
+def test_forbidden_imports(command):
+    """The commands do not import the packages they must not import"""
+    times = measure(COMMANDS[command], repeats=1)
+    assert times
+    assert not forbidden_imports(command, times)
+
+
+def test_main_imports_nothing():
+    """Importing main.py only imports main.py"""
+    assert [module for module, _, _ in measure("import main", repeats=1)] == ["main"]
@@ -0,0 +1,34 @@
+"""Tests for bench.suite"""
+from bench.suite import THRESHOLD, regressions
+
+
+def suite_results(calibration, **times):
+    """Returns suite results with the fastest run of every benchmark"""
+    benchmarks = {"calibration": {"min": calibration}}
+    for name, time in times.items():
+        benchmarks[name] = {"min": time}
+
+    return {"benchmarks": benchmarks}
+
+
+def test_regressions_are_relative_to_calibration():
+    """A computer twice as slow is not a regression"""
+    baseline = suite_results(1, parse=2, lut=3)
+    assert not regressions(suite_results(2, parse=4, lut=6), baseline)
+    assert not regressions(suite_results(0.5, parse=1, lut=1.5), baseline)
+
+
+def test_regressions_threshold():
+    """Only benchmarks more than threshold times slower than the baseline regress"""
+    baseline = suite_results(1, parse=2, lut=3)
+    results = suite_results(2, parse=4 * THRESHOLD, lut=6 * THRESHOLD + 1)
+    assert regressions(results, baseline) == [("lut", 3 * THRESHOLD + 0.5, 3)]
+
+    baseline["threshold"] = 5
+    assert not regressions(results, baseline)
+
+
+def test_regressions_new_benchmarks():
+    """Benchmarks that are not in the baseline do not regress"""
+    baseline = suite_results(1, parse=2)
+    assert not regressions(suite_results(1, parse=2, lut=100), baseline)
@@ -0,0 +1,68 @@
+"""Tests for bench.synthetic"""
+import pytest
+
+from app.svg.parsing import _lex_path_data, iter_svg_paths, parse_drawing
+from bench.synthetic import FORMATS, PathDataGenerator, write_svg
+
+
+def test_path_data_is_reproducible():
+    """The same seed gives the same path data, and another seed does not"""
+    assert PathDataGenerator(3).path_data(200) == PathDataGenerator(3).path_data(200)
+    assert PathDataGenerator(3).path_data(200) != PathDataGenerator(4).path_data(200)
+
+
+@pytest.mark.parametrize("number_format", FORMATS)
+def test_number_formats(number_format):
+    """Every number format is parsed to the same numbers (for absolute commands)"""
+    data = PathDataGenerator(formats=(number_format,), relative=0).path_data(100)
+    reference = PathDataGenerator(formats=("fixed",), relative=0).path_data(100)
+
+    commands, _, numbers = _lex_path_data(data)
+    reference_commands, _, reference_numbers = _lex_path_data(reference)
+    assert commands == reference_commands
+    assert list(numbers) == list(reference_numbers)
+
+
+def test_written_segments(tmp_path):
+    """The written file draws the number of segments asked for"""
+    file_name = str(tmp_path / "synthetic.svg")
+    write_svg(file_name, 1000, paths=7, seed=1)
+
+    drawing = parse_drawing(file_name)
+    assert drawing.segment_count == 1000
+    assert drawing.path_count >= 7
+
+
+def test_same_drawing_in_every_form(tmp_path):
+    """Relative commands, implicit commands and number formats give the same curves"""
+    positions = []
+    for options in (
+        {"relative": 0, "implicit": 0, "formats": ("fixed",)},
+        {"relative": 1, "implicit": 1, "formats": ("compact",)},
+        {"relative": 0.5, "implicit": 0.5},
+    ):
+        file_name = str(tmp_path / "synthetic.svg")
+        write_svg(file_name, 500, paths=5, seed=2, **options)
+        positions.append(
+            [
+                curve.get_end_pos()
+                for path in iter_svg_paths(file_name)
+                for curve in path
+            ]
+        )
+
+    for other in positions[1:]:
+        assert len(other) == len(positions[0])
+        assert all(
+            abs(a.x - b.x) < 1e-6 and abs(a.y - b.y) < 1e-6
+            for a, b in zip(positions[0], other)
+        )
+
+
+def test_invalid_options():
+    """A mix without drawing commands or an unknown number format is not accepted"""
+    with pytest.raises(ValueError):
+        PathDataGenerator(mix={"M": 1, "Z": 1})
+
+    with pytest.raises(ValueError):
+        PathDataGenerator(formats=("hex",))
@@ -0,0 +1,62 @@
+"""Tests for app.utils.timing"""
+import io
+
+from app.utils.logging import Logger
+from app.utils.timing import BUCKETS, TimerRegistry, TimerStats
+
+
+def test_timer_stats():
+    """The statistics and the histogram are updated for every duration"""
+    stats = TimerStats("test")
+    for duration in (0, 1, 3, 3, 100, 10 ** 9):
+        stats.add(duration)
+
+    assert stats.count == 6
+    assert stats.total == 107 + 10 ** 9
+    assert stats.min == 0 and stats.max == 10 ** 9
+    assert len(stats.buckets) == BUCKETS
+    assert stats.buckets[:3] == [1, 1, 2]
+    assert stats.buckets[7] == 1 and stats.buckets[-1] == 1
+    assert stats.percentile(0.5) == 4
+    assert stats.percentile(1) == 10 ** 9
+
+
+def test_timed_functions():
+    """Every call of a timed function is counted, and reset keeps the timers"""
+    timers = TimerRegistry()
+
+    @timers.timed()
+    def square(value):
+        return value * value
+
+    assert [square(value) for value in range(10)] == [value ** 2 for value in range(10)]
+    timers.record("other", 5)
+    assert timers.stats["square"].count == 10
+    assert timers.stats["other"].total == 5
+
+    lines = timers.summary()
+    assert len(lines) == 3
+    assert lines[1].split()[:2] == ["square", "10"]
+
+    timers.reset()
+    square(2)
+    assert timers.stats["square"].count == 1
+
+
+def test_aggregated_logger_timers():
+    """Aggregated timers log a summary on demand instead of a line per call"""
+    stream = io.StringIO()
+    logger = Logger("TEST", {stream: Logger.DEBUG}, log_format="%(message)s")
+
+    @logger.time(aggregate=True)
+    def add(first, second):
+        return first + second
+
+    assert sum(add(value, 1) for value in range(1000)) == 500500
+    logger.flush()
+    assert stream.getvalue() == ""
+
+    logger.log_timers()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[1].split()[:2] == ["add", "1000"]
@@ -0,0 +1,63 @@
+"""Tests for robot.tracer"""
+import pytest
+
+from app.curves import Line
+from app.point import Point
+from app.svg import Path
+from robot.robot import Robot
+from robot.tracer import Tracer
+from robot.tracer import FIELDS, loop_statistics, read_trace
+from turtle_sim import HeadlessTurtle
+
+
+def test_ring_buffer():
+    """Only the last capacity iterations are kept, oldest first"""
+    ticks = iter(range(0, 1000, 10))
+    tracer = Tracer(capacity=4, clock=lambda: next(ticks))
+    tracer.start(100)
+    for i in range(6):
+        tracer.record(i, i, 50, 0)
+
+    rows = list(tracer.rows())
+    assert len(rows) == tracer.count == 4
+    assert [row[2] for row in rows] == [2, 3, 4, 5]
+    assert all(row[0] == 10 for row in rows)
+
+
+@pytest.mark.parametrize("file_name", ["trace.bin", "trace.csv"])
+def test_dump_and_read(tmp_path, file_name):
+    """A dumped trace is read back with the same rows"""
+    tracer = Tracer(capacity=8)
+    tracer.begin([1, 2])
+    tracer.start(3)
+    for distance in (0.5, 1.5, 2.5):
+        tracer.record(distance, 0, 50, 12.5)
+
+    file_name = str(tmp_path / file_name)
+    tracer.dump(file_name)
+    rows = read_trace(file_name)
+
+    assert len(rows) == 3 and len(rows[0]) == len(FIELDS)
+    assert [row[1] for row in rows] == [0, 1, 1]
+    assert [row[3] for row in rows] == pytest.approx([0.5, 1.5, 2.5])
+    assert [row[5] for row in rows] == pytest.approx([12.5] * 3)
+
+
+def test_robot_loop_statistics():
+    """The drive loop is traced for every curve driven through without stopping"""
+    drive_base = HeadlessTurtle(sampling_freq=250)
+    tracer = Tracer(clock=lambda: round(drive_base.time * 1e6))
+    robot = Robot(scale=1, _drive_base=drive_base, _pen_motor=None, tracer=tracer)
+
+    path = Path()
+    path.append(Line([Point(0, 0), Point(50, 0)]))
+    path.append(Line([Point(50, 0), Point(100, 0)]))
+    robot.drive_through_path(path)
+
+    statistics = loop_statistics(tracer.rows())
+    assert [stats["curve"] for stats in statistics] == [0, 1]
+    assert sum(stats["iterations"] for stats in statistics) == tracer.count
+    for stats in statistics:
+        assert stats["p50_hz"] == pytest.approx(250)
+        assert stats["jitter_us"] < 1
+        assert stats["distance"] == pytest.approx(50, abs=1)
@@ -0,0 +1,59 @@
+"""Tests for app.planning.travel"""
+import random
+
+from app.planning import optimize_travel, travel_distance
+from app.point import Point
+from app.svg import Path
+
+
+def make_line(start, end):
+    """Returns a path with a single line"""
+    path = Path(start)
+    path.append_curve([end])
+    return path
+
+
+def end_points(path):
+    """Returns the ends of a path in the same order no matter its direction"""
+    return sorted(
+        [
+            (path.start_position.x, path.start_position.y),
+            (path.end_position.x, path.end_position.y),
+        ]
+    )
+
+
+def test_travel_distance():
+    paths = [make_line(Point(1, 0), Point(2, 0)), make_line(Point(2, 3), Point(0, 0))]
+    assert travel_distance(paths) == 1 + 3
+    assert travel_distance([]) == 0
+
+
+def test_optimize_travel_reverses_paths():
+    """The paths are reordered and reversed to start at the closest end"""
+    paths = [
+        make_line(Point(10, 0), Point(11, 0)),
+        make_line(Point(2, 0), Point(1, 0)),
+    ]
+    optimized = optimize_travel(paths)
+
+    assert [path.start_position for path in optimized] == [Point(1, 0), Point(10, 0)]
+    assert travel_distance(optimized) == 1 + 8
+
+    # Without reversing, the paths can only be reordered
+    optimized = optimize_travel(paths, allow_reverse=False)
+    assert optimized[0] is paths[1] and optimized[1] is paths[0]
+
+
+def test_optimize_travel_many_paths():
+    """Every path is drawn once, and the travel is shorter than in file order"""
+    rng = random.Random(1)
+    paths = []
+    for _ in range(500):
+        start = Point(rng.uniform(0, 100), rng.uniform(0, 100))
+        paths.append(make_line(start, start + Point(rng.uniform(-1, 1), 1)))
+
+    optimized = optimize_travel(paths, Point(0, 0))
+    assert len(optimized) == len(paths)
+    assert sorted(map(end_points, optimized)) == sorted(map(end_points, paths))
+    assert travel_distance(optimized) < travel_distance(paths) / 5
@@ -0,0 +1,65 @@
+"""Tests for app.planning.velocity"""
+import math
+import pytest
+
+from app.arc import Arc
+from app.curves import Line
+from app.planning.motion import join_schedules, plan_curve
+from app.planning.velocity import driving_time, plan_velocity
+from app.point import Point
+
+LIMITS = {
+    "max_speed": 200,
+    "min_speed": 20,
+    "acceleration": 100,
+    "lateral_acceleration": 50,
+    "jerk": 500,
+}
+
+
+def turned_angle(schedule):
+    """Returns the total angle (in degrees) turned when following a schedule"""
+    return sum(
+        turn_rate * (end - start) / speed
+        for start, end, speed, turn_rate in schedule.parts()
+    )
+
+
+def test_straight_line():
+    """The robot speeds up from and slows down to the min speed on a line"""
+    schedule = plan_curve(Line([Point(0, 0), Point(1000, 0)]), scale=1, speed=50)
+    profile = plan_velocity(schedule, **LIMITS)
+
+    speeds = list(profile.speeds)
+    assert speeds[0] == LIMITS["min_speed"]
+    assert max(speeds) == LIMITS["max_speed"]
+    assert speeds[-1] < 50
+    assert profile.length == schedule.length
+    assert driving_time(profile) < driving_time(schedule)
+
+    # The acceleration limit holds between every part
+    for (start, end, speed, _), next_speed in zip(profile.parts(), speeds[1:]):
+        assert abs(next_speed ** 2 - speed ** 2) <= 2 * LIMITS["acceleration"] * (
+            end - start
+        ) * (1 + 1e-9)
+
+
+def test_tight_curve():
+    """The speed in a curve is limited by the lateral acceleration"""
+    radius = 10
+    line = Line([Point(-500, radius), Point(0, radius)])
+    arc = Arc([Point(0, radius), Point(radius, radius), Point(0, -radius)], 0, 0)
+    schedule = join_schedules(
+        [plan_curve(curve, scale=1, speed=50) for curve in (line, arc)]
+    )
+    profile = plan_velocity(schedule, **LIMITS)
+
+    limit = math.sqrt(LIMITS["lateral_acceleration"] * radius)
+    assert profile.get_speed(schedule.length - 1) == pytest.approx(limit)
+    assert profile.get_speed(250) > limit
+    assert turned_angle(profile) == pytest.approx(turned_angle(schedule))
+
+
+def test_empty_schedule():
+    schedule = plan_curve(Line([Point(0, 0), Point(0, 0)]), scale=1, speed=50)
+    assert plan_velocity(schedule, **LIMITS) is schedule
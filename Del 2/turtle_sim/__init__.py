@@ -1,2 +1,5 @@
 """Easier import for Turtle class"""
 from turtle_sim.turtle import Turtle
+from turtle_sim.headless import HeadlessTurtle
+from turtle_sim.events import EventTurtle
+from turtle_sim.simulation import drawing_robot, simulate_drawing
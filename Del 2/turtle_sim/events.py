@@ -0,0 +1,164 @@
+"""Holds the EventTurtle class"""
+import math
+import random
+
+import numpy as np
+
+from turtle_sim.headless import CAPACITY, HeadlessTurtle
+
+
+class EventTurtle(HeadlessTurtle):  # pylint: disable=too-many-instance-attributes
+    """
+    Simulates an ev3 drivebase's movement like HeadlessTurtle, but jumps from one
+    control event to the next instead of driving one sample at a time.
+
+    A speed and a turn rate describe a circular arc, so the pose after any number of
+    samples is found in closed form. When the robot has told the turtle where the
+    next parts of its schedule start (see expect), every call to distance drives to
+    the first sample at or past the start of the next part, which is the sample
+    where the robot would have given a new command anyway.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sampling_freq=250,
+        position=(0, 0),
+        heading=0,
+        capacity=CAPACITY,
+        latency=0,
+        speed_noise=0,
+        turn_noise=0,
+        trace_step=1,
+        seed=None,
+    ):
+        """Initiates a new EventTurtle instance.
+
+        latency is the time (in s) it takes before a new command is used, the
+        previous command is used until then.
+        speed_noise is the standard deviation of the relative error of the speed,
+        and turn_noise the standard deviation of the error of the turn rate
+        (in deg/s), drawn for every command.
+        trace_step is the distance (in mm) between the positions recorded in the
+        trace along an arc.
+        seed is used to make the noise reproducible.
+        """
+        super().__init__(sampling_freq, position, heading, capacity)
+        self.latency = latency
+        self.speed_noise = speed_noise
+        self.turn_noise = turn_noise
+        self.trace_step = trace_step
+        self.random = random.Random(seed)
+
+        # Driven distances where the robot gives new commands (see expect)
+        self.events = None
+        self.event_index = 0
+        self.events_length = 0
+
+    def expect(self, distances, length):
+        """
+        Tells the turtle the driven distances where the robot changes commands,
+        and the distance where it stops. Forgotten when the turtle is reset.
+        """
+        self.events = distances
+        self.event_index = 0
+        self.events_length = length
+
+    def reset(self):
+        """Resets the driven distance."""
+        super().reset()
+        self.events = None
+
+    def drive(self, speed, turnrate):
+        """
+        Starts driving with the given speed and turnrate (after the latency).
+        The turtle keeps driving until stop is called.
+        """
+        if self.latency and self.speed:
+            self.advance(self.latency)
+
+        if self.speed_noise:
+            speed *= 1 + self.random.gauss(0, self.speed_noise)
+        if self.turn_noise:
+            turnrate += self.random.gauss(0, self.turn_noise)
+
+        super().drive(speed, turnrate)
+
+    def stop(self):
+        """Stops the turtle (after the latency)"""
+        if self.latency and self.speed:
+            self.advance(self.latency)
+
+        super().stop()
+
+    def distance(self):
+        """
+        Retuns the driven distance since last self.reset.
+
+        Drives to the first sample at or past the next expected event, or one sample
+        if no events are expected.
+        """
+        if not self.speed:
+            return self.distance_traveled
+
+        step = self.speed / self.sampling_freq
+        if self.events is None or step <= 0:
+            self.step()
+            return self.distance_traveled
+
+        while (
+            self.event_index < len(self.events)
+            and self.events[self.event_index] <= self.distance_traveled
+        ):
+            self.event_index += 1
+
+        if self.event_index < len(self.events):
+            target = self.events[self.event_index]
+        else:
+            target = self.events_length
+
+        samples = max(int(math.ceil((target - self.distance_traveled) / step)), 1)
+        while self.distance_traveled + samples * step < target:
+            samples += 1
+
+        self.advance(samples / self.sampling_freq)
+        return self.distance_traveled
+
+    def advance(self, duration):
+        """Drives duration seconds with the current speed and turn rate"""
+        distance = self.speed * duration
+        angle = math.radians(self.turnrate * duration)
+
+        if self.pen_down and distance > self.trace_step:
+            self.record_arc(distance, angle, duration)
+
+        self.time += duration
+        self.move(distance, angle)
+        self.distance_traveled += distance
+
+    def record_arc(self, distance, angle, duration):
+        """
+        Adds positions every trace_step mm along the arc that is about to be driven
+        to the trace (not including the end of the arc).
+        """
+        lengths = np.arange(1, math.ceil(distance / self.trace_step)) * self.trace_step
+        heading = math.radians(self.heading)
+
+        start = self.samples
+        end = start + len(lengths)
+        self.reserve(len(lengths))
+        if angle != 0:
+            curvature = angle / distance
+            angles = heading + curvature * lengths
+            self.xs[start:end] = (
+                self.x + (np.sin(angles) - math.sin(heading)) / curvature
+            )
+            self.ys[start:end] = (
+                self.y - (np.cos(angles) - math.cos(heading)) / curvature
+            )
+        else:
+            self.xs[start:end] = self.x + lengths * math.cos(heading)
+            self.ys[start:end] = self.y + lengths * math.sin(heading)
+
+        self.times[start:end] = self.time + duration * lengths / distance
+        self.strokes[start:end] = self.stroke_count - 1
+        self.samples = end
@@ -0,0 +1,152 @@
+"""Holds the HeadlessTurtle class"""
+import math
+
+import numpy as np
+
+# Number of samples the trace buffers are allocated for at first
+CAPACITY = 1 << 16
+
+
+class HeadlessTurtle:  # pylint: disable=too-many-instance-attributes
+    """
+    Simulates an ev3 drivebase's movement without a window (see Turtle).
+
+    The pose of the robot is integrated by the class itself, and every position
+    driven with the pen lowered is recorded in the trace buffers (numpy arrays).
+    """
+
+    def __init__(
+        self, sampling_freq=250, position=(0, 0), heading=0, capacity=CAPACITY
+    ):
+        """Initiates a new HeadlessTurtle instance.
+
+        sampling_freq is how many times per simulated second the position is updated.
+        position (in mm) and heading (in degrees) is the pose the robot starts in.
+        capacity is the number of samples the trace buffers are allocated for at
+        first. They are grown when they are full.
+        """
+        self.sampling_freq = sampling_freq
+        self.x, self.y = position
+        self.heading = heading
+
+        self.distance_traveled = 0
+        self.speed = 0
+        self.turnrate = 0
+        self.time = 0
+        self.pen_down = False
+
+        # Trace buffers, the first self.samples elements are used
+        self.times = np.empty(capacity)
+        self.xs = np.empty(capacity)
+        self.ys = np.empty(capacity)
+        self.strokes = np.empty(capacity, dtype=np.int32)
+        self.samples = 0
+        self.stroke_count = 0
+
+    def drive(self, speed, turnrate):
+        """
+        Starts driving with the given speed and turnrate.
+        The turtle keeps driving until stop is called.
+        """
+        self.speed = speed
+        self.turnrate = turnrate
+
+    def step(self):
+        """Drives one sample (1 / sampling_freq seconds) with the current speed"""
+        delta_pos = self.speed / self.sampling_freq
+        delta_angle = math.radians(self.turnrate / self.sampling_freq)
+        self.time += 1 / self.sampling_freq
+        self.move(delta_pos, delta_angle)
+
+        self.distance_traveled += delta_pos
+
+    def move(self, distance, angle):
+        """
+        Moves along a circular arc of the given length (in mm) that turns the given
+        angle (in radians), and records the new position if the pen is lowered.
+        """
+        # The chord of the arc points halfway between the start and end heading
+        chord = distance
+        if angle != 0:
+            chord = distance * math.sin(angle / 2) / (angle / 2)
+
+        heading = math.radians(self.heading) + angle / 2
+        self.x += chord * math.cos(heading)
+        self.y += chord * math.sin(heading)
+        self.heading += math.degrees(angle)
+
+        if self.pen_down:
+            self.record()
+
+    def reserve(self, count):
+        """Grows the trace buffers if there is no room for count more samples"""
+        if self.samples + count > len(self.xs):
+            size = max(2 * len(self.xs), self.samples + count)
+            self.times = np.resize(self.times, size)
+            self.xs = np.resize(self.xs, size)
+            self.ys = np.resize(self.ys, size)
+            self.strokes = np.resize(self.strokes, size)
+
+    def record(self):
+        """Adds the current position to the trace"""
+        self.reserve(1)
+        self.times[self.samples] = self.time
+        self.xs[self.samples] = self.x
+        self.ys[self.samples] = self.y
+        self.strokes[self.samples] = self.stroke_count - 1
+        self.samples += 1
+
+    def turn(self, angle):
+        """Turns the to the left the amount (in deg) given."""
+        self.heading += angle
+
+    def straight(self, distance):
+        """Drives straight for the distane given."""
+        self.move(distance, 0)
+
+    def distance(self):
+        """
+        Retuns the driven distance since last self.reset.
+        Every call is one sample of the simulation, so the turtle drives one step.
+        """
+        if self.speed:
+            self.step()
+
+        return self.distance_traveled
+
+    def stop(self):
+        """Stops the turtle"""
+        self.speed = 0
+        self.turnrate = 0
+
+    def reset(self):
+        """Resets the driven distance."""
+        self.distance_traveled = 0
+
+    def pendown(self):
+        """The path driven now is recorded in the trace as a new stroke"""
+        if not self.pen_down:
+            self.pen_down = True
+            self.stroke_count += 1
+            self.record()
+
+    def penup(self):
+        """The path driven now is not recorded"""
+        self.pen_down = False
+
+    def trace(self):
+        """
+        Returns the times (in s), x and y coordinates (in mm) and stroke index of
+        every recorded sample.
+        """
+        return (
+            self.times[: self.samples],
+            self.xs[: self.samples],
+            self.ys[: self.samples],
+            self.strokes[: self.samples],
+        )
+
+    def save(self, file_name):
+        """Writes the trace to a .npz file (see numpy.savez)"""
+        times, xs, ys, strokes = self.trace()
+        np.savez(file_name, time=times, x=xs, y=ys, stroke=strokes)
@@ -0,0 +1,38 @@
+"""Functions used to simulate how the robot draws a drawing"""
+from robot.robot import Robot
+from robot.config import DRAWING_LEN
+from turtle_sim.events import EventTurtle
+
+
+def drawing_robot(drawing, drive_base, robot_class=Robot):
+    """
+    Returns a robot (without a pen motor) that draws the drawing scaled to
+    DRAWING_LEN with the drive base, starting at the min position of the drawing
+    """
+    return robot_class(
+        scale=drawing.scale_for(DRAWING_LEN),
+        start_pos=drawing.min_position,
+        _drive_base=drive_base,
+        _pen_motor=None,
+    )
+
+
+def simulate_drawing(
+    drawing, paths=None, robot_class=Robot, drive_base_class=EventTurtle, **kwargs
+):
+    """
+    Draws the paths (all paths of the drawing by default) with a robot and a
+    simulated drive base, and returns the drive base.
+
+    The drawing is scaled to DRAWING_LEN, and the drive base starts at the min
+    position of the drawing (in mm), so the trace is in the same coordinates as
+    the paths times the scale. kwargs are passed on to drive_base_class.
+    """
+    start = drawing.min_position * drawing.scale_for(DRAWING_LEN)
+    drive_base = drive_base_class(position=(start.x, start.y), **kwargs)
+    robot = drawing_robot(drawing, drive_base, robot_class)
+
+    for path in drawing if paths is None else paths:
+        robot.drive_through_path(path, drawing=True)
+
+    return drive_base
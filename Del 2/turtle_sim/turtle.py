@@ -1,10 +1,15 @@
 """Holds the Turtle class"""
+import math
 import turtle
 from robot.config import DRAWING_LEN
+from turtle_sim.headless import HeadlessTurtle
 
 
-class Turtle:
-    """The turtle object is used to simulate a ev3 drivebase's movement"""
+class Turtle(HeadlessTurtle):  # pylint: disable=too-many-instance-attributes
+    """
+    The turtle object is used to simulate a ev3 drivebase's movement,
+    and draws it in a window
+    """
 
     def __init__(self, sampling_freq=250, update_freq=10):
         """Initiates a new Turtle instance.
@@ -12,53 +17,39 @@ class Turtle:
         sampling_freq is how many times per simulated second the position is updated.
         update_freq is how many position updates it takes before the image is refreshed
         """
+        super().__init__(sampling_freq)
 
         self.turtle = turtle.Turtle()
         self.screen = turtle.Screen()
 
         self.screen.setworldcoordinates(0, 0, DRAWING_LEN, DRAWING_LEN)
-        self.distance_traveled = 0
         self.updates = 0
         self.update_freq = update_freq
-        self.sampling_freq = sampling_freq
 
-    def drive(self, speed, turnrate):
-        """Drives one step with the given speed and turnrate."""
-        delta_pos = speed / self.sampling_freq
-        delta_angle = turnrate / self.sampling_freq
-        self.turtle.forward(delta_pos)
-        self.turtle.left(delta_angle)
-
-        self.distance_traveled += delta_pos
+    def move(self, distance, angle):
+        super().move(distance, angle)
+        self.turtle.forward(distance)
+        self.turtle.left(math.degrees(angle))
 
     def turn(self, angle):
         """Turns the to the left the amount (in deg) given."""
         self.screen.update()
         self.screen.tracer(self.update_freq)
+        super().turn(angle)
         self.turtle.left(angle)
 
     def straight(self, distance):
         """Drives straight for the distane given."""
         self.screen.update()
         self.screen.tracer(self.update_freq)
-        self.turtle.forward(distance)
-
-    def distance(self):
-        """Retuns the driven distance since last self.reset"""
-        return self.distance_traveled
-
-    def stop(self):  # pylint: disable=no-self-use
-        """Stops the turtle (dosnt't actually do anything)"""
-        return
-
-    def reset(self):
-        """Resets the driven distance."""
-        self.distance_traveled = 0
+        super().straight(distance)
 
     def pendown(self):
         """The path driven now paints a line"""
+        super().pendown()
         self.turtle.pendown()
 
     def penup(self):
         """The path driven now does not paint a line"""
+        super().penup()
         self.turtle.penup()